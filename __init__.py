@@ -5,4 +5,162 @@ rigify_info = {
         "A series of rig additions as a feature set of the Rigify Extension for Blender.",
     "link": "https://6bird.studio",
     "blender": (4, 4, 0),
+    # Manifest of the rig types, read by the rig modules Rigify scans so that the full
+    # implementation in rigs/6_Bird_Tools/<module>.py is only imported once it is needed.
+    "rig_types": {
+        "slider": {
+            "module": "_slider",
+            "description": "A rig that generates a slider from a target bone.",
+            "parameters": ("value_scale", "shared_widgets", "shape_key_targets", "slider_bank"),
+        },
+        "slider_pad": {
+            "module": "_slider_pad",
+            "description": "A rig that generates a slider pad from a target bone.",
+            "parameters": ("value_scale", "shared_widgets", "shape_key_targets",
+                           "pad_corner_weights", "pad_polar_outputs"),
+        },
+        "switch": {
+            "module": "_switch",
+            "description": "A rig that generates a switch from a target bone.",
+            "parameters": ("switch_mode", "shared_widgets", "switch_playback_guard"),
+        },
+        "custom_text_widget": {
+            "module": "_custom_text_widget",
+            "description": "A rig that generates a widget based on text.",
+            "parameters": ("text_input", "text_align_x", "text_align_y", "text_size", "text_extrude",
+                           "text_glyph_cache", "text_outline", "text_resolution", "text_max_vertices",
+                           "text_vertex_count"),
+        },
+    },
+    # Rig parameters as (property type, property options), shared by every rig type using them
+    "rig_parameters": {
+        "value_scale": ('FLOAT', {
+            "name": "Value Scale",
+            "default": 1,
+            "description": "Multiplies the range by integer value.",
+        }),
+        "shared_widgets": ('BOOL', {
+            "name": "Shared Widgets",
+            "default": False,
+            "description": "Use one box and one knob mesh for all controls, shaped by the custom shape transform.",
+        }),
+        "shape_key_targets": ('STRING', {
+            "name": "Shape Key Targets",
+            "default": '',
+            "description": "Shape keys driven directly by the controls, as Object:Key[@output][=low,high] "
+                           "separated by ';'. The outputs are X and Y for a slider pad and 0, 1, ... for the "
+                           "sliders of a bank.",
+        }),
+        "slider_bank": ('BOOL', {
+            "name": "Slider Bank",
+            "default": False,
+            "description": "Make a slider from every bone of the connected chain instead of only the first one.",
+        }),
+        "pad_corner_weights": ('BOOL', {
+            "name": "Corner Weights",
+            "default": False,
+            "description": "Add corner_up_left, corner_up_right, corner_down_left and corner_down_right "
+                           "properties that grow from 0 at the center to 1 at their corner.",
+        }),
+        "pad_polar_outputs": ('BOOL', {
+            "name": "Radial and Angle",
+            "default": False,
+            "description": "Add a radius property, the distance from the center clamped to 1, and an angle "
+                           "property in radians counterclockwise from the right.",
+        }),
+        "switch_mode": ('ENUM', {
+            "name": "Switch Mode",
+            "description": "How the switch state is changed.",
+            "items": [
+                ('SELECT', 'Select', 'Click the on/off bones to toggle, needs the rig UI script'),
+                ('BONE', 'Bone', 'Slide a single control bone, evaluated without Python'),
+            ],
+            "default": 'SELECT',
+        }),
+        "switch_playback_guard": ('BOOL', {
+            "name": "Pause During Playback",
+            "default": False,
+            "description": "Detach the selection handler of the rig while playing animation or rendering, "
+                           "and attach it again afterwards.",
+        }),
+        "text_input": ('STRING', {
+            "name": "Widget String",
+            "default": '',
+            "description": "Text to transform into widget.",
+        }),
+        "text_align_x": ('ENUM', {
+            "name": "Align X",
+            "description": "Select one of the options",
+            "items": [
+                ('LEFT', 'Left', ''),
+                ('CENTER', 'Center', ''),
+                ('RIGHT', 'Right', ''),
+                ('JUSTIFY', 'Justify', ''),
+                ('FLUSH', 'Flush', ''),
+            ],
+            "default": 'CENTER',
+        }),
+        "text_align_y": ('ENUM', {
+            "name": "Align Y",
+            "description": "Select one of the options",
+            "items": [
+                ('TOP', 'Top', ''),
+                ('TOP_BASELINE', 'Top Baseline', ''),
+                ('CENTER', 'Center', ''),
+                ('BOTTOM_BASELINE', 'Bottom Baseline', ''),
+                ('BOTTOM', 'Bottom', ''),
+            ],
+            "default": 'CENTER',
+        }),
+        "text_size": ('FLOAT', {
+            "name": "Text Size",
+            "default": 1.0,
+            "description": "Float Value.",
+        }),
+        "text_extrude": ('FLOAT', {
+            "name": "Extrude",
+            "default": 0.0,
+            "description": "Float Value.",
+        }),
+        "text_glyph_cache": ('BOOL', {
+            "name": "Glyph Cache",
+            "default": False,
+            "description": "Assemble flat text from glyph outlines cached on disk instead of tessellating it. "
+                           "Ignores kerning.",
+        }),
+        "text_outline": ('BOOL', {
+            "name": "Outline Only",
+            "default": False,
+            "description": "Use only the outline of the letters as the widget.",
+        }),
+        "text_resolution": ('INT', {
+            "name": "Resolution",
+            "default": 12,
+            "min": 1,
+            "max": 64,
+            "description": "Curve resolution used to tessellate the letters.",
+        }),
+        "text_max_vertices": ('INT', {
+            "name": "Max Vertices",
+            "default": 0,
+            "min": 0,
+            "description": "Simplify the outline to at most this many vertices. 0 means no limit.",
+        }),
+        "text_vertex_count": ('INT', {
+            "name": "Vertex Count",
+            "default": 0,
+            "derived": True,
+            "description": "Vertex count of the widget from the last generation.",
+        }),
+    },
 }
+
+from . import ui
+
+
+def register():
+    ui.register()
+
+
+def unregister():
+    ui.unregister()
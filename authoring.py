@@ -0,0 +1,345 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import csv
+import json
+import math
+import os
+import numpy as np
+
+from . import rigify_info
+from .validation import RIG_TYPE_PREFIX
+
+SPEC_VERSION = 1
+
+# Columns of a CSV spec before the parameter columns, empty parameter cells keep the default
+CSV_COLUMNS = ('name', 'type', 'head_x', 'head_y', 'head_z', 'tail_x', 'tail_y', 'tail_z',
+               'roll', 'parent', 'connect')
+
+# Blender deletes shorter bones when leaving edit mode
+MIN_BONE_LENGTH = 1e-6
+
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+# Python types a spec value of each property type can have, and how to describe them
+PARAMETER_TYPES = {
+    'BOOL': ((bool,), "true or false"),
+    'INT': ((int,), "a whole number"),
+    'FLOAT': ((int, float), "a number"),
+    'STRING': ((str,), "text"),
+}
+
+
+def rig_parameters(rig_type, derived=False):
+    """
+    Parameter definitions of a 6 Bird rig type by name, from the manifest.
+    Derived parameters are written by generation and left out of specs unless asked for.
+    """
+    names = rigify_info["rig_types"][rig_type]["parameters"]
+    definitions = {name: rigify_info["rig_parameters"][name] for name in names}
+    return {name: (prop_type, options) for name, (prop_type, options) in definitions.items()
+            if derived or not options.get('derived')}
+
+
+def full_rig_type(spec_type):
+    """6 Bird rig types are written without the feature set prefix, other Rigify types in full."""
+    if spec_type in rigify_info["rig_types"]:
+        return RIG_TYPE_PREFIX + spec_type
+    return spec_type
+
+
+def spec_rig_type(rigify_type):
+    if rigify_type.startswith(RIG_TYPE_PREFIX):
+        return rigify_type[len(RIG_TYPE_PREFIX):]
+    return rigify_type
+
+
+def parse_value(prop_type, text):
+    if prop_type == 'BOOL':
+        return text.strip().lower() in TRUE_VALUES
+    if prop_type == 'INT':
+        return int(text)
+    if prop_type == 'FLOAT':
+        return float(text)
+    return text
+
+
+def parse_coordinate(text):
+    return float(text) if text and text.strip() else None
+
+
+def short_float(value):
+    """Shortest decimal that reads back as the same single precision float, 0.1 rather than 0.10000000149."""
+    return float(str(np.float32(value)))
+
+
+##############################
+# Reading and writing specs
+
+def controls_from_csv(rows):
+    controls = []
+    for row in rows:
+        control = {
+            'name': row.get('name') or "",
+            'type': row.get('type') or "",
+            # Blank cells are left as None for check_controls() to report
+            'head': [parse_coordinate(row.get(f'head_{axis}')) for axis in "xyz"],
+            'tail': [parse_coordinate(row.get(f'tail_{axis}')) for axis in "xyz"],
+            'roll': float(row.get('roll') or 0),
+            'parent': row.get('parent') or "",
+            'connect': parse_value('BOOL', row.get('connect') or ""),
+            'parameters': {},
+        }
+        if control['type'] in rigify_info["rig_types"]:
+            for name, (prop_type, _) in rig_parameters(control['type']).items():
+                if row.get(name):
+                    control['parameters'][name] = parse_value(prop_type, row[name])
+        controls.append(control)
+    return controls
+
+
+def controls_to_csv(controls):
+    parameter_columns = []
+    for control in controls:
+        for name in control['parameters']:
+            if name not in parameter_columns:
+                parameter_columns.append(name)
+    rows = []
+    for control in controls:
+        row = {'name': control['name'], 'type': control['type'], 'roll': control['roll'],
+               'parent': control['parent'], 'connect': int(control['connect'])}
+        for i, axis in enumerate("xyz"):
+            row[f'head_{axis}'] = control['head'][i]
+            row[f'tail_{axis}'] = control['tail'][i]
+        for name, value in control['parameters'].items():
+            row[name] = int(value) if isinstance(value, bool) else value
+        rows.append(row)
+    return list(CSV_COLUMNS) + parameter_columns, rows
+
+
+def read_spec(path):
+    """Reads the controls of a .json or .csv spec."""
+    if os.path.splitext(path)[1].lower() == '.csv':
+        with open(path, newline='') as file:
+            return controls_from_csv(csv.DictReader(file))
+    with open(path) as file:
+        spec = json.load(file)
+    controls = spec['controls'] if isinstance(spec, dict) else spec
+    for control in controls:
+        control.setdefault('type', "")
+        control.setdefault('roll', 0.0)
+        control.setdefault('parent', "")
+        control.setdefault('connect', False)
+        control.setdefault('parameters', {})
+    return controls
+
+
+def write_spec(path, controls):
+    if os.path.splitext(path)[1].lower() == '.csv':
+        columns, rows = controls_to_csv(controls)
+        with open(path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, 'w') as file:
+            json.dump({'version': SPEC_VERSION, 'controls': controls}, file, indent=1)
+
+
+##############################
+# Metarig
+
+def check_point(name, control, key):
+    point = control.get(key)
+    try:
+        if len(point) != 3:
+            raise ValueError
+        return tuple(float(value) for value in point)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{name}': needs a {key} with x, y and z") from None
+
+
+def check_parameter(name, param_name, prop_type, options, value):
+    """Returns the value as the parameter's property takes it, raises a ValueError if it can't."""
+    if prop_type == 'ENUM':
+        identifiers = [item[0] for item in options['items']]
+        if value not in identifiers:
+            raise ValueError(f"'{name}': {param_name} is {value!r}, expected one of {', '.join(identifiers)}")
+        return value
+    types, expected = PARAMETER_TYPES[prop_type]
+    # A bool is an int to Python, but not a number in a spec
+    if not isinstance(value, types) or isinstance(value, bool) != (prop_type == 'BOOL'):
+        raise ValueError(f"'{name}': {param_name} is {value!r}, expected {expected}")
+    if prop_type == 'FLOAT':
+        # JSON writes whole floats as ints
+        value = float(value)
+    if not options.get('min', value) <= value <= options.get('max', value):
+        raise ValueError(f"'{name}': {param_name} is {value!r}, expected "
+                         f"{options.get('min', '-inf')} to {options.get('max', 'inf')}")
+    return value
+
+
+def check_controls(obj, controls):
+    """
+    Raises a ValueError for the first control the metarig can't be built from,
+    before anything is changed. Parameter values are converted to the types of
+    their properties and derived parameters are dropped.
+    """
+    names = set()
+    for control in controls:
+        name = control.get('name')
+        if not name:
+            raise ValueError("A control has no name")
+        if name in names:
+            raise ValueError(f"'{name}': more than one control has this name")
+        names.add(name)
+
+    tails = {control['name']: check_point(control['name'], control, 'tail') for control in controls}
+    for control in controls:
+        name = control['name']
+        control['type'] = check_parameter(name, 'type', 'STRING', {}, control['type'])
+        control['roll'] = check_parameter(name, 'roll', 'FLOAT', {}, control['roll'])
+        control['parent'] = check_parameter(name, 'parent', 'STRING', {}, control['parent'])
+        control['connect'] = check_parameter(name, 'connect', 'BOOL', {}, control['connect'])
+        if not isinstance(control['parameters'], dict):
+            raise ValueError(f"'{name}': parameters have to be given by name")
+        head = check_point(name, control, 'head')
+        # A connected head is moved to the parent's tail
+        if control['connect'] and control['parent'] in tails:
+            head = tails[control['parent']]
+        if math.dist(head, tails[name]) < MIN_BONE_LENGTH:
+            raise ValueError(f"'{name}': head and tail are at the same place, Blender would delete the bone")
+        spec_type = control['type']
+        if spec_type and '.' not in spec_type and spec_type not in rigify_info["rig_types"]:
+            raise ValueError(f"'{name}': unknown rig type '{spec_type}'")
+        if control['parameters']:
+            if spec_type not in rigify_info["rig_types"]:
+                raise ValueError(f"'{name}': only 6 Bird rig types take parameters")
+            unknown = set(control['parameters']) - set(rig_parameters(spec_type, derived=True))
+            if unknown:
+                raise ValueError(f"'{name}': '{spec_type}' has no parameters {', '.join(sorted(unknown))}")
+            # Specs written before derived parameters were left out still carry them
+            control['parameters'] = {
+                param_name: check_parameter(name, param_name, prop_type, options, control['parameters'][param_name])
+                for param_name, (prop_type, options) in rig_parameters(spec_type).items()
+                if param_name in control['parameters']
+            }
+        parent = control['parent']
+        if parent and parent not in names and parent not in obj.data.bones:
+            raise ValueError(f"'{name}': parent '{parent}' is not in the spec or the metarig")
+
+
+def write_bone_array(edit_bones, attr, rows, values, width):
+    """Replaces the values of some bones in one bulk read and write of the whole collection."""
+    array = np.empty(len(edit_bones) * width, dtype=np.float32)
+    edit_bones.foreach_get(attr, array)
+    if width > 1:
+        array.reshape(-1, width)[rows] = values
+    else:
+        array[rows] = values
+    edit_bones.foreach_set(attr, array)
+
+
+def import_controls(obj, controls):
+    """
+    Creates or updates a metarig bone for every control in one edit mode pass,
+    then assigns the rig types and parameters. Parameters a 6 Bird control
+    leaves out are reset to their default. The metarig has to be the active object.
+    """
+    check_controls(obj, controls)
+    mode = obj.mode
+    bpy.ops.object.mode_set(mode='EDIT')
+    try:
+        assign_controls(obj, controls)
+    finally:
+        bpy.ops.object.mode_set(mode=mode)
+    return len(controls)
+
+
+def assign_controls(obj, controls):
+    edit_bones = obj.data.edit_bones
+
+    names = []
+    for control in controls:
+        bone = edit_bones.get(control['name']) or edit_bones.new(control['name'])
+        names.append(bone.name)
+
+    index = {name: i for i, name in enumerate(edit_bones.keys())}
+    rows = [index[name] for name in names]
+    write_bone_array(edit_bones, "head", rows, [control['head'] for control in controls], 3)
+    write_bone_array(edit_bones, "tail", rows, [control['tail'] for control in controls], 3)
+    write_bone_array(edit_bones, "roll", rows, [control['roll'] for control in controls], 1)
+
+    # Parents are set once every bone exists, connecting snaps the head to the parent's tail
+    for name, control in zip(names, controls):
+        bone = edit_bones[name]
+        bone.parent = edit_bones[control['parent']] if control['parent'] else None
+        bone.use_connect = bool(control['parent']) and control['connect']
+
+    bpy.ops.object.mode_set(mode='POSE')
+    for name, control in zip(names, controls):
+        pose_bone = obj.pose.bones[name]
+        pose_bone.rigify_type = full_rig_type(control['type'])
+        if control['type'] in rigify_info["rig_types"]:
+            params = pose_bone.rigify_parameters
+            for param_name, (_, options) in rig_parameters(control['type']).items():
+                setattr(params, param_name, control['parameters'].get(param_name, options['default']))
+
+
+def export_controls(obj):
+    """
+    Describes every bone of the metarig as a control, with the parameters of
+    6 Bird rig types that differ from their default. The metarig has to be the active object.
+    """
+    mode = obj.mode
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = obj.data.edit_bones
+    count = len(edit_bones)
+    heads = np.empty(count * 3, dtype=np.float32)
+    tails = np.empty(count * 3, dtype=np.float32)
+    rolls = np.empty(count, dtype=np.float32)
+    edit_bones.foreach_get("head", heads)
+    edit_bones.foreach_get("tail", tails)
+    edit_bones.foreach_get("roll", rolls)
+    bones = [(bone.name, bone.parent.name if bone.parent else "", bone.use_connect) for bone in edit_bones]
+    bpy.ops.object.mode_set(mode=mode)
+
+    controls = []
+    for i, (name, parent, connect) in enumerate(bones):
+        pose_bone = obj.pose.bones[name]
+        spec_type = spec_rig_type(pose_bone.rigify_type)
+        parameters = {}
+        if spec_type in rigify_info["rig_types"]:
+            for param_name, (_, options) in rig_parameters(spec_type).items():
+                value = getattr(pose_bone.rigify_parameters, param_name)
+                if isinstance(value, float):
+                    value = short_float(value)
+                if value != options['default']:
+                    parameters[param_name] = value
+        controls.append({
+            'name': name,
+            'type': spec_type,
+            'head': [short_float(value) for value in heads[i * 3:i * 3 + 3]],
+            'tail': [short_float(value) for value in tails[i * 3:i * 3 + 3]],
+            'roll': short_float(rolls[i]),
+            'parent': parent,
+            'connect': connect,
+            'parameters': parameters,
+        })
+    return controls
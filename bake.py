@@ -0,0 +1,182 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import math
+import numpy as np
+from rigify.base_generate import GeneratorPlugin
+
+from .keys import OUTPUTS_KEY
+
+
+# Action group of the baked F-curves
+BAKE_GROUP = "6 Bird Outputs"
+
+# Keyframe interpolation enum values for foreach_set
+INTERPOLATION_CONSTANT = 0
+INTERPOLATION_LINEAR = 1
+
+
+class OutputRegistry(GeneratorPlugin):
+    """Records how every driven output of the rig is computed, so it can be baked later."""
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.outputs = {}
+
+    def add_value(self, data_path, bone_name, axis, length, scale, low, high):
+        """Output is scale * clamp(location[axis] / length, low, high)."""
+        self.outputs[data_path] = {
+            'kind': 'VALUE', 'bone': bone_name, 'axis': axis, 'length': length,
+            'scale': scale, 'low': low, 'high': high,
+        }
+
+    def add_corner(self, data_path, bone_name, length, scale, sign_x, sign_y):
+        """Output is scale * clamp(sign_x * x) * clamp(sign_y * y), x and y being the location / length."""
+        self.outputs[data_path] = {
+            'kind': 'CORNER', 'bone': bone_name, 'axis': 0, 'length': length,
+            'scale': scale, 'low': 0.0, 'high': 1.0, 'sign_x': sign_x, 'sign_y': sign_y,
+        }
+
+    def add_radius(self, data_path, bone_name, length, scale):
+        """Output is scale * min(hypot(x, y), 1)."""
+        self.outputs[data_path] = {
+            'kind': 'RADIUS', 'bone': bone_name, 'axis': 0, 'length': length,
+            'scale': scale, 'low': 0.0, 'high': 1.0,
+        }
+
+    def add_angle(self, data_path, bone_name, length):
+        """Output is atan2(y, x)."""
+        self.outputs[data_path] = {
+            'kind': 'ANGLE', 'bone': bone_name, 'axis': 0, 'length': length,
+            'scale': 1.0, 'low': -math.pi, 'high': math.pi,
+        }
+
+    def add_switch(self, data_path, bone_name, axis, length):
+        """Output is whether location[axis] is past half the length."""
+        self.outputs[data_path] = {
+            'kind': 'SWITCH', 'bone': bone_name, 'axis': axis, 'length': length,
+            'scale': 1.0, 'low': 0.0, 'high': 1.0,
+        }
+
+    def finalize(self):
+        if self.outputs:
+            self.obj.data[OUTPUTS_KEY] = self.outputs
+        elif OUTPUTS_KEY in self.obj.data:
+            del self.obj.data[OUTPUTS_KEY]
+
+
+def read_locations(obj, bone_names, frames):
+    """
+    Location of each bone at each frame, evaluated from the action's F-curves
+    without a depsgraph update. Returns an array of shape (bones, frames, 3).
+    Each F-curve is evaluated frame by frame with FCurve.evaluate(), which
+    follows every interpolation mode and modifier; only the outputs are
+    computed in bulk with NumPy.
+    """
+    action = obj.animation_data.action if obj.animation_data else None
+    locations = np.empty((len(bone_names), len(frames), 3))
+    for i, bone_name in enumerate(bone_names):
+        pose_bone = obj.pose.bones[bone_name]
+        data_path = f'pose.bones["{bone_name}"].location'
+        for axis in range(3):
+            fcurve = action.fcurves.find(data_path, index=axis) if action else None
+            if fcurve is None:
+                locations[i, :, axis] = pose_bone.location[axis]
+            else:
+                locations[i, :, axis] = [fcurve.evaluate(frame) for frame in frames]
+    return locations
+
+
+def compute_outputs(outputs, locations):
+    """
+    Values of the outputs at every frame from the locations of their bones.
+    The limit constraints keep the controls inside their box, which makes the
+    driver expressions equal to this clamped ratio.
+    """
+    count = len(outputs)
+    axis = np.array([output['axis'] for output in outputs])
+    length = np.array([output['length'] for output in outputs])[:, None]
+    scale = np.array([output['scale'] for output in outputs])[:, None]
+    low = np.array([output['low'] for output in outputs])[:, None]
+    high = np.array([output['high'] for output in outputs])[:, None]
+    kind = np.array([output['kind'] for output in outputs])[:, None]
+    sign_x = np.array([output.get('sign_x', 0) for output in outputs])[:, None]
+    sign_y = np.array([output.get('sign_y', 0) for output in outputs])[:, None]
+
+    ratio = np.clip(locations[np.arange(count), :, axis] / length, low, high)
+    # Slider pad outputs read both axes of the knob, which the limit constraint keeps in the pad
+    x = np.clip(locations[:, :, 0] / length, -1.0, 1.0)
+    y = np.clip(locations[:, :, 1] / length, -1.0, 1.0)
+    return np.select(
+        [kind == 'SWITCH', kind == 'CORNER', kind == 'RADIUS', kind == 'ANGLE'],
+        [(ratio > 0.5).astype(float),
+         scale * np.clip(sign_x * x, 0.0, 1.0) * np.clip(sign_y * y, 0.0, 1.0),
+         scale * np.minimum(np.hypot(x, y), 1.0),
+         np.arctan2(y, x)],
+        scale * ratio)
+
+
+def write_fcurve(action, data_path, frames, values, interpolation):
+    """Replaces the F-curve of the data path with one key per frame."""
+    fcurve = action.fcurves.find(data_path)
+    if fcurve:
+        action.fcurves.remove(fcurve)
+    fcurve = action.fcurves.new(data_path, action_group=BAKE_GROUP)
+
+    co = np.empty(len(frames) * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+    points = fcurve.keyframe_points
+    points.add(len(frames))
+    points.foreach_set("co", co)
+    points.foreach_set("interpolation", np.full(len(frames), interpolation, dtype=np.int32))
+    fcurve.update()
+    return fcurve
+
+
+def bake_outputs(obj, frame_start, frame_end, strip_drivers=False):
+    """
+    Bakes every output recorded on the generated rig to keyframes for the frame range.
+    Returns the number of baked outputs.
+    """
+    outputs = obj.data.get(OUTPUTS_KEY)
+    if not outputs:
+        return 0
+    data_paths = list(outputs.keys())
+    outputs = [outputs[data_path] for data_path in data_paths]
+    frames = np.arange(frame_start, frame_end + 1, dtype=np.float64)
+
+    # Read every control bone once, even if it has several outputs
+    bone_names = list(dict.fromkeys(output['bone'] for output in outputs))
+    bone_index = {bone_name: i for i, bone_name in enumerate(bone_names)}
+    locations = read_locations(obj, bone_names, frames)
+    values = compute_outputs(outputs, locations[[bone_index[output['bone']] for output in outputs]])
+
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    if obj.animation_data.action is None:
+        obj.animation_data.action = bpy.data.actions.new(obj.name + "Action")
+    action = obj.animation_data.action
+
+    for data_path, output, output_values in zip(data_paths, outputs, values):
+        interpolation = INTERPOLATION_CONSTANT if output['kind'] == 'SWITCH' else INTERPOLATION_LINEAR
+        write_fcurve(action, data_path, frames, output_values, interpolation)
+        if strip_drivers:
+            obj.driver_remove(data_path)
+    return len(data_paths)
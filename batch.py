@@ -0,0 +1,211 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+"""Regenerate the Rigify metarigs of many .blend files in parallel Blender processes.
+
+Every file is opened by its own `blender --background` worker, which regenerates each
+metarig in it, saves the file if all of them succeeded and writes its timings and errors
+for the report. Rigify and this feature set must be enabled in Blender's user preferences.
+Run with:
+
+    python batch.py --blender /path/to/blender characters/*.blend --output report.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+SCRIPT_PATH = os.path.abspath(__file__)
+
+# Rig type prefix of this feature set in Rigify's rig list
+RIG_TYPE_PREFIX = "6_Bird_Tools."
+
+# Lines of the worker's output kept in the report when it fails
+OUTPUT_TAIL_LINES = 20
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('files', nargs='+', help=".blend files with metarigs")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'),
+                        help="Blender executable, $BLENDER or 'blender' on the PATH by default")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Blender processes to run at once, one per core by default")
+    parser.add_argument('--timeout', type=float, default=None, help="Seconds before a worker is stopped")
+    parser.add_argument('--no-save', action='store_true', help="Regenerate without saving the files")
+    parser.add_argument('--output', help="JSON report to write, printed to stdout if omitted")
+    return parser.parse_args(argv)
+
+
+##############################
+# Pool
+
+def worker_command(args, path, result_path):
+    command = [args.blender, '--background', path, '--python', SCRIPT_PATH, '--',
+               '--worker', '--result', result_path]
+    if args.no_save:
+        command.append('--no-save')
+    return command
+
+
+def output_tail(text):
+    return (text or "").splitlines()[-OUTPUT_TAIL_LINES:]
+
+
+def run_file(args, path):
+    """Regenerates one file in a new Blender process and returns its report entry."""
+    entry = {'file': path, 'ok': False, 'time': 0.0, 'metarigs': [], 'error': None}
+    fd, result_path = tempfile.mkstemp(prefix="sixbird_batch_", suffix=".json")
+    os.close(fd)
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(worker_command(args, path, result_path), capture_output=True, text=True,
+                                 timeout=args.timeout)
+        entry['returncode'] = process.returncode
+        with open(result_path) as file:
+            text = file.read()
+        if text:
+            entry.update(json.loads(text))
+        else:
+            entry['error'] = f"Blender exited with code {process.returncode} before reporting"
+        if entry['error'] or process.returncode:
+            entry['output'] = output_tail(process.stdout + process.stderr)
+    except subprocess.TimeoutExpired:
+        entry['error'] = f"Timed out after {args.timeout} s"
+    except OSError as error:
+        entry['error'] = f"Could not run Blender: {error}"
+    finally:
+        os.remove(result_path)
+    entry['time'] = time.perf_counter() - start
+    entry['ok'] = not entry['error'] and all(metarig['error'] is None for metarig in entry['metarigs'])
+    return entry
+
+
+def run_batch(args):
+    files = [os.path.abspath(path) for path in args.files]
+    start = time.perf_counter()
+    entries = []
+    with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+        futures = [pool.submit(run_file, args, path) for path in files]
+        for future in as_completed(futures):
+            entry = future.result()
+            entries.append(entry)
+            status = "ok" if entry['ok'] else "FAILED"
+            print(f"[{len(entries)}/{len(files)}] {status:<6} {entry['time']:>8.2f} s  {entry['file']}",
+                  file=sys.stderr)
+
+    entries.sort(key=lambda entry: files.index(entry['file']))
+    return {
+        'jobs': args.jobs,
+        'time': time.perf_counter() - start,
+        'files': len(entries),
+        'failed': sum(1 for entry in entries if not entry['ok']),
+        'results': entries,
+    }
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    report = run_batch(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text)
+    else:
+        print(text)
+    return 1 if report['failed'] else 0
+
+
+##############################
+# Worker, runs inside Blender
+
+def find_metarigs(bpy):
+    return [obj for obj in bpy.data.objects
+            if obj.type == 'ARMATURE' and not obj.library and "rig_id" not in obj.data
+            and any(pose_bone.rigify_type for pose_bone in obj.pose.bones)]
+
+
+def feature_set_loaded():
+    from rigify import rig_lists
+    return any(rig_type.startswith(RIG_TYPE_PREFIX) for rig_type in rig_lists.rigs)
+
+
+def regenerate(bpy, metarig):
+    context = bpy.context
+    start = time.perf_counter()
+    error = None
+    try:
+        # Raises for a metarig outside the view layer, e.g. in an excluded collection
+        if context.object and context.object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        for obj in context.view_layer.objects:
+            obj.select_set(False)
+        context.view_layer.objects.active = metarig
+        metarig.select_set(True)
+        bpy.ops.pose.rigify_generate()
+    except Exception as exception:
+        error = str(exception).strip()
+    return {'metarig': metarig.name, 'time': time.perf_counter() - start, 'error': error}
+
+
+def worker(argv):
+    import bpy
+    import addon_utils
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--worker', action='store_true')
+    parser.add_argument('--result', required=True)
+    parser.add_argument('--no-save', action='store_true')
+    args = parser.parse_args(argv)
+
+    result = {'metarigs': [], 'error': None, 'blender': bpy.app.version_string}
+    try:
+        if not addon_utils.check('rigify')[1]:
+            addon_utils.enable('rigify', default_set=False)
+        if not feature_set_loaded():
+            raise RuntimeError("The 6 Bird Tools feature set is not enabled in Rigify")
+
+        metarigs = find_metarigs(bpy)
+        if not metarigs:
+            raise RuntimeError("No metarigs in the file")
+        for metarig in metarigs:
+            result['metarigs'].append(regenerate(bpy, metarig))
+
+        # A file with a failed metarig is left as it was on disk
+        failed = any(metarig['error'] for metarig in result['metarigs'])
+        if not args.no_save and not failed:
+            start = time.perf_counter()
+            bpy.ops.wm.save_mainfile()
+            result['save_time'] = time.perf_counter() - start
+    except Exception as exception:
+        result['error'] = str(exception).strip()
+    finally:
+        with open(args.result, 'w') as file:
+            json.dump(result, file)
+
+
+if __name__ == "__main__":
+    if '--' in sys.argv and '--worker' in sys.argv[sys.argv.index('--'):]:
+        worker(sys.argv[sys.argv.index('--') + 1:])
+    else:
+        sys.exit(main())
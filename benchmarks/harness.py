@@ -0,0 +1,322 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+"""Time generation and pose evaluation of every 6 Bird rig type at growing instance counts.
+
+For each rig type and count, builds a metarig with COUNT instances, generates it while timing
+every Rigify stage, animates the controls and times the per-frame evaluation. Results are
+written as JSON so runs can be compared between commits.
+
+Rigify must be enabled and this feature set installed. Run with:
+
+    blender --background --python benchmarks/harness.py -- --output results.json
+
+Without Blender, the same runs go through the pure Python stand-ins in benchmarks/standin.
+Their timings only show how the rigs scale, they are not comparable to Blender's:
+
+    python benchmarks/harness.py --standin --counts 1 10 100 --output results.json
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import sys
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+STANDIN_DIR = os.path.join(BENCHMARK_DIR, "standin")
+
+STANDIN = '--standin' in sys.argv
+if STANDIN:
+    sys.path.insert(0, STANDIN_DIR)
+
+import bpy
+
+
+# Rig type key: (rigify_type, knob suffix, animated knob location axes, default parameters)
+RIG_TYPES = {
+    'slider': ('6_Bird_Tools.slider', '_slide', (1,), {}),
+    'slider_bank': ('6_Bird_Tools.slider', '_slide', (1,), {'slider_bank': True}),
+    'slider_pad': ('6_Bird_Tools.slider_pad', '_slide', (0, 1), {}),
+    'switch': ('6_Bird_Tools.switch', '_on', (1,), {}),
+    'custom_text_widget': ('6_Bird_Tools.custom_text_widget', None, (), {}),
+}
+
+# Rig types that are one instance on a connected chain of COUNT bones
+CHAIN_RIG_TYPES = {'slider_bank'}
+
+STAGES = (
+    'initialize', 'prepare_bones', 'generate_bones', 'parent_bones', 'configure_bones',
+    'preapply_bones', 'apply_bones', 'rig_bones', 'generate_widgets', 'finalize',
+)
+
+BONE_LENGTH = 0.2
+
+
+def parse_args():
+    if STANDIN:
+        argv = [arg for arg in sys.argv[1:] if arg != '--standin']
+    else:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rig-types', nargs='+', choices=sorted(RIG_TYPES), default=list(RIG_TYPES))
+    parser.add_argument('--counts', nargs='+', type=int, default=[1, 10, 100, 1000])
+    parser.add_argument('--frames', type=int, default=50)
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUE',
+                        help="Rig parameter set on every instance, e.g. shared_widgets=True")
+    parser.add_argument('--profile-generation', action='store_true',
+                        help="Also write the feature set's per rig generation profile next to the .blend")
+    parser.add_argument('--regenerate', action='store_true',
+                        help="Generate a second time without changes and time that as well")
+    parser.add_argument('--playback', action='store_true',
+                        help="Run the animation playback handlers around the timed frames")
+    parser.add_argument('--output', help="JSON file to write, printed to stdout if omitted")
+    parser.add_argument('--standin', action='store_true', help="Run against benchmarks/standin instead of Blender")
+    return parser.parse_args(argv)
+
+
+def parse_params(items):
+    params = {}
+    for item in items:
+        name, _, value = item.partition('=')
+        try:
+            params[name] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            params[name] = value
+    return params
+
+
+##############################
+# Stage timing
+
+def instrument_stages(timings):
+    """Wraps the generator stage methods so each run records the time spent per stage."""
+    from rigify.base_generate import BaseGenerator
+
+    def timed(stage, method):
+        def invoke(self):
+            start = time.perf_counter()
+            try:
+                return method(self)
+            finally:
+                timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+        return invoke
+
+    for stage in STAGES:
+        method = getattr(BaseGenerator, 'invoke_' + stage, None)
+        if method is not None:
+            setattr(BaseGenerator, 'invoke_' + stage, timed(stage, method))
+
+
+##############################
+# Scene setup
+
+def build_metarig(name, rig_type, count, params, profile=False):
+    arm = bpy.data.armatures.new(name)
+    arm.sixbird_profile_generation = profile
+    metarig = bpy.data.objects.new(name, arm)
+    bpy.context.scene.collection.objects.link(metarig)
+    bpy.context.view_layer.objects.active = metarig
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    chain = rig_type in CHAIN_RIG_TYPES
+    names = []
+    for i in range(count):
+        bone = arm.edit_bones.new(f"{name}_{i:04d}")
+        if chain and i > 0:
+            bone.head = arm.edit_bones[names[-1]].tail
+            bone.tail = (bone.head[0], 0.0, bone.head[2] + BONE_LENGTH)
+            bone.parent = arm.edit_bones[names[-1]]
+            bone.use_connect = True
+        else:
+            bone.head = ((i % 32) * 0.5, 0.0, (i // 32) * 0.5)
+            bone.tail = (bone.head[0], 0.0, bone.head[2] + BONE_LENGTH)
+        names.append(bone.name)
+    bpy.ops.object.mode_set(mode='POSE')
+
+    for i, bone_name in enumerate(names[:1] if chain else names):
+        pose_bone = metarig.pose.bones[bone_name]
+        pose_bone.rigify_type = RIG_TYPES[rig_type][0]
+        if rig_type == 'custom_text_widget':
+            pose_bone.rigify_parameters.text_input = str(i)
+        for key, value in params.items():
+            setattr(pose_bone.rigify_parameters, key, value)
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    return metarig, names
+
+
+def generate(metarig):
+    bpy.context.view_layer.objects.active = metarig
+    start = time.perf_counter()
+    bpy.ops.pose.rigify_generate()
+    return metarig.data.rigify_target_rig, time.perf_counter() - start
+
+
+def animate_knobs(rig, rig_type, names, frames):
+    _, suffix, axes, _ = RIG_TYPES[rig_type]
+    if suffix is None:
+        return 0
+    animated = 0
+    for bone_name in names:
+        knob = rig.pose.bones.get(bone_name + suffix)
+        if knob is None:
+            continue
+        for axis in axes:
+            knob.location[axis] = 0.0
+            knob.keyframe_insert('location', index=axis, frame=1)
+            knob.location[axis] = BONE_LENGTH
+            knob.keyframe_insert('location', index=axis, frame=frames)
+        animated += 1
+    return animated
+
+
+def clear_data():
+    """Removes everything the previous run created, including its rig UI handlers."""
+    app_handlers = bpy.app.handlers
+    for handlers in (app_handlers.depsgraph_update_post, app_handlers.frame_change_post,
+                     app_handlers.animation_playback_pre, app_handlers.animation_playback_post,
+                     app_handlers.render_init, app_handlers.render_complete, app_handlers.render_cancel):
+        for handler in [h for h in handlers if hasattr(h, 'switch_rig_id')]:
+            handlers.remove(handler)
+    ids = [*bpy.data.objects, *bpy.data.armatures, *bpy.data.meshes, *bpy.data.curves,
+           *bpy.data.actions, *bpy.data.collections, *bpy.data.texts]
+    bpy.data.batch_remove(ids)
+
+
+##############################
+# Measurements
+
+def time_frames(frames, playback=False):
+    scene = bpy.context.scene
+    scene.frame_set(1)
+    # Frame changes in background mode don't start playback, so its handlers are run by hand
+    if playback:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for handler in list(bpy.app.handlers.animation_playback_pre):
+            handler(scene, depsgraph)
+    frame_times = []
+    for frame in range(1, frames + 1):
+        start = time.perf_counter()
+        scene.frame_set(frame)
+        frame_times.append(time.perf_counter() - start)
+    if playback:
+        for handler in list(bpy.app.handlers.animation_playback_post):
+            handler(scene, depsgraph)
+    return frame_times
+
+
+def rig_statistics(rig):
+    drivers = rig.animation_data.drivers if rig.animation_data else []
+    widgets = {pose_bone.custom_shape for pose_bone in rig.pose.bones if pose_bone.custom_shape}
+    return {
+        'bones': len(rig.data.bones),
+        'drivers': len(drivers),
+        'simple_drivers': sum(1 for fcurve in drivers if fcurve.driver.is_simple_expression),
+        'driver_variables': sum(len(fcurve.driver.variables) for fcurve in drivers),
+        'widget_objects': len(widgets),
+        'widget_meshes': len({widget.data for widget in widgets}),
+        'widget_vertices': sum(len(mesh.vertices) for mesh in {widget.data for widget in widgets}),
+    }
+
+
+def run(rig_type, count, frames, params, profile=False, regenerate=False, playback=False):
+    timings = run.timings
+    timings.clear()
+    scene = bpy.context.scene
+    scene.frame_start = 1
+    scene.frame_end = frames
+
+    metarig, names = build_metarig(f"{rig_type}_{count}", rig_type, count, {**RIG_TYPES[rig_type][3], **params},
+                                   profile)
+    rig, generate_time = generate(metarig)
+    stage_times = {stage: timings[stage] for stage in STAGES if stage in timings}
+    if regenerate:
+        timings.clear()
+        rig, regenerate_time = generate(metarig)
+    animated = animate_knobs(rig, rig_type, names, frames)
+    frame_times = time_frames(frames, playback)
+
+    result = {
+        'rig_type': rig_type,
+        'count': count,
+        'playback': playback,
+        'generate_s': generate_time,
+        'stages_s': stage_times,
+        'animated_controls': animated,
+        'frame_ms': {
+            'mean': sum(frame_times) / len(frame_times) * 1000 if frame_times else 0.0,
+            'max': max(frame_times) * 1000 if frame_times else 0.0,
+        },
+    }
+    if regenerate:
+        result['regenerate_s'] = regenerate_time
+        result['regenerate_stages_s'] = {stage: timings[stage] for stage in STAGES if stage in timings}
+    result.update(rig_statistics(rig))
+    if profile:
+        summary = metarig.data["sixbird_profile_summary"]
+        result['profile'] = summary.to_dict() if hasattr(summary, 'to_dict') else summary
+    clear_data()
+    return result
+
+
+run.timings = {}
+
+
+def environment():
+    return {
+        'backend': 'standin' if STANDIN else 'blender',
+        'blender': ".".join(map(str, bpy.app.version)),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main():
+    args = parse_args()
+    params = parse_params(args.param)
+
+    if STANDIN:
+        import rigify
+        rigify.load_feature_set(REPO_DIR)
+    instrument_stages(run.timings)
+    clear_data()
+
+    results = []
+    for rig_type in args.rig_types:
+        for count in args.counts:
+            result = run(rig_type, count, args.frames, params, args.profile_generation, args.regenerate,
+                         args.playback)
+            results.append(result)
+            print(f"{rig_type:<20} {count:>6} generate {result['generate_s']:>8.3f} s"
+                  f"   frame {result['frame_ms']['mean']:>8.3f} ms", file=sys.stderr)
+
+    report = {'environment': environment(), 'frames': args.frames, 'params': params, 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
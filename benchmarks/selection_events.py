@@ -0,0 +1,234 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+"""Count the switch dispatcher runs of a posing session.
+
+Generates COUNT switches, then replays a posing session on the rig: drag a switch
+container, evaluating after every move, and every few steps click a switch in the 3D view
+or change frame. Reports how often the switch dispatcher ran, how many of those runs
+toggled a switch and the time spent in it, and the clicks that missed their bone.
+
+Switches are clicked through view3d.select, like a user would, so run it with the
+interface, where the session is stepped from a timer and the report printed to the console:
+
+    blender --python benchmarks/selection_events.py -- --count 50 --output selection.json
+
+Without Blender the stand-in picks bones from a front view:
+
+    python benchmarks/selection_events.py --standin --count 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import harness
+import bpy
+from bpy_extras.view3d_utils import location_3d_to_region_2d
+from mathutils import Vector
+
+
+def parse_args():
+    if harness.STANDIN:
+        argv = sys.argv[1:]
+    else:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=50)
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--drag-updates', type=int, default=10,
+                        help="Evaluations while dragging a container, one per mouse move")
+    parser.add_argument('--toggle-every', type=int, default=10, help="Steps between switch clicks")
+    parser.add_argument('--frame-every', type=int, default=25, help="Steps between frame changes")
+    parser.add_argument('--output', help="JSON file to write, printed to stdout if omitted")
+    parser.add_argument('--standin', action='store_true', help="Run against benchmarks/standin instead of Blender")
+    return parser.parse_args(argv)
+
+
+##############################
+# Counting
+
+def rig_ui_namespace(rig):
+    """Globals of the rig UI script, found through the dispatcher handler it registered."""
+    rig_id = rig.data["rig_id"]
+    for handler in bpy.app.handlers.depsgraph_update_post:
+        if getattr(handler, 'switch_rig_id', None) == rig_id:
+            return handler.__globals__
+    raise RuntimeError("The rig UI script registered no switch dispatcher")
+
+
+def count_dispatcher(namespace, counts):
+    """Wraps the dispatcher of the rig UI script with counters."""
+    dispatcher = namespace['toggle_bones_on_select']
+
+    def counted_toggle_bones_on_select(scene, depsgraph=None):
+        # The dispatcher records every switch bone it toggles as last_selected
+        obj = bpy.context.object
+        last_selected = obj.get("last_selected") if obj else None
+        start = time.perf_counter()
+        try:
+            dispatcher(scene, depsgraph)
+        finally:
+            counts['updates'] += 1
+            counts['seconds'] += time.perf_counter() - start
+        if obj and obj.get("last_selected") != last_selected:
+            counts['toggles'] += 1
+
+    counted_toggle_bones_on_select.switch_rig_id = namespace['rig_id']
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if dispatcher in handlers:
+        handlers[handlers.index(dispatcher)] = counted_toggle_bones_on_select
+    namespace['toggle_bones_on_select'] = counted_toggle_bones_on_select
+
+
+##############################
+# Posing session
+
+def view3d_region():
+    """The first 3D view of the screen and its main region."""
+    for area in bpy.context.screen.areas:
+        if area.type == 'VIEW_3D':
+            for region in area.regions:
+                if region.type == 'WINDOW':
+                    return area, region
+    raise RuntimeError("The screen has no 3D view to click in")
+
+
+def custom_shape_location(rig, pose_bone):
+    """World location of the first vertex of the bone's custom shape, leaving out its rotation."""
+    co = pose_bone.custom_shape.data.vertices[0].co
+    local = [t + c * s * pose_bone.length for t, c, s in zip(pose_bone.custom_shape_translation, co,
+                                                             pose_bone.custom_shape_scale_xyz)]
+    return rig.matrix_world @ pose_bone.matrix @ Vector(local)
+
+
+def click_bone(rig, bone_name):
+    """Clicks the bone's custom shape in the 3D view. Returns whether the bone became active."""
+    area, region = view3d_region()
+    rv3d = area.spaces.active.region_3d
+    location = location_3d_to_region_2d(region, rv3d, custom_shape_location(rig, rig.pose.bones[bone_name]))
+    if location is not None:
+        with bpy.context.temp_override(area=area, region=region):
+            bpy.ops.view3d.select(location=(round(location[0]), round(location[1])))
+    active = rig.data.bones.active
+    return active is not None and active.name == bone_name
+
+
+def session_steps(rig, names, counts, args):
+    """Yields after each step of the session, so it can run straight through or from a timer."""
+    scene = bpy.context.scene
+    bones = rig.data.bones
+    for step in range(args.steps):
+        name = names[step % len(names)]
+        if args.toggle_every and step % args.toggle_every == args.toggle_every - 1:
+            # Click whichever of the on/off bones is shown
+            on_name, off_name = name + "_on", name + "_off"
+            counts['clicks'] += 1
+            if not click_bone(rig, off_name if bones[on_name].hide else on_name):
+                counts['missed_clicks'] += 1
+            bpy.context.view_layer.update()
+        else:
+            # The container can't be selected, so it is dragged like a transform of the rig would
+            for drag in range(max(args.drag_updates, 1)):
+                rig.pose.bones[name].location[0] = drag * 0.01
+                bpy.context.view_layer.update()
+        if args.frame_every and step % args.frame_every == args.frame_every - 1:
+            scene.frame_set(scene.frame_current % scene.frame_end + 1)
+        yield
+
+
+def setup(args):
+    metarig, names = harness.build_metarig("switch", 'switch', args.count, {})
+    rig, generate_time = harness.generate(metarig)
+    bpy.context.view_layer.objects.active = rig
+    bpy.ops.object.mode_set(mode='POSE')
+    area, region = view3d_region()
+    with bpy.context.temp_override(area=area, region=region):
+        bpy.ops.view3d.view_all()
+    counts = {'count': args.count, 'steps': args.steps, 'generate_s': generate_time,
+              'updates': 0, 'toggles': 0, 'seconds': 0.0, 'clicks': 0, 'missed_clicks': 0}
+    count_dispatcher(rig_ui_namespace(rig), counts)
+    return rig, names, counts
+
+
+def finish(counts):
+    counts['ms_per_update'] = counts['seconds'] / counts['updates'] * 1000 if counts['updates'] else 0.0
+    print(f"updates {counts['updates']:>6}   toggles {counts['toggles']:>4}"
+          f"   dispatcher {counts['seconds'] * 1000:>8.3f} ms"
+          f"   missed clicks {counts['missed_clicks']}/{counts['clicks']}", file=sys.stderr)
+    harness.clear_data()
+    return counts
+
+
+def write_report(args, counts):
+    report = {'environment': harness.environment(), 'results': counts}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+def run_now(args):
+    rig, names, counts = setup(args)
+    for _ in session_steps(rig, names, counts, args):
+        pass
+    write_report(args, finish(counts))
+
+
+def run_from_timer(args):
+    """Steps the session between redraws, as the clicks of a user would come."""
+
+    def session():
+        rig, names, counts = setup(args)
+        yield from session_steps(rig, names, counts, args)
+        write_report(args, finish(counts))
+
+    steps = session()
+
+    def tick():
+        try:
+            next(steps)
+        except StopIteration:
+            return None
+        return 0.0
+
+    bpy.app.timers.register(tick)
+
+
+def main():
+    args = parse_args()
+    if harness.STANDIN:
+        import rigify
+        rigify.load_feature_set(harness.REPO_DIR)
+    harness.clear_data()
+
+    if harness.STANDIN:
+        run_now(args)
+    elif bpy.app.background:
+        sys.exit("Switches are clicked in the 3D view, so run the benchmark with the interface.")
+    else:
+        run_from_timer(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1066 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+"""
+Pure Python stand-in for the parts of bpy used by the 6 Bird rigs.
+
+It only models the data the rigs create (bones, drivers, constraints, widget
+meshes) so that generation and driver evaluation can be timed on machines
+without Blender. Nothing here is meant to reproduce Blender's results.
+"""
+
+import ast
+import contextlib
+import math
+import os
+import re
+import tempfile
+import types as _types
+
+
+##############################
+# ID properties and collections
+
+class IDPropertyHost:
+    def _id_props(self):
+        props = self.__dict__.get('_props')
+        if props is None:
+            props = self.__dict__['_props'] = {}
+        return props
+
+    def __getitem__(self, key):
+        return self._id_props()[key]
+
+    def __setitem__(self, key, value):
+        self._id_props()[key] = value
+
+    def __delitem__(self, key):
+        del self._id_props()[key]
+
+    def __contains__(self, key):
+        return key in self._id_props()
+
+    def get(self, key, default=None):
+        return self._id_props().get(key, default)
+
+    def keys(self):
+        return self._id_props().keys()
+
+
+class ID(IDPropertyHost):
+    library = None
+
+    def __init__(self, name):
+        self.name = name
+        self.users = 0
+        self.use_fake_user = False
+        self.animation_data = None
+
+    def driver_add(self, path, index=-1):
+        if self.animation_data is None:
+            self.animation_data = AnimData()
+        return self.animation_data.driver_add(path)
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = AnimData()
+        return self.animation_data
+
+    def driver_remove(self, path, index=-1):
+        if self.animation_data is None:
+            return False
+        return self.animation_data.driver_remove(path)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class NamedCollection:
+    """Name keyed collection with Blender's .001 renaming on clashes."""
+
+    def __init__(self, factory=None):
+        self._items = {}
+        self._factory = factory
+
+    def _unique_name(self, name):
+        if name not in self._items:
+            return name
+        base = re.sub(r"\.\d{3}$", "", name)
+        index = 1
+        while f"{base}.{index:03d}" in self._items:
+            index += 1
+        return f"{base}.{index:03d}"
+
+    def _add(self, item):
+        item.name = self._unique_name(item.name)
+        self._items[item.name] = item
+        return item
+
+    def new(self, name, *args):
+        return self._add(self._factory(name, *args))
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def remove(self, item, **kwargs):
+        self._items.pop(item.name, None)
+
+    def rename(self, item, new_name):
+        self._items.pop(item.name, None)
+        item.name = new_name
+        self._add(item)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self._items.values())[key]
+        return self._items[key]
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self):
+        return self._items.keys()
+
+    def values(self):
+        return self._items.values()
+
+    def items(self):
+        return self._items.items()
+
+
+##############################
+# Animation
+
+class DriverTarget:
+    def __init__(self):
+        self.id = None
+        self.bone_target = ""
+        self.transform_type = 'LOC_X'
+        self.transform_space = 'WORLD_SPACE'
+        self.data_path = ""
+
+
+class DriverVariable:
+    def __init__(self):
+        self.name = "var"
+        self.type = 'SINGLE_PROP'
+        self.targets = [DriverTarget(), DriverTarget()]
+
+
+class DriverVariables(list):
+    def new(self):
+        var = DriverVariable()
+        self.append(var)
+        return var
+
+    def remove(self, var):
+        list.remove(self, var)
+
+
+# Functions and operators accepted by Blender's Simple Expression evaluator
+SIMPLE_EXPRESSION_FUNCTIONS = {
+    'min', 'max', 'abs', 'fabs', 'floor', 'ceil', 'trunc', 'round', 'int', 'sin', 'cos', 'tan',
+    'asin', 'acos', 'atan', 'atan2', 'exp', 'log', 'sqrt', 'pow', 'fmod', 'radians', 'degrees',
+    'clamp', 'lerp', 'inverse_lerp', 'smoothstep', 'compatible_bool',
+}
+SIMPLE_EXPRESSION_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Call, ast.Name,
+    ast.Load, ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.USub, ast.UAdd, ast.Not,
+    ast.And, ast.Or, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+
+def _clamp(x, low=0.0, high=1.0):
+    return min(max(x, low), high)
+
+
+DRIVER_NAMESPACE = {name: getattr(math, name) for name in dir(math) if not name.startswith('_')}
+DRIVER_NAMESPACE.update(min=min, max=max, abs=abs, round=round, int=int, clamp=_clamp,
+                        lerp=lambda a, b, t: a + (b - a) * t)
+
+
+class Driver:
+    def __init__(self):
+        self.type = 'SCRIPTED'
+        self.expression = ""
+        self.variables = DriverVariables()
+        self.use_self = False
+
+    @property
+    def is_simple_expression(self):
+        if self.type != 'SCRIPTED' or self.use_self:
+            return False
+        try:
+            tree = ast.parse(self.expression, mode='eval')
+        except SyntaxError:
+            return False
+        names = {var.name for var in self.variables} | {'pi', 'True', 'False'}
+        for node in ast.walk(tree):
+            if not isinstance(node, SIMPLE_EXPRESSION_NODES):
+                return False
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in SIMPLE_EXPRESSION_FUNCTIONS:
+                    return False
+            elif isinstance(node, ast.Name) and node.id not in names | SIMPLE_EXPRESSION_FUNCTIONS:
+                return False
+        return True
+
+
+class Keyframe:
+    def __init__(self, co=(0.0, 0.0)):
+        self.co = list(co)
+        self.interpolation = 'BEZIER'
+
+
+class KeyframePoints(list):
+    def add(self, count):
+        self.extend(Keyframe() for _ in range(count))
+
+    def insert(self, frame, value, **kwargs):
+        point = Keyframe((frame, value))
+        self.append(point)
+        self.sort(key=lambda point: point.co[0])
+        return point
+
+    def foreach_set(self, attr, seq):
+        width = 2 if attr == 'co' else 1
+        for i, point in enumerate(self):
+            value = seq[i * width:(i + 1) * width] if width > 1 else seq[i]
+            setattr(point, attr, list(value) if width > 1 else value)
+
+    def foreach_get(self, attr, seq):
+        flat = [value for point in self for value in getattr(point, attr)]
+        seq[:len(flat)] = flat
+
+
+class FCurve:
+    def __init__(self, data_path, index=0):
+        self.data_path = data_path
+        self.array_index = index
+        self.driver = Driver()
+        self.keyframe_points = KeyframePoints()
+        self.modifiers = []
+
+    def evaluate(self, frame):
+        points = self.keyframe_points
+        if not points:
+            return 0.0
+        if frame <= points[0].co[0]:
+            return points[0].co[1]
+        for previous, point in zip(points, points[1:]):
+            if frame < point.co[0]:
+                if previous.interpolation in ('CONSTANT', 0):
+                    return previous.co[1]
+                t = (frame - previous.co[0]) / ((point.co[0] - previous.co[0]) or 1.0)
+                return previous.co[1] + (point.co[1] - previous.co[1]) * t
+        return points[-1].co[1]
+
+    def update(self):
+        self.keyframe_points.sort(key=lambda point: point.co[0])
+
+
+class FCurves(list):
+    def new(self, data_path, index=0, action_group=""):
+        fcurve = FCurve(data_path, index)
+        self.append(fcurve)
+        return fcurve
+
+    def find(self, data_path, index=0):
+        return next((fc for fc in self if fc.data_path == data_path and fc.array_index == index), None)
+
+    def remove(self, fcurve):
+        list.remove(self, fcurve)
+
+
+class Action(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.fcurves = FCurves()
+
+
+class AnimData:
+    def __init__(self):
+        self.drivers = FCurves()
+        self.action = None
+
+    def driver_add(self, path):
+        fcurve = self.drivers.find(path)
+        return fcurve or self.drivers.new(path)
+
+    def driver_remove(self, path):
+        fcurve = self.drivers.find(path)
+        if fcurve:
+            self.drivers.remove(fcurve)
+        return fcurve is not None
+
+
+##############################
+# Meshes and curves
+
+class MeshElements(list):
+    def __init__(self, attrs):
+        super().__init__()
+        self._attrs = attrs
+
+    def add(self, count):
+        self.extend(_types.SimpleNamespace(**{name: (list(default) if isinstance(default, tuple) else default)
+                                              for name, default in self._attrs.items()})
+                    for _ in range(count))
+
+    def foreach_set(self, attr, seq):
+        default = self._attrs[attr]
+        width = len(default) if isinstance(default, tuple) else 1
+        seq = list(seq)
+        for i, element in enumerate(self):
+            if width > 1:
+                setattr(element, attr, seq[i * width:(i + 1) * width])
+            else:
+                setattr(element, attr, seq[i])
+
+    def foreach_get(self, attr, seq):
+        default = self._attrs[attr]
+        if isinstance(default, tuple):
+            flat = [value for element in self for value in getattr(element, attr)]
+        else:
+            flat = [getattr(element, attr) for element in self]
+        seq[:len(flat)] = flat
+
+
+class KeyBlock:
+    def __init__(self, name):
+        self.name = name
+        self.value = 0.0
+        self.slider_min = 0.0
+        self.slider_max = 1.0
+
+
+class Key(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.key_blocks = NamedCollection(KeyBlock)
+
+
+class Mesh(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.shape_keys = None
+        self.vertices = MeshElements({'co': (0.0, 0.0, 0.0)})
+        self.edges = MeshElements({'vertices': (0, 0)})
+        self.loops = MeshElements({'vertex_index': 0})
+        self.polygons = MeshElements({'loop_start': 0, 'loop_total': 0})
+
+    def from_pydata(self, vertices, edges, faces):
+        self.vertices.add(len(vertices))
+        self.vertices.foreach_set('co', [c for v in vertices for c in v])
+        self.edges.add(len(edges))
+        self.edges.foreach_set('vertices', [i for e in edges for i in e])
+        for face in faces:
+            self.polygons.add(1)
+            self.polygons[-1].loop_start = len(self.loops)
+            self.polygons[-1].loop_total = len(face)
+            self.loops.add(len(face))
+            for loop, index in zip(self.loops[-len(face):], face):
+                loop.vertex_index = index
+
+    def update(self, calc_edges=False, calc_edges_loose=False):
+        starts = [polygon.loop_start for polygon in self.polygons] + [len(self.loops)]
+        for polygon, end in zip(self.polygons, starts[1:]):
+            polygon.loop_total = end - polygon.loop_start
+
+    def transform(self, matrix):
+        for vertex in self.vertices:
+            vertex.co = list(matrix @ vertex.co)
+
+
+class TextCurve(ID):
+    def __init__(self, name, type='FONT'):
+        super().__init__(name)
+        self.type = type
+        self.body = "Text"
+        self.size = 1.0
+        self.extrude = 0.0
+        self.align_x = 'LEFT'
+        self.align_y = 'TOP_BASELINE'
+        self.resolution_u = 12
+        self.font = None
+
+    def tessellate(self, mesh):
+        """Stand-in glyphs: one ngon per character with resolution dependent detail."""
+        advance = 0.6
+        width = advance * len(self.body)
+        x = {'CENTER': -width / 2, 'RIGHT': -width}.get(self.align_x, 0.0)
+        y = {'TOP': -0.75, 'CENTER': -0.35, 'BOTTOM': 0.25}.get(self.align_y, 0.0)
+        steps = max(self.resolution_u, 1) * 4
+        verts, edges, faces = [], [], []
+        for char in self.body:
+            if not char.isspace():
+                base = len(verts)
+                for i in range(steps):
+                    angle = i * 2 * math.pi / steps
+                    verts.append(((x + advance / 2 + 0.25 * math.cos(angle)) * self.size,
+                                  (y + 0.35 + 0.35 * math.sin(angle)) * self.size, 0.0))
+                edges.extend((base + i, base + (i + 1) % steps) for i in range(steps))
+                faces.append([base + i for i in range(steps)])
+            x += advance
+        mesh.from_pydata(verts, edges, faces)
+        return mesh
+
+
+class VectorFont(ID):
+    filepath = '<builtin>'
+
+
+##############################
+# Armatures
+
+class Bone(IDPropertyHost):
+    def __init__(self, name):
+        self.name = name
+        self.head = [0.0, 0.0, 0.0]
+        self.tail = [0.0, 1.0, 0.0]
+        self.roll = 0.0
+        self.parent = None
+        self.use_connect = False
+        self.hide = False
+        self.hide_select = False
+        self.select = False
+
+    @property
+    def length(self):
+        return math.dist(self.head, self.tail)
+
+    @property
+    def children(self):
+        return [bone for bone in self._armature.bones if bone.parent is self]
+
+    @property
+    def head_local(self):
+        return self.head
+
+    @property
+    def tail_local(self):
+        return self.tail
+
+    @property
+    def matrix_local(self):
+        from mathutils import Matrix
+        return Matrix.Translation(self.head)
+
+
+class Constraint:
+    def __init__(self, type):
+        self.type = type
+        self.name = type.title().replace('_', ' ')
+        self.mute = False
+        self.influence = 1.0
+        self.owner_space = 'WORLD'
+        if type == 'LIMIT_LOCATION':
+            for axis in "xyz":
+                setattr(self, "use_min_" + axis, False)
+                setattr(self, "use_max_" + axis, False)
+                setattr(self, "min_" + axis, 0.0)
+                setattr(self, "max_" + axis, 0.0)
+
+
+def _limit_location(pose_bone, axis, value):
+    """Applies the local space limit location constraints, which local space driver variables include."""
+    letter = "xyz"[axis]
+    for con in pose_bone.constraints:
+        if con.mute or con.type != 'LIMIT_LOCATION' or con.owner_space != 'LOCAL':
+            continue
+        limited = value
+        if getattr(con, "use_min_" + letter):
+            limited = max(limited, getattr(con, "min_" + letter))
+        if getattr(con, "use_max_" + letter):
+            limited = min(limited, getattr(con, "max_" + letter))
+        value += (limited - value) * con.influence
+    return value
+
+
+class Constraints(list):
+    def new(self, type):
+        constraint = Constraint(type)
+        self.append(constraint)
+        return constraint
+
+
+class RigifyParameters:
+    """Holds every registered rig parameter with its default value."""
+
+    defaults = {}
+
+    def __init__(self):
+        self.__dict__.update(self.defaults)
+
+
+class PoseBone(IDPropertyHost):
+    def __init__(self, bone):
+        self.bone = bone
+        self.name = bone.name
+        self.location = [0.0, 0.0, 0.0]
+        self.rotation_quaternion = [1.0, 0.0, 0.0, 0.0]
+        self.rotation_euler = [0.0, 0.0, 0.0]
+        self.scale = [1.0, 1.0, 1.0]
+        self.lock_location = [False, False, False]
+        self.lock_rotation = [False, False, False]
+        self.lock_rotation_w = False
+        self.lock_rotations_4d = False
+        self.lock_scale = [False, False, False]
+        self.custom_shape = None
+        self.custom_shape_scale_xyz = [1.0, 1.0, 1.0]
+        self.custom_shape_translation = [0.0, 0.0, 0.0]
+        self.custom_shape_rotation_euler = [0.0, 0.0, 0.0]
+        self.constraints = Constraints()
+        self.rigify_type = ""
+        self.rigify_parameters = RigifyParameters()
+
+    @property
+    def length(self):
+        return self.bone.length
+
+    @property
+    def matrix(self):
+        from mathutils import Matrix, Vector
+        return Matrix.Translation(Vector(self.bone.head) + Vector(self.location))
+
+    @property
+    def id_data(self):
+        return self.bone._armature._object
+
+    def keyframe_insert(self, data_path, index=-1, frame=0.0, **kwargs):
+        obj = self.id_data
+        if obj.animation_data is None:
+            obj.animation_data = AnimData()
+        if obj.animation_data.action is None:
+            obj.animation_data.action = data.actions.new(obj.name + "Action")
+        fcurves = obj.animation_data.action.fcurves
+        if data_path.startswith('['):
+            paths = [(f'pose.bones["{self.name}"]{data_path}', 0, self[data_path[2:-2]])]
+        else:
+            values = getattr(self, data_path)
+            indices = range(len(values)) if index < 0 else [index]
+            paths = [(f'pose.bones["{self.name}"].{data_path}', i, values[i]) for i in indices]
+        for path, i, value in paths:
+            fcurve = fcurves.find(path, i) or fcurves.new(path, i)
+            fcurve.keyframe_points.insert(frame, float(value))
+        return True
+
+
+class ArmatureBones(NamedCollection):
+    def __init__(self, armature):
+        super().__init__()
+        self._armature = armature
+        self.active = None
+
+
+class EditBones:
+    """Edit bones are the same objects as bones in the stand-in."""
+
+    def __init__(self, armature):
+        self._armature = armature
+
+    def new(self, name):
+        arm = self._armature
+        bone = arm.bones._add(Bone(name))
+        bone._armature = arm
+        if arm._object is not None:
+            arm._object.pose.bones._add(PoseBone(bone))
+        return bone
+
+    def remove(self, bone):
+        arm = self._armature
+        for child in bone.children:
+            child.parent = bone.parent
+        arm.bones.remove(bone)
+        if arm._object is not None:
+            arm._object.pose.bones.remove(bone)
+
+    def __getitem__(self, name):
+        return self._armature.bones[name]
+
+    def get(self, name, default=None):
+        return self._armature.bones.get(name, default)
+
+    def __iter__(self):
+        return iter(self._armature.bones)
+
+    def __len__(self):
+        return len(self._armature.bones)
+
+    def keys(self):
+        return [bone.name for bone in self]
+
+    def foreach_get(self, attr, seq):
+        flat = []
+        for bone in self:
+            value = getattr(bone, attr)
+            flat.extend(value) if isinstance(value, (list, tuple)) else flat.append(value)
+        seq[:len(flat)] = flat
+
+    def foreach_set(self, attr, seq):
+        for i, bone in enumerate(self):
+            if attr in ('head', 'tail'):
+                setattr(bone, attr, [float(value) for value in seq[i * 3:i * 3 + 3]])
+            else:
+                setattr(bone, attr, float(seq[i]))
+
+
+class Armature(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.bones = ArmatureBones(self)
+        self.edit_bones = EditBones(self)
+        self.rigify_target_rig = None
+        self._object = None
+
+
+class Pose:
+    def __init__(self):
+        self.bones = NamedCollection()
+
+
+##############################
+# Objects and scenes
+
+class CollectionObjects(list):
+    def __init__(self, owner):
+        super().__init__()
+        self._owner = owner
+
+    def link(self, obj):
+        self.append(obj)
+        obj.users_collection.append(self._owner)
+
+    def unlink(self, obj):
+        self.remove(obj)
+        obj.users_collection.remove(self._owner)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(obj.name == key for obj in self)
+        return list.__contains__(self, key)
+
+
+class CollectionChildren(list):
+    def link(self, collection):
+        self.append(collection)
+
+    def unlink(self, collection):
+        self.remove(collection)
+
+
+class Collection(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.objects = CollectionObjects(self)
+        self.children = CollectionChildren()
+        self.hide_viewport = False
+
+
+class Object(ID):
+    def __init__(self, name, object_data=None):
+        super().__init__(name)
+        self._data = None
+        self.data = object_data
+        self.users_collection = []
+        self.hide_viewport = False
+        self.mode = 'OBJECT'
+        self.pose = None
+        if isinstance(object_data, Armature):
+            self.type = 'ARMATURE'
+            self.pose = Pose()
+            object_data._object = self
+            for bone in object_data.bones:
+                self.pose.bones._add(PoseBone(bone))
+        elif isinstance(object_data, Mesh):
+            self.type = 'MESH'
+        elif isinstance(object_data, TextCurve):
+            self.type = 'FONT'
+        else:
+            self.type = 'EMPTY'
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        if self._data is not None:
+            self._data.users -= 1
+        self._data = value
+        if value is not None:
+            value.users += 1
+
+    def evaluated_get(self, depsgraph):
+        return self
+
+    def to_mesh(self):
+        self._temp_mesh = Mesh(self.name)
+        if isinstance(self.data, TextCurve):
+            self.data.tessellate(self._temp_mesh)
+        return self._temp_mesh
+
+    def to_mesh_clear(self):
+        self._temp_mesh = None
+
+    def select_set(self, state):
+        pass
+
+    @property
+    def matrix_world(self):
+        from mathutils import Matrix
+        return Matrix()
+
+    def shape_key_add(self, name="Key", from_mix=True):
+        if self.data.shape_keys is None:
+            self.data.shape_keys = data.shape_keys.new("Key")
+        return self.data.shape_keys.key_blocks.new(name)
+
+
+def _remove_object(obj, do_unlink=True):
+    for collection in list(obj.users_collection):
+        collection.objects.unlink(obj)
+    obj.data = None
+    NamedCollection.remove(data.objects, obj)
+
+
+class Depsgraph:
+    def __init__(self, updates=()):
+        self._updates = set(updates)
+
+    def id_type_updated(self, id_type):
+        return id_type in self._updates
+
+
+class Scene(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.collection = Collection("Scene Collection")
+        self.frame_current = 1
+        self.frame_start = 1
+        self.frame_end = 250
+
+    @property
+    def objects(self):
+        return [obj for obj in data.objects if obj.users_collection]
+
+    def frame_set(self, frame):
+        """Evaluates keyframed bone channels and every driver, like a frame change."""
+        self.frame_current = frame
+        for obj in data.objects:
+            if obj.animation_data is None or obj.hide_viewport:
+                continue
+            if obj.animation_data.action:
+                for fcurve in obj.animation_data.action.fcurves:
+                    _set_path(obj, fcurve.data_path, fcurve.array_index, fcurve.evaluate(frame))
+            evaluate_drivers(obj)
+        for key in data.shape_keys:
+            if key.animation_data is not None:
+                evaluate_drivers(key)
+        for handler in list(app.handlers.frame_change_post):
+            handler(self, Depsgraph({'OBJECT'}))
+        for handler in list(app.handlers.depsgraph_update_post):
+            handler(self, Depsgraph({'OBJECT'}))
+
+
+_PATH_RE = re.compile(r'pose\.bones\["([^"]+)"\](?:\["([^"]+)"\]|\.(\w+))')
+_KEY_PATH_RE = re.compile(r'key_blocks\["([^"]+)"\]\.value')
+
+
+def _set_path(obj, data_path, index, value):
+    if isinstance(obj, Key):
+        match = _KEY_PATH_RE.fullmatch(data_path)
+        key_block = obj.key_blocks.get(match.group(1)) if match else None
+        if key_block is not None:
+            key_block.value = min(max(value, key_block.slider_min), key_block.slider_max)
+        return
+    match = _PATH_RE.fullmatch(data_path)
+    if not match or obj.pose is None:
+        return
+    pose_bone = obj.pose.bones.get(match.group(1))
+    if pose_bone is None:
+        return
+    if match.group(2):
+        pose_bone[match.group(2)] = value
+    else:
+        getattr(pose_bone, match.group(3))[index] = value
+
+
+def _read_variable(var):
+    target = var.targets[0]
+    obj = target.id
+    pose_bone = obj.pose.bones.get(target.bone_target) if obj and obj.pose else None
+    if pose_bone is None:
+        return 0.0
+    channel = target.transform_type
+    if channel.startswith('LOC_'):
+        axis = "XYZ".index(channel[-1])
+        if target.transform_space == 'LOCAL_SPACE':
+            return _limit_location(pose_bone, axis, pose_bone.location[axis])
+        return pose_bone.location[axis]
+    if channel.startswith('SCALE_'):
+        return pose_bone.scale["XYZ".index(channel[-1])]
+    return 0.0
+
+
+_compiled_expressions = {}
+
+
+def evaluate_drivers(obj):
+    """Evaluates every driver of the object with Python, as Blender does for non-simple expressions."""
+    for fcurve in obj.animation_data.drivers:
+        driver = fcurve.driver
+        code = _compiled_expressions.get(driver.expression)
+        if code is None:
+            code = _compiled_expressions[driver.expression] = compile(driver.expression or "0", "<driver>", 'eval')
+        namespace = {var.name: _read_variable(var) for var in driver.variables}
+        namespace['frame'] = context.scene.frame_current
+        _set_path(obj, fcurve.data_path, fcurve.array_index, eval(code, app.driver_namespace, namespace))
+
+
+class ViewLayer:
+    def __init__(self):
+        self.objects = _types.SimpleNamespace(active=None)
+
+    def update(self):
+        for handler in list(app.handlers.depsgraph_update_post):
+            handler(context.scene, Depsgraph({'OBJECT', 'ARMATURE'}))
+
+
+# The only 3D view looks at the front (X right, Z up) with this many pixels per unit
+VIEW_SCALE = 100.0
+
+
+def _region_location(coord):
+    return coord[0] * VIEW_SCALE, coord[2] * VIEW_SCALE
+
+
+def _view3d_screen():
+    region = _types.SimpleNamespace(type='WINDOW')
+    space = _types.SimpleNamespace(type='VIEW_3D', region_3d=_types.SimpleNamespace())
+    area = _types.SimpleNamespace(type='VIEW_3D', regions=[region], spaces=_types.SimpleNamespace(active=space))
+    return _types.SimpleNamespace(areas=[area])
+
+
+class Context:
+    def __init__(self):
+        self.scene = Scene("Scene")
+        self.view_layer = ViewLayer()
+        self.window_manager = None
+        self.screen = _view3d_screen()
+
+    def temp_override(self, **kwargs):
+        return contextlib.nullcontext()
+
+    @property
+    def object(self):
+        return self.view_layer.objects.active
+
+    active_object = object
+
+    @property
+    def mode(self):
+        obj = self.object
+        return {'POSE': 'POSE', 'EDIT': 'EDIT_ARMATURE'}.get(obj.mode, 'OBJECT') if obj else 'OBJECT'
+
+    @property
+    def selected_objects(self):
+        return [self.object] if self.object else []
+
+    def evaluated_depsgraph_get(self):
+        return Depsgraph({'OBJECT', 'MESH', 'CURVE', 'ARMATURE'})
+
+
+##############################
+# Module level API
+
+data = _types.SimpleNamespace(
+    objects=NamedCollection(Object),
+    meshes=NamedCollection(Mesh),
+    curves=NamedCollection(TextCurve),
+    armatures=NamedCollection(Armature),
+    collections=NamedCollection(Collection),
+    actions=NamedCollection(Action),
+    shape_keys=NamedCollection(Key),
+    fonts=NamedCollection(VectorFont),
+    texts=NamedCollection(ID),
+    filepath="",
+)
+data.objects.remove = _remove_object
+
+
+def _remove_collection(collection, **kwargs):
+    for obj in list(collection.objects):
+        collection.objects.unlink(obj)
+    if collection in context.scene.collection.children:
+        context.scene.collection.children.unlink(collection)
+    NamedCollection.remove(data.collections, collection)
+
+
+data.collections.remove = _remove_collection
+
+
+def _batch_remove(ids):
+    ids = list(ids)
+    for item in ids:
+        if isinstance(item, Object):
+            _remove_object(item)
+        elif isinstance(item, Collection):
+            _remove_collection(item)
+    for item in ids:
+        for collection in vars(data).values():
+            if isinstance(collection, NamedCollection) and collection.get(item.name) is item:
+                collection.remove(item)
+                break
+
+
+data.batch_remove = _batch_remove
+
+context = Context()
+
+
+def _reset():
+    """Clears all data, like loading an empty file."""
+    for collection in vars(data).values():
+        if isinstance(collection, NamedCollection):
+            collection._items.clear()
+    global context
+    context = Context()
+    for handlers in vars(app.handlers).values():
+        if isinstance(handlers, list):
+            handlers.clear()
+
+
+def _mode_set(mode='OBJECT', **kwargs):
+    if context.object is not None:
+        context.object.mode = mode
+    return {'FINISHED'}
+
+
+class _PropertyDefinition:
+    def __init__(self, kind, **keywords):
+        self.kind = kind
+        self.keywords = keywords
+
+    @property
+    def default(self):
+        if 'default' in self.keywords:
+            return self.keywords['default']
+        return {'BOOL': False, 'INT': 0, 'FLOAT': 0.0, 'STRING': "",
+                'ENUM': (self.keywords.get('items') or [(None,)])[0][0]}.get(self.kind)
+
+
+def _property(kind):
+    return lambda **keywords: _PropertyDefinition(kind, **keywords)
+
+
+props = _types.SimpleNamespace(
+    BoolProperty=_property('BOOL'),
+    IntProperty=_property('INT'),
+    FloatProperty=_property('FLOAT'),
+    StringProperty=_property('STRING'),
+    EnumProperty=_property('ENUM'),
+    FloatVectorProperty=_property('FLOAT_VECTOR'),
+    PointerProperty=_property('POINTER'),
+    CollectionProperty=_property('COLLECTION'),
+)
+
+types = _types.SimpleNamespace(
+    ID=ID, Object=Object, Mesh=Mesh, Armature=Armature, Bone=Bone, PoseBone=PoseBone,
+    TextCurve=TextCurve, Key=Key, Action=Action, FCurve=FCurve, Driver=Driver, Scene=Scene,
+    Operator=object, Panel=object, PropertyGroup=object, UIList=object,
+)
+PoseBone.__annotations__ = {}
+
+# Pick distance of view3d.select in pixels
+SELECT_DISTANCE = 10.0
+
+
+def _custom_shape_points(pose_bone):
+    """World locations of the custom shape vertices, leaving out the custom shape rotation."""
+    length = pose_bone.length
+    matrix = pose_bone.id_data.matrix_world @ pose_bone.matrix
+    for vertex in pose_bone.custom_shape.data.vertices:
+        yield matrix @ [t + c * s * length for t, c, s in zip(pose_bone.custom_shape_translation, vertex.co,
+                                                             pose_bone.custom_shape_scale_xyz)]
+
+
+def _view3d_select(location=(0, 0), extend=False, deselect_all=True, **kwargs):
+    """Picks the pose bone of the active object with a custom shape vertex nearest to the location."""
+    obj = context.object
+    if obj is None or obj.mode != 'POSE':
+        return {'CANCELLED'}
+    bones = obj.data.bones
+    picked = None
+    distance = SELECT_DISTANCE
+    for pose_bone in obj.pose.bones:
+        # Rigify hides the collections of the bones without a custom shape
+        if pose_bone.bone.hide or pose_bone.bone.hide_select or pose_bone.custom_shape is None:
+            continue
+        for point in _custom_shape_points(pose_bone):
+            point_distance = math.dist(_region_location(point), location)
+            if point_distance < distance:
+                picked, distance = pose_bone.bone, point_distance
+    if picked is None:
+        return {'CANCELLED'}
+    if not extend:
+        for bone in bones:
+            bone.select = False
+    picked.select = True
+    bones.active = picked
+    return {'FINISHED'}
+
+
+ops = _types.SimpleNamespace(
+    object=_types.SimpleNamespace(mode_set=_mode_set),
+    view3d=_types.SimpleNamespace(select=_view3d_select, view_all=lambda **kwargs: {'FINISHED'}),
+)
+
+app = _types.SimpleNamespace(
+    version=(0, 0, 0),
+    background=True,
+    tempdir=tempfile.gettempdir(),
+    driver_namespace=dict(DRIVER_NAMESPACE),
+    handlers=_types.SimpleNamespace(
+        depsgraph_update_post=[], frame_change_post=[], load_post=[],
+        animation_playback_pre=[], animation_playback_post=[],
+        render_init=[], render_complete=[], render_cancel=[], save_pre=[],
+    ),
+)
+app.handlers.persistent = lambda func: func
+
+_user_resource_dir = os.path.join(tempfile.gettempdir(), "bpy_standin")
+
+
+def _user_resource(resource_type, path="", create=False):
+    directory = os.path.join(_user_resource_dir, resource_type.lower(), path)
+    if create:
+        os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+utils = _types.SimpleNamespace(user_resource=_user_resource, register_class=lambda cls: None,
+                               unregister_class=lambda cls: None)
+path = _types.SimpleNamespace(abspath=lambda p: p, basename=os.path.basename,
+                              clean_name=lambda name: re.sub(r"[^\w.-]", "_", name))
@@ -0,0 +1,129 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+"""Pure Python stand-in for the parts of mathutils used by the 6 Bird rigs."""
+
+import math
+
+
+class Vector(tuple):
+    def __new__(cls, values=(0.0, 0.0, 0.0)):
+        return super().__new__(cls, (float(v) for v in values))
+
+    x = property(lambda self: self[0])
+    y = property(lambda self: self[1])
+    z = property(lambda self: self[2])
+
+    @property
+    def length(self):
+        return math.sqrt(sum(v * v for v in self))
+
+    def normalized(self):
+        length = self.length or 1.0
+        return Vector(v / length for v in self)
+
+    def __add__(self, other):
+        return Vector(a + b for a, b in zip(self, other))
+
+    def __sub__(self, other):
+        return Vector(a - b for a, b in zip(self, other))
+
+    def __mul__(self, scalar):
+        return Vector(v * scalar for v in self)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Vector(-v for v in self)
+
+
+class Matrix:
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = [[float(i == j) for j in range(4)] for i in range(4)]
+        self.rows = [list(map(float, row)) for row in rows]
+
+    @classmethod
+    def Identity(cls, size=4):
+        return cls()
+
+    @classmethod
+    def Translation(cls, vector):
+        matrix = cls()
+        for i, value in enumerate(vector):
+            matrix.rows[i][3] = float(value)
+        return matrix
+
+    @classmethod
+    def Scale(cls, factor, size=4, axis=None):
+        matrix = cls()
+        if axis is None:
+            for i in range(3):
+                matrix.rows[i][i] = factor
+            return matrix
+        axis = Vector(axis).normalized()
+        for i in range(3):
+            for j in range(3):
+                matrix.rows[i][j] += (factor - 1.0) * axis[i] * axis[j]
+        return matrix
+
+    @classmethod
+    def Rotation(cls, angle, size=4, axis='Z'):
+        if isinstance(axis, str):
+            axis = {'X': (1, 0, 0), 'Y': (0, 1, 0), 'Z': (0, 0, 1)}[axis]
+        x, y, z = Vector(axis).normalized()
+        c, s = math.cos(angle), math.sin(angle)
+        t = 1.0 - c
+        return cls([
+            [t * x * x + c, t * x * y - s * z, t * x * z + s * y, 0.0],
+            [t * x * y + s * z, t * y * y + c, t * y * z - s * x, 0.0],
+            [t * x * z - s * y, t * y * z + s * x, t * z * z + c, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ])
+
+    @property
+    def translation(self):
+        return Vector(row[3] for row in self.rows[:3])
+
+    def inverted(self):
+        # Only rigid and scaled transforms are used, so solve with Gauss-Jordan
+        size = 4
+        a = [row[:] + [float(i == j) for j in range(size)] for i, row in enumerate(self.rows)]
+        for col in range(size):
+            pivot = max(range(col, size), key=lambda r: abs(a[r][col]))
+            a[col], a[pivot] = a[pivot], a[col]
+            div = a[col][col] or 1e-12
+            a[col] = [v / div for v in a[col]]
+            for r in range(size):
+                if r != col:
+                    f = a[r][col]
+                    a[r] = [v - f * p for v, p in zip(a[r], a[col])]
+        return Matrix([row[size:] for row in a])
+
+    def __matmul__(self, other):
+        if isinstance(other, Matrix):
+            cols = list(zip(*other.rows))
+            return Matrix([[sum(a * b for a, b in zip(row, col)) for col in cols] for row in self.rows])
+        vec = list(other) + [1.0] * (4 - len(other))
+        return Vector(sum(a * b for a, b in zip(row, vec)) for row in self.rows[:len(other)])
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def copy(self):
+        return Matrix(self.rows)
@@ -0,0 +1,82 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+"""
+Minimal stand-in for the Rigify generator, enough to run the 6 Bird rig types
+without Blender. Load the feature set with load_feature_set() before generating.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+
+import bpy
+
+FEATURE_SET_MODULE = "rigify_feature_set"
+
+# Rig modules by rig type, e.g. '6_Bird_Tools.slider'
+rig_types = {}
+
+
+def load_feature_set(path):
+    """Imports the feature set at the path and registers its rig types and parameters."""
+    from .base_rig import RigifyParameterCollector
+    from . import rig_lists
+
+    spec = importlib.util.spec_from_file_location(
+        FEATURE_SET_MODULE, os.path.join(path, "__init__.py"), submodule_search_locations=[path])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[FEATURE_SET_MODULE] = package
+    spec.loader.exec_module(package)
+
+    rigs_dir = os.path.join(path, "rigs")
+    collector = RigifyParameterCollector()
+    for group in sorted(os.listdir(rigs_dir)):
+        group_dir = os.path.join(rigs_dir, group)
+        if not os.path.isdir(group_dir) or group.startswith(('_', '.')):
+            continue
+        for filename in sorted(os.listdir(group_dir)):
+            if not filename.endswith(".py") or filename.startswith('_'):
+                continue
+            module_name = filename[:-3]
+            module = importlib.import_module(f"{FEATURE_SET_MODULE}.rigs.{group}.{module_name}")
+            if hasattr(module, 'Rig'):
+                rig_types[f"{group}.{module_name}"] = module
+                rig_lists.rigs[f"{group}.{module_name}"] = {'module': module, 'feature_set': FEATURE_SET_MODULE}
+                module.Rig.add_parameters(collector)
+
+    bpy.types.PoseBone.__annotations__.clear()
+    if hasattr(package, 'register'):
+        package.register()
+    # Properties registered on types read as their default value
+    for cls in vars(bpy.types).values():
+        for name, value in list(vars(cls).items()):
+            if isinstance(value, bpy._PropertyDefinition):
+                setattr(cls, name, value.default)
+    return package
+
+
+def _generate_operator(**kwargs):
+    from .generate import generate_rig
+    generate_rig(bpy.context, bpy.context.object)
+    return {'FINISHED'}
+
+
+bpy.ops.pose = getattr(bpy.ops, 'pose', None) or type(bpy.ops)()
+bpy.ops.pose.rigify_generate = _generate_operator
@@ -0,0 +1,107 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+from .base_rig import GenerateCallbackHost
+
+
+class SingletonPluginMetaclass(type):
+    """Returns the existing plugin instance of the generator instead of a new one."""
+
+    def __call__(cls, generator):
+        plugin = generator.plugin_map.get(cls)
+        if plugin is None:
+            plugin = super().__call__(generator)
+            generator.register_plugin(plugin)
+        return plugin
+
+
+class GeneratorPlugin(GenerateCallbackHost, metaclass=SingletonPluginMetaclass):
+    """Singleton per generator, runs its stage methods after all rigs."""
+
+    priority = 0
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.obj = generator.obj
+
+    def invoke_stage(self, name):
+        method = getattr(self, name, None)
+        if method is not None:
+            method()
+
+
+class BaseGenerator:
+    instance = None
+
+    def __init__(self, context, metarig):
+        self.context = context
+        self.scene = context.scene
+        self.view_layer = context.view_layer
+        self.metarig = metarig
+        self.obj = None
+        self.script = None
+        self.widget_collection = None
+        self.old_widget_table = {}
+        self.new_widget_table = {}
+        self.rig_list = []
+        self.plugin_list = []
+        self.plugin_map = {}
+        self.stage = None
+
+    def register_plugin(self, plugin):
+        self.plugin_map[type(plugin)] = plugin
+        self.plugin_list.append(plugin)
+        self.plugin_list.sort(key=lambda p: -p.priority)
+
+    def _run_stage(self, name):
+        self.stage = name
+        for rig in self.rig_list:
+            rig.invoke_stage(name)
+        for plugin in list(self.plugin_list):
+            plugin.invoke_stage(name)
+        self.stage = None
+
+    def invoke_initialize(self):
+        self._run_stage('initialize')
+
+    def invoke_prepare_bones(self):
+        self._run_stage('prepare_bones')
+
+    def invoke_generate_bones(self):
+        self._run_stage('generate_bones')
+
+    def invoke_parent_bones(self):
+        self._run_stage('parent_bones')
+
+    def invoke_configure_bones(self):
+        self._run_stage('configure_bones')
+
+    def invoke_preapply_bones(self):
+        self._run_stage('preapply_bones')
+
+    def invoke_apply_bones(self):
+        self._run_stage('apply_bones')
+
+    def invoke_rig_bones(self):
+        self._run_stage('rig_bones')
+
+    def invoke_generate_widgets(self):
+        self._run_stage('generate_widgets')
+
+    def invoke_finalize(self):
+        self._run_stage('finalize')
@@ -0,0 +1,134 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+
+from .utils.errors import MetarigError
+from .utils.bones import copy_bone, copy_bone_properties
+
+STAGES = (
+    'initialize', 'prepare_bones', 'generate_bones', 'parent_bones', 'configure_bones',
+    'preapply_bones', 'apply_bones', 'rig_bones', 'generate_widgets', 'finalize',
+)
+
+
+class RigifyParameterCollector:
+    """Receives add_parameters() definitions and turns them into defaults."""
+
+    def __setattr__(self, name, definition):
+        bpy.RigifyParameters.defaults[name] = definition.default
+
+
+class _Stage:
+    pass
+
+
+def _stage_decorator(name):
+    def decorator(method):
+        method._rigify_stage = name
+        return method
+    return decorator
+
+
+stage = _Stage()
+for _name in STAGES:
+    setattr(stage, _name, _stage_decorator(_name))
+
+
+class GenerateCallbackHost:
+    """Runs plain stage methods and all methods decorated for the stage."""
+
+    def invoke_stage(self, name):
+        plain = getattr(type(self), name, None)
+        if plain is not None and not hasattr(plain, '_rigify_stage'):
+            getattr(self, name)()
+        for method in self.stage_methods(name):
+            method(self)
+
+    @classmethod
+    def stage_methods(cls, name):
+        methods = {}
+        for klass in reversed(cls.__mro__):
+            for attr, value in vars(klass).items():
+                if getattr(value, '_rigify_stage', None) == name:
+                    methods[attr] = value
+        return list(methods.values())
+
+
+class BoneDict(dict):
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+class BaseRig(GenerateCallbackHost):
+    def __init__(self, generator, pose_bone):
+        self.generator = generator
+        self.obj = generator.obj
+        self.script = generator.script
+        self.base_bone = pose_bone.name
+        self.params = pose_bone.rigify_parameters
+        self.rigify_parent = None
+        self.rigify_children = []
+        self.bones = BoneDict(org=self.find_org_bones(pose_bone))
+
+    def find_org_bones(self, pose_bone):
+        return pose_bone.name
+
+    def initialize(self):
+        pass
+
+    @classmethod
+    def add_parameters(cls, params):
+        pass
+
+    @classmethod
+    def parameters_ui(cls, layout, params):
+        pass
+
+    def raise_error(self, message, *args):
+        raise MetarigError(f"RIGIFY ERROR: Bone '{self.base_bone}': " + message.format(*args))
+
+    def get_bone(self, name):
+        return self.obj.data.edit_bones[name]
+
+    def copy_bone(self, bone_name, new_name='', *, parent=False, inherit_scale=False, bbone=False, length=None,
+                  scale=None):
+        return copy_bone(self.obj, bone_name, new_name, parent=parent, length=length, scale=scale)
+
+    def copy_bone_properties(self, src_name, tgt_name, **kwargs):
+        copy_bone_properties(self.obj, src_name, tgt_name, **kwargs)
+
+    def set_bone_parent(self, bone_name, parent_name, use_connect=False, inherit_scale=None):
+        bone = self.obj.data.edit_bones[bone_name]
+        bone.parent = self.obj.data.edit_bones[parent_name] if parent_name else None
+        bone.use_connect = use_connect
+
+    def make_constraint(self, bone, con_type, subtarget=None, *, insert_index=None, **options):
+        constraint = self.obj.pose.bones[bone].constraints.new(con_type)
+        if subtarget is not None:
+            constraint.target = self.obj
+            constraint.subtarget = subtarget
+        for key, value in options.items():
+            setattr(constraint, key, value)
+        return constraint
@@ -0,0 +1,120 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import uuid
+
+import bpy
+
+from . import rig_types
+from .base_generate import BaseGenerator
+from .rig_ui_template import ScriptGenerator
+from .utils.errors import MetarigError
+
+ORG_PREFIX = "ORG-"
+
+
+class Generator(BaseGenerator):
+    def create_rig_object(self):
+        metarig = self.metarig
+        obj = getattr(metarig.data, 'rigify_target_rig', None)
+        if obj is None:
+            name = "RIG-" + metarig.name
+            obj = bpy.data.objects.new(name, bpy.data.armatures.new(name))
+            self.scene.collection.objects.link(obj)
+        else:
+            # Like Rigify, regeneration starts from an empty armature without drivers
+            self.old_widget_table = {
+                pose_bone.name: pose_bone.custom_shape for pose_bone in obj.pose.bones if pose_bone.custom_shape
+            }
+            for bone in list(obj.data.bones):
+                obj.data.edit_bones.remove(bone)
+            if obj.animation_data:
+                obj.animation_data.drivers.clear()
+        metarig.data.rigify_target_rig = obj
+        self.obj = obj
+
+    def create_widget_collection(self):
+        name = "WGTS_" + self.obj.name
+        collection = bpy.data.collections.get(name)
+        if collection is None:
+            collection = bpy.data.collections.new(name)
+            self.scene.collection.children.link(collection)
+        self.widget_collection = collection
+
+    def copy_metarig_bones(self):
+        arm = self.obj.data
+        for src in self.metarig.data.bones:
+            bone = arm.edit_bones.new(ORG_PREFIX + src.name)
+            bone.head = list(src.head)
+            bone.tail = list(src.tail)
+            bone.roll = src.roll
+            bone.use_connect = src.use_connect
+        for src in self.metarig.data.bones:
+            if src.parent:
+                arm.edit_bones[ORG_PREFIX + src.name].parent = arm.edit_bones[ORG_PREFIX + src.parent.name]
+        for src in self.metarig.pose.bones:
+            pose_bone = self.obj.pose.bones[ORG_PREFIX + src.name]
+            pose_bone.rigify_type = src.rigify_type
+            pose_bone.rigify_parameters = bpy.RigifyParameters()
+            pose_bone.rigify_parameters.__dict__.update(vars(src.rigify_parameters))
+
+    def instantiate_rigs(self):
+        for pose_bone in self.obj.pose.bones:
+            rig_type = pose_bone.rigify_type
+            if not rig_type:
+                continue
+            module = rig_types.get(rig_type)
+            if module is None:
+                raise MetarigError(f"Rig type '{rig_type}' is not available")
+            self.rig_list.append(module.Rig(self, pose_bone))
+
+    def assign_widgets(self):
+        for bone_name, widget in self.new_widget_table.items():
+            self.obj.pose.bones[bone_name].custom_shape = widget
+        used = set(self.new_widget_table.values())
+        for widget in set(self.old_widget_table.values()) - used:
+            bpy.data.objects.remove(widget)
+
+    def generate(self):
+        BaseGenerator.instance = self
+        try:
+            self.create_rig_object()
+            self.create_widget_collection()
+            self.copy_metarig_bones()
+            self.script = ScriptGenerator(self)
+            self.instantiate_rigs()
+
+            self.invoke_initialize()
+            self.invoke_prepare_bones()
+            self.invoke_generate_bones()
+            self.invoke_parent_bones()
+            self.invoke_configure_bones()
+            self.invoke_preapply_bones()
+            self.invoke_apply_bones()
+            self.invoke_rig_bones()
+            self.invoke_generate_widgets()
+            self.assign_widgets()
+
+            self.obj.data["rig_id"] = uuid.uuid4().hex[:16]
+            self.invoke_finalize()
+        finally:
+            BaseGenerator.instance = None
+
+
+def generate_rig(context, metarig):
+    Generator(context, metarig).generate()
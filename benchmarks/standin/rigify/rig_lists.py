@@ -0,0 +1,3 @@
+"""Rig types by name, as Rigify lists them once the feature set is loaded."""
+
+rigs = {}
@@ -0,0 +1,72 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+
+from .base_generate import GeneratorPlugin
+
+UI_HEADER = '''import bpy
+import math
+
+rig_id = "%s"
+'''
+
+
+class PanelLayout:
+    """Only here so rigs can import it."""
+
+    def __init__(self, parent=None, index=0):
+        self.parent = parent
+        self.index = index
+
+
+class ScriptGenerator(GeneratorPlugin):
+    """Collects the rig UI script and runs it after generation, like Rigify."""
+
+    priority = -100
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.utilities = []
+        self.classes = []
+        self.panel_code = []
+
+    def add_utilities(self, lines):
+        for line in lines:
+            if line not in self.utilities:
+                self.utilities.append(line)
+
+    def register_classes(self, names):
+        for name in names:
+            if name not in self.classes:
+                self.classes.append(name)
+
+    def add_panel_code(self, lines):
+        self.panel_code.extend(lines)
+
+    def finalize(self):
+        rig_id = self.obj.data["rig_id"]
+        script = UI_HEADER % rig_id + "\n".join(self.utilities)
+        text = bpy.data.texts.get("rig_ui.py") or bpy.data.texts.new("rig_ui.py")
+        text.body = script
+        namespace = {'__name__': 'rig_ui'}
+        exec(compile(script, "rig_ui.py", 'exec'), namespace)
+        for name in self.classes:
+            bpy.utils.register_class(namespace[name])
+        # Stand-in only, lets benchmarks reach the functions of the script
+        text._namespace = namespace
@@ -0,0 +1,69 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+
+def copy_bone(obj, bone_name, assign_name='', *, parent=False, length=None, scale=None):
+    """Duplicates the edit bone and returns the name of the copy."""
+    edit_bones = obj.data.edit_bones
+    src = edit_bones[bone_name]
+    bone = edit_bones.new(assign_name or bone_name)
+    bone.head = list(src.head)
+    bone.tail = list(src.tail)
+    bone.roll = src.roll
+    if parent:
+        bone.parent = src.parent
+        bone.use_connect = src.use_connect
+    if length is not None or scale is not None:
+        direction = [t - h for h, t in zip(bone.head, bone.tail)]
+        factor = (length / (src.length or 1.0)) if length is not None else scale
+        bone.tail = [h + d * factor for h, d in zip(bone.head, direction)]
+    return bone.name
+
+
+def copy_bone_properties(obj, src_name, tgt_name, *, props=True, ui_controls=None, **kwargs):
+    """Copies the transform locks and custom properties of a pose bone."""
+    src = obj.pose.bones[src_name]
+    tgt = obj.pose.bones[tgt_name]
+    tgt.lock_location = list(src.lock_location)
+    tgt.lock_rotation = list(src.lock_rotation)
+    tgt.lock_rotation_w = src.lock_rotation_w
+    tgt.lock_rotations_4d = src.lock_rotations_4d
+    tgt.lock_scale = list(src.lock_scale)
+    if props:
+        for key in src.keys():
+            tgt[key] = src[key]
+
+
+def put_bone(obj, bone_name, pos, *, matrix=None, length=None, scale=None):
+    bone = obj.data.edit_bones[bone_name]
+    offset = [p - h for p, h in zip(pos, bone.head)]
+    bone.head = [h + o for h, o in zip(bone.head, offset)]
+    bone.tail = [t + o for t, o in zip(bone.tail, offset)]
+
+
+def align_bone_orientation(obj, bone_name, target_bone_name):
+    bone = obj.data.edit_bones[bone_name]
+    target = obj.data.edit_bones[target_bone_name]
+    length = bone.length
+    direction = [(t - h) / (target.length or 1.0) for h, t in zip(target.head, target.tail)]
+    bone.tail = [h + d * length for h, d in zip(bone.head, direction)]
+    bone.roll = target.roll
+
+
+def set_bone_widget_transform(obj, bone_name, transform_bone, use_size=True, scale=1.0, target_size=False):
+    obj.pose.bones[bone_name].custom_shape_transform = obj.pose.bones[transform_bone] if transform_bone else None
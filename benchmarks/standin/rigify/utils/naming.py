@@ -0,0 +1,37 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import re
+
+PREFIXES = {'org': "ORG-", 'mch': "MCH-", 'def': "DEF-", 'ctrl': ""}
+PREFIX_RE = re.compile(r"^(ORG|MCH|DEF)-")
+SIDE_RE = re.compile(r"^(.*?)([._-][LR])?$")
+
+
+def strip_prefix(name):
+    return PREFIX_RE.sub("", name)
+
+
+def strip_org(name):
+    return name[len("ORG-"):] if name.startswith("ORG-") else name
+
+
+def make_derived_name(name, subtype, suffix=None):
+    """Replaces the prefix of the name by the one of the subtype, adding the suffix before the side."""
+    base, side = SIDE_RE.match(strip_prefix(name)).groups()
+    return PREFIXES[subtype] + base + (suffix or "") + (side or "")
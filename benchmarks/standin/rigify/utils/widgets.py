@@ -0,0 +1,51 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+
+from ..base_generate import BaseGenerator
+
+WGT_PREFIX = "WGT-"
+
+
+def create_widget(rig, bone_name, bone_transform_name=None, *, widget_name=None, widget_force_new=False,
+                  subsurf=0):
+    """
+    Creates an empty widget object for the bone and registers it with the generator.
+    Returns None if an existing widget was reused instead.
+    """
+    generator = BaseGenerator.instance
+    obj_name = widget_name or WGT_PREFIX + rig.name + '_' + bone_name
+
+    if not widget_force_new:
+        obj = generator.old_widget_table.get(bone_name)
+        if obj is not None:
+            generator.new_widget_table[bone_name] = obj
+            return None
+
+    mesh = bpy.data.meshes.new(obj_name)
+    obj = bpy.data.objects.new(obj_name, mesh)
+    generator.widget_collection.objects.link(obj)
+    generator.new_widget_table[bone_name] = obj
+    return obj
+
+
+def adjust_widget_transform_mesh(obj, matrix, local=None):
+    """Transforms the widget mesh by the matrix."""
+    if obj is not None:
+        obj.data.transform(matrix)
@@ -0,0 +1,45 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import math
+
+from .widgets import create_widget
+
+
+def create_circle_widget(rig, bone_name, radius=1.0, head_tail=0.0, radius_x=None, head_tail_x=None,
+                         with_line=False, bone_transform_name=None):
+    obj = create_widget(rig, bone_name, bone_transform_name)
+    if obj is not None:
+        steps = 32
+        length = rig.pose.bones[bone_name].length
+        verts = [((radius_x or radius) * math.cos(i * 2 * math.pi / steps), head_tail * length,
+                  radius * math.sin(i * 2 * math.pi / steps)) for i in range(steps)]
+        edges = [(i, (i + 1) % steps) for i in range(steps)]
+        obj.data.from_pydata(verts, edges, [])
+        obj.data.update()
+    return obj
+
+
+def create_cube_widget(rig, bone_name, radius=0.5, bone_transform_name=None):
+    obj = create_widget(rig, bone_name, bone_transform_name)
+    if obj is not None:
+        verts = [(x * radius, y * radius, z * radius) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+        edges = [(0, 1), (2, 3), (4, 5), (6, 7), (0, 2), (1, 3), (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7)]
+        obj.data.from_pydata(verts, edges, [])
+        obj.data.update()
+    return obj
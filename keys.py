@@ -0,0 +1,39 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+"""
+Names of the properties the add-on UI reads. Kept apart from the modules that
+use them, so enabling the add-on imports neither NumPy nor the generator.
+"""
+
+# Armature property of the metarig that turns profiling on
+PROFILE_PROP = "sixbird_profile_generation"
+# ID property of the metarig with the summary of the last profiled generation
+PROFILE_SUMMARY_KEY = "sixbird_profile_summary"
+# Armature property of the metarig that adds the live profiler to the rig UI
+LIVE_PROFILE_PROP = "sixbird_live_profile"
+
+# ID property of the metarig with the result of the last check
+CHECK_KEY = "sixbird_check"
+
+# ID property of the generated armature describing every output property by data path
+OUTPUTS_KEY = "sixbird_outputs"
+
+# ID properties of the generated armature
+RIG_UID_KEY = "sixbird_rig_uid"
+GC_REPORT_KEY = "sixbird_gc_report"
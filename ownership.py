@@ -0,0 +1,242 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import uuid
+from rigify.base_generate import GeneratorPlugin
+
+from .keys import RIG_UID_KEY, GC_REPORT_KEY
+
+# ID property on datablocks with the owner tag, see owner_tag()
+OWNER_KEY = "sixbird_owner"
+
+# Owner tag of cached meshes used by any number of rigs, kept while they have users
+SHARED_OWNER = "shared"
+
+# ID properties of the generated armature
+GENERATION_KEY = "sixbird_generation"
+# Custom properties by bone name and property name, the rig object itself is ""
+OWNED_PROPERTIES_KEY = "sixbird_owned_properties"
+
+# ID property on anything with drivers, mapping data paths to owner tags
+OWNED_DRIVERS_KEY = "sixbird_owned_drivers"
+
+# Rough sizes in bytes of what a purge frees, for the report
+ID_SIZE = 1024
+DRIVER_SIZE = 512
+VARIABLE_SIZE = 256
+PROPERTY_SIZE = 128
+
+
+def owner_tag(uid, generation, base_bone):
+    return f"{uid}:{generation}:{base_bone}"
+
+
+def parse_owner_tag(tag):
+    uid, _, rest = tag.partition(':')
+    generation, _, base_bone = rest.partition(':')
+    return uid, int(generation or 0), base_bone
+
+
+def live_generations():
+    """Current generation of every generated rig that still exists, by rig uid."""
+    return {arm[RIG_UID_KEY]: arm.get(GENERATION_KEY, 0)
+            for arm in bpy.data.armatures if arm.users and RIG_UID_KEY in arm}
+
+
+def is_live(tag, generations):
+    """
+    A tag is live when its rig still exists and set it in its latest generation.
+    Shared datablocks are only removed once nothing uses them.
+    """
+    if tag == SHARED_OWNER:
+        return True
+    uid, generation, _ = parse_owner_tag(tag)
+    return generations.get(uid) == generation
+
+
+def estimate_size(id_block):
+    size = ID_SIZE
+    if isinstance(id_block, bpy.types.Mesh):
+        size += (len(id_block.vertices) * 12 + len(id_block.edges) * 8
+                 + len(id_block.loops) * 8 + len(id_block.polygons) * 12)
+    if id_block.animation_data:
+        size += sum(estimate_driver_size(fcurve) for fcurve in id_block.animation_data.drivers)
+    return size
+
+
+def estimate_driver_size(fcurve):
+    return DRIVER_SIZE + VARIABLE_SIZE * len(fcurve.driver.variables)
+
+
+##############################
+# Garbage collection
+
+def new_report():
+    return {'datablocks': 0, 'drivers': 0, 'properties': 0, 'bytes': 0}
+
+
+def in_scope(tag, uid):
+    return uid is None or tag == SHARED_OWNER or parse_owner_tag(tag)[0] == uid
+
+
+def collect_garbage(uid=None):
+    """
+    Removes the datablocks, drivers and custom properties tagged by 6 Bird rigs
+    that no longer own them. With a uid only the tags of that rig are checked.
+    Returns what was removed and roughly how many bytes that freed.
+    """
+    report = new_report()
+    generations = live_generations()
+
+    # Widgets a live rig still shows are kept whatever their tag says
+    custom_shapes = {pose_bone.custom_shape for obj in bpy.data.objects
+                     if obj.type == 'ARMATURE' and obj.pose for pose_bone in obj.pose.bones}
+    dead_objects = [obj for obj in bpy.data.objects
+                    if OWNER_KEY in obj and in_scope(obj[OWNER_KEY], uid) and obj not in custom_shapes
+                    and not is_live(obj[OWNER_KEY], generations)]
+    for obj in dead_objects:
+        report['datablocks'] += 1
+        report['bytes'] += estimate_size(obj)
+        bpy.data.objects.remove(obj)
+
+    # Meshes go once nothing uses them, widget meshes of live rigs included
+    dead_meshes = [mesh for mesh in bpy.data.meshes
+                   if OWNER_KEY in mesh and in_scope(mesh[OWNER_KEY], uid) and not mesh.users
+                   and not mesh.use_fake_user]
+    for mesh in dead_meshes:
+        report['datablocks'] += 1
+        report['bytes'] += estimate_size(mesh)
+        bpy.data.meshes.remove(mesh)
+
+    for datablocks in (bpy.data.objects, bpy.data.shape_keys):
+        for id_block in datablocks:
+            if OWNED_DRIVERS_KEY in id_block:
+                collect_drivers(id_block, uid, generations, report)
+
+    for arm in bpy.data.armatures:
+        if OWNED_PROPERTIES_KEY in arm:
+            for obj in bpy.data.objects:
+                if obj.data == arm:
+                    collect_properties(obj, uid, generations, report)
+    return report
+
+
+def collect_drivers(id_block, uid, generations, report):
+    owned = dict(id_block[OWNED_DRIVERS_KEY])
+    drivers = id_block.animation_data.drivers if id_block.animation_data else []
+    for data_path, tag in list(owned.items()):
+        if not in_scope(tag, uid) or is_live(tag, generations):
+            continue
+        del owned[data_path]
+        fcurve = drivers.find(data_path) if drivers else None
+        if fcurve:
+            report['drivers'] += 1
+            report['bytes'] += estimate_driver_size(fcurve)
+            drivers.remove(fcurve)
+    if owned:
+        id_block[OWNED_DRIVERS_KEY] = owned
+    else:
+        del id_block[OWNED_DRIVERS_KEY]
+
+
+def collect_properties(obj, uid, generations, report):
+    owned = {bone_name: dict(props) for bone_name, props in obj.data[OWNED_PROPERTIES_KEY].items()}
+    for bone_name, props in owned.items():
+        owner = obj.pose.bones.get(bone_name) if bone_name else obj
+        for prop_name, tag in list(props.items()):
+            if not in_scope(tag, uid) or is_live(tag, generations):
+                continue
+            del props[prop_name]
+            if owner and prop_name in owner:
+                report['properties'] += 1
+                report['bytes'] += PROPERTY_SIZE
+                del owner[prop_name]
+    owned = {bone_name: props for bone_name, props in owned.items() if props}
+    if owned:
+        obj.data[OWNED_PROPERTIES_KEY] = owned
+    else:
+        del obj.data[OWNED_PROPERTIES_KEY]
+
+
+##############################
+# Tagging
+
+class OwnershipRegistry(GeneratorPlugin):
+    """
+    Tags everything 6 Bird rigs create with the rig instance that owns it and
+    the generation it was made in, then removes what the previous generations
+    of the rig left behind.
+    """
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        arm = self.obj.data
+        if RIG_UID_KEY not in arm:
+            arm[RIG_UID_KEY] = uuid.uuid4().hex
+        self.uid = arm[RIG_UID_KEY]
+        self.generation = arm.get(GENERATION_KEY, 0) + 1
+        self.rigs = []
+        self.drivers = {}
+        self.properties = {}
+
+    def owner(self, rig):
+        return owner_tag(self.uid, self.generation, rig.base_bone)
+
+    def add_rig(self, rig):
+        """Registers a rig whose control widgets are tagged once they are assigned."""
+        self.rigs.append(rig)
+
+    def add_datablock(self, rig, id_block):
+        id_block[OWNER_KEY] = self.owner(rig)
+
+    def add_driver(self, rig, id_block, data_path):
+        self.drivers.setdefault(id_block, {})[data_path] = self.owner(rig)
+
+    def add_property(self, rig, bone_name, prop_name):
+        """Tags a custom property of a pose bone, or of the rig object when bone_name is None."""
+        self.properties.setdefault(bone_name or "", {})[prop_name] = self.owner(rig)
+
+    def tag_widgets(self, rig):
+        widget_table = self.generator.new_widget_table
+        for bone_name in rig.bones.ctrl:
+            widget = widget_table.get(bone_name)
+            if widget is None or widget.library:
+                continue
+            self.add_datablock(rig, widget)
+            if widget.data.get(OWNER_KEY) != SHARED_OWNER:
+                self.add_datablock(rig, widget.data)
+
+    def finalize(self):
+        for rig in self.rigs:
+            self.tag_widgets(rig)
+
+        for id_block, drivers in self.drivers.items():
+            old = id_block.get(OWNED_DRIVERS_KEY)
+            id_block[OWNED_DRIVERS_KEY] = {**(dict(old) if old else {}), **drivers}
+
+        arm = self.obj.data
+        old = arm.get(OWNED_PROPERTIES_KEY)
+        owned = {bone_name: dict(props) for bone_name, props in old.items()} if old else {}
+        for bone_name, props in self.properties.items():
+            owned.setdefault(bone_name, {}).update(props)
+        if owned:
+            arm[OWNED_PROPERTIES_KEY] = owned
+        arm[GENERATION_KEY] = self.generation
+
+        arm[GC_REPORT_KEY] = collect_garbage(self.uid)
@@ -0,0 +1,314 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import functools
+import json
+import os
+import time
+from rigify.base_generate import GeneratorPlugin
+
+from .keys import PROFILE_PROP, PROFILE_SUMMARY_KEY, LIVE_PROFILE_PROP
+
+
+DATABLOCK_TYPES = ('objects', 'meshes', 'curves', 'collections', 'actions', 'texts')
+
+
+def count_datablocks():
+    return sum(len(getattr(bpy.data, name)) for name in DATABLOCK_TYPES)
+
+
+def get_profiler(generator):
+    """Returns the generation profiler if the metarig has profiling enabled, otherwise None."""
+    if getattr(generator.metarig.data, PROFILE_PROP, False):
+        return GenerationProfiler(generator)
+    return None
+
+
+def add_live_profiler(generator):
+    """Adds the live profiler to the rig UI script if the metarig asks for it."""
+    if getattr(generator.metarig.data, LIVE_PROFILE_PROP, False):
+        LiveProfiler(generator)
+
+
+def profile_stage(method):
+    """
+    Records the wall time, net number of created datablocks and added drivers of
+    a stage method when the owner has a profiler. Goes below the @stage decorator.
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        if self.profiler is None:
+            return method(self)
+        return self.profiler.measure(self, method)
+    return wrapper
+
+
+def report_path(metarig):
+    """The JSON report goes next to the .blend, or to the temp directory if it isn't saved."""
+    name = bpy.path.clean_name(metarig.name) + "_6bird_profile.json"
+    if bpy.data.filepath:
+        blend_name = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
+        return os.path.join(os.path.dirname(bpy.data.filepath), blend_name + "_" + name)
+    return os.path.join(bpy.app.tempdir, name)
+
+
+class GenerationProfiler(GeneratorPlugin):
+    """Collects the measurements of all profiled stage methods and writes the report."""
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.records = []
+
+    def measure(self, owner, method):
+        obj = self.generator.obj
+        datablocks = count_datablocks()
+        drivers = len(obj.animation_data.drivers) if obj.animation_data else 0
+        start = time.perf_counter()
+        try:
+            return method(owner)
+        finally:
+            elapsed = time.perf_counter() - start
+            new_drivers = obj.animation_data.drivers[drivers:] if obj.animation_data else []
+            self.records.append({
+                # Plugins have no base bone, their work is counted for their rig type only
+                'instance': getattr(owner, 'base_bone', None),
+                'owner': type(owner).__name__,
+                'rig_type': type(owner).__module__.rpartition('.')[2].lstrip('_'),
+                'method': method.__name__,
+                'time': elapsed,
+                'datablocks': count_datablocks() - datablocks,
+                'drivers': len(new_drivers),
+                'variables': sum(len(fcurve.driver.variables) for fcurve in new_drivers),
+            })
+
+    def summarize(self):
+        rig_types = {}
+        for record in self.records:
+            stats = rig_types.setdefault(record['rig_type'], {
+                'instances': set(), 'time': 0.0, 'datablocks': 0, 'drivers': 0, 'variables': 0,
+            })
+            if record['instance'] is not None:
+                stats['instances'].add(record['instance'])
+            for key in ('time', 'datablocks', 'drivers', 'variables'):
+                stats[key] += record[key]
+        for stats in rig_types.values():
+            stats['instances'] = len(stats['instances'])
+        return rig_types
+
+    def finalize(self):
+        metarig = self.generator.metarig
+        rig_types = self.summarize()
+        path = report_path(metarig)
+        report = {
+            'metarig': metarig.name,
+            'rig': self.obj.name,
+            'blend': bpy.data.filepath,
+            'time': sum(stats['time'] for stats in rig_types.values()),
+            'rig_types': rig_types,
+            'records': self.records,
+        }
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+
+        # Shown in the Rigify panel of the metarig
+        metarig.data[PROFILE_SUMMARY_KEY] = {
+            'path': path,
+            'time': report['time'],
+            'rig_types': rig_types,
+        }
+
+
+SCRIPT_UTILITIES_LIVE_PROFILE = '''
+# Live profiler of the 6 Bird controls. While it runs, every Python output driver
+# calls a timed copy of its expression and the switch selection handler is wrapped
+# in a timer, each sample attributed to the control it belongs to.
+import csv
+import time
+
+SIXBIRD_PROFILE_DRIVER = "sixbird_profiled_driver_" + rig_id
+SIXBIRD_PROFILE_MAX_SAMPLES = 1000000
+SIXBIRD_PROFILE_TOP = 10
+
+sixbird_profile = {
+    'running': False,
+    'samples': [],      # (frame, control, kind, seconds)
+    'totals': {},       # (control, kind) -> [calls, seconds]
+    'expressions': [],  # (data path, original expression)
+    'code': [],         # (control, compiled expression)
+    'handler': None,
+}
+
+def sixbird_profile_sample(frame, control, kind, seconds):
+    totals = sixbird_profile['totals'].setdefault((control, kind), [0, 0.0])
+    totals[0] += 1
+    totals[1] += seconds
+    samples = sixbird_profile['samples']
+    if len(samples) < SIXBIRD_PROFILE_MAX_SAMPLES:
+        samples.append((frame, control, kind, seconds))
+
+def sixbird_profiled_driver(index, frame, **variables):
+    control, code = sixbird_profile['code'][index]
+    start = time.perf_counter()
+    value = eval(code, bpy.app.driver_namespace, variables)
+    sixbird_profile_sample(frame, control, 'DRIVER', time.perf_counter() - start)
+    return value
+
+def sixbird_profile_rigs():
+    return [obj for obj in bpy.data.objects if obj.type == 'ARMATURE' and obj.data.get("rig_id") == rig_id]
+
+def wrap_switch_dispatcher():
+    global toggle_bones_on_select
+    original = globals().get('toggle_bones_on_select')
+    if original is None:
+        return
+
+    def profiled_toggle_bones_on_select(scene, depsgraph=None):
+        start = time.perf_counter()
+        try:
+            original(scene, depsgraph)
+        finally:
+            seconds = time.perf_counter() - start
+            obj = bpy.context.object
+            active = obj.data.bones.active if obj and obj.type == 'ARMATURE' else None
+            control = active.name if active and active.name in SWITCH_TABLE else "(other updates)"
+            sixbird_profile_sample(scene.frame_current, control, 'SWITCH_HANDLER', seconds)
+
+    # The playback guard and the next registration find the wrapper by name and tag
+    profiled_toggle_bones_on_select.switch_rig_id = rig_id
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if original in handlers:
+        handlers[handlers.index(original)] = profiled_toggle_bones_on_select
+    toggle_bones_on_select = profiled_toggle_bones_on_select
+    sixbird_profile['handler'] = original
+
+def unwrap_switch_dispatcher():
+    global toggle_bones_on_select
+    original = sixbird_profile['handler']
+    if original is None:
+        return
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if toggle_bones_on_select in handlers:
+        handlers[handlers.index(toggle_bones_on_select)] = original
+    toggle_bones_on_select = original
+    sixbird_profile['handler'] = None
+
+def start_sixbird_profile(obj):
+    sixbird_profile.update(running=True, samples=[], totals={}, expressions=[], code=[])
+    outputs = obj.data.get("sixbird_outputs", {})
+    drivers = obj.animation_data.drivers if obj.animation_data else None
+    for data_path, output in outputs.items():
+        fcurve = drivers.find(data_path) if drivers else None
+        if fcurve is None:
+            continue
+        driver = fcurve.driver
+        # Simple expressions are evaluated without Python
+        if driver.type != 'SCRIPTED' or driver.use_self or driver.is_simple_expression:
+            continue
+        index = len(sixbird_profile['code'])
+        sixbird_profile['code'].append((output['bone'], compile(driver.expression, data_path, 'eval')))
+        sixbird_profile['expressions'].append((data_path, driver.expression))
+        args = [str(index), "frame"] + [f"{var.name}={var.name}" for var in driver.variables]
+        driver.expression = f"{SIXBIRD_PROFILE_DRIVER}({', '.join(args)})"
+    bpy.app.driver_namespace[SIXBIRD_PROFILE_DRIVER] = sixbird_profiled_driver
+    wrap_switch_dispatcher()
+
+def stop_sixbird_profile(*args):
+    if not sixbird_profile['running']:
+        return
+    for obj in sixbird_profile_rigs():
+        drivers = obj.animation_data.drivers if obj.animation_data else None
+        for data_path, expression in sixbird_profile['expressions']:
+            fcurve = drivers.find(data_path) if drivers else None
+            if fcurve:
+                fcurve.driver.expression = expression
+    bpy.app.driver_namespace.pop(SIXBIRD_PROFILE_DRIVER, None)
+    unwrap_switch_dispatcher()
+    sixbird_profile['running'] = False
+
+def draw_sixbird_profile(layout):
+    running = sixbird_profile['running']
+    row = layout.row(align=True)
+    row.operator(SIXBIRD_OT_live_profile.bl_idname, icon='PAUSE' if running else 'PLAY',
+                 text="Stop 6 Bird Profile" if running else "Start 6 Bird Profile")
+    if sixbird_profile['samples']:
+        row.operator(SIXBIRD_OT_live_profile_export.bl_idname, text="", icon='EXPORT')
+    totals = sorted(sixbird_profile['totals'].items(), key=lambda item: -item[1][1])
+    col = layout.column(align=True)
+    for (control, kind), (calls, seconds) in totals[:SIXBIRD_PROFILE_TOP]:
+        source = "driver" if kind == 'DRIVER' else "switch handler"
+        col.label(text=f"{control} {source}: {seconds * 1000:.2f} ms, {calls} calls")
+
+class SIXBIRD_OT_live_profile(bpy.types.Operator):
+    """Start or stop timing the Python drivers and the switch handler of the 6 Bird controls"""
+    bl_idname = "pose.sixbird_live_profile_" + rig_id
+    bl_label = "6 Bird Live Profile"
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'ARMATURE' and obj.data.get("rig_id") == rig_id
+
+    def execute(self, context):
+        if sixbird_profile['running']:
+            stop_sixbird_profile()
+        else:
+            start_sixbird_profile(context.active_object)
+        return {'FINISHED'}
+
+class SIXBIRD_OT_live_profile_export(bpy.types.Operator):
+    """Write every sample of the 6 Bird live profile to a CSV file"""
+    bl_idname = "pose.sixbird_live_profile_export_" + rig_id
+    bl_label = "Export 6 Bird Profile"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.abspath("//6bird_live_profile.csv") if bpy.data.filepath else "6bird_live_profile.csv"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        with open(self.filepath, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame", "control", "kind", "seconds"))
+            writer.writerows(sixbird_profile['samples'])
+        self.report({'INFO'}, f"Exported {len(sixbird_profile['samples'])} samples")
+        return {'FINISHED'}
+
+# The wrapped expressions only work while this script runs, so they are never saved
+def register_sixbird_profile_guard():
+    handlers = bpy.app.handlers.save_pre
+    for handler in [h for h in handlers if getattr(h, "switch_rig_id", None) == rig_id]:
+        handlers.remove(handler)
+    stop_sixbird_profile.switch_rig_id = rig_id
+    handlers.append(stop_sixbird_profile)
+
+register_sixbird_profile_guard()
+'''
+
+
+class LiveProfiler(GeneratorPlugin):
+    """Adds the live profiler of the 6 Bird controls to the rig UI."""
+
+    def finalize(self):
+        script = self.generator.script
+        script.add_utilities([SCRIPT_UTILITIES_LIVE_PROFILE])
+        script.register_classes(['SIXBIRD_OT_live_profile', 'SIXBIRD_OT_live_profile_export'])
+        script.add_panel_code(['draw_sixbird_profile(layout)'])
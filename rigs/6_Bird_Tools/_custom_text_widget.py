@@ -0,0 +1,179 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import copy
+from itertools import count
+from rigify.base_rig import stage, BaseRig
+from rigify.utils.rig import connected_children_names
+from rigify.utils.misc import map_list
+from rigify.utils.naming import make_derived_name, strip_org
+from rigify.utils.widgets import create_widget
+from rigify.base_generate import GeneratorPlugin
+
+from ._text_mesh import TextSettings, text_widget_key, get_cached_text_mesh, build_text_meshes, estimate_text_vertices
+from ._glyph_cache import can_use_glyph_cache, build_glyph_meshes
+from ._widgets import discard_old_widget
+from ._fingerprint import RigFingerprints
+from ...profiling import get_profiler, profile_stage
+from ...ownership import OwnershipRegistry
+
+class Rig(BaseRig):
+    """A rig that generates a widget based on text."""
+
+    def find_org_bones(self, bone):
+        return [bone.name] + connected_children_names(self.obj, bone.name)
+
+        text_input: str
+        text_align_x: str
+        text_align_y: str
+        text_size: float
+        text_extrude: float
+        text_glyph_cache: bool
+        text_outline: bool
+        text_resolution: int
+        text_max_vertices: int
+
+    def initialize(self):
+        self.text_input = self.params.text_input
+        self.text_align_x = self.params.text_align_x
+        self.text_align_y = self.params.text_align_y
+        self.text_size = self.params.text_size
+        self.text_extrude = self.params.text_extrude
+        self.text_glyph_cache = self.params.text_glyph_cache
+        self.text_outline = self.params.text_outline
+        self.text_resolution = self.params.text_resolution
+        self.text_max_vertices = self.params.text_max_vertices
+        self.widget_builder = TextWidgetBuilder(self.generator)
+        self.profiler = get_profiler(self.generator)
+        self.ownership = OwnershipRegistry(self.generator)
+        self.ownership.add_rig(self)
+        self.unchanged = RigFingerprints(self.generator).is_unchanged(
+            self, self.text_input, self.text_align_x, self.text_align_y, self.text_size, self.text_extrude,
+            self.text_glyph_cache, self.text_outline, self.text_resolution, self.text_max_vertices)
+
+    @stage.generate_bones
+    @profile_stage
+    def make_control_bones(self):
+        org = self.bones.org
+        self.bones.ctrl = map_list(self.make_control_bone, count(0), org)
+
+    def make_control_bone(self, i, org):
+        return self.copy_bone(org, make_derived_name(org, 'ctrl'), parent=True)
+
+    ##############################
+    # UI
+
+    @classmethod
+    def parameters_ui(cls, layout, params):
+        layout.row().prop(params, "text_input", text="Text")
+        layout.row().prop(params, "text_size", text="Text Size")
+        layout.row().prop(params, "text_extrude", text="Extrude")
+        layout.row().prop(params, "text_align_x", text="Align X")
+        layout.row().prop(params, "text_align_y", text="Align Y")
+        layout.row().prop(params, "text_glyph_cache", text="Glyph Cache")
+        layout.row().prop(params, "text_resolution", text="Resolution")
+        layout.row().prop(params, "text_outline", text="Outline Only")
+        row = layout.row()
+        row.enabled = params.text_outline
+        row.prop(params, "text_max_vertices", text="Max Vertices")
+        layout.row().label(text=f"Widget Vertices: {params.text_vertex_count}")
+        if over_vertex_budget(params):
+            layout.row().label(text="Over Max Vertices, each outline loop keeps 3", icon='ERROR')
+
+    @classmethod
+    def check_metarig(cls, check, bone_name, params):
+        chain = check.check_chain(bone_name)
+        if len(chain) > 1:
+            check.warning(bone_name, f"Connected children ({', '.join(chain[1:])}) get controls without a widget")
+        if not params.text_input:
+            check.warning(bone_name, "Widget String is empty, the widget shows 'Text' instead")
+        check.add(bones=len(chain))
+
+        settings = TextSettings(params.text_input or "Text", params.text_size, params.text_extrude,
+                                params.text_align_x, params.text_align_y, params.text_glyph_cache,
+                                params.text_resolution, params.text_outline, params.text_max_vertices)
+        check.add_widget(estimate_text_vertices(settings, params.text_vertex_count), text_widget_key(settings))
+        if over_vertex_budget(params):
+            check.warning(bone_name, f"The last widget had {params.text_vertex_count} vertices, more than "
+                                     f"Max Vertices, because each outline loop keeps at least 3")
+
+    @stage.generate_widgets
+    @profile_stage
+    def make_control_widgets(self):
+        # Older versions kept a separate text object next to the widget
+        text_obj_name = self.bones.ctrl[0] + "_text_widget"
+        text_existing_obj = bpy.data.objects.get(text_obj_name)
+        if text_existing_obj:
+            text_curve = text_existing_obj.data
+            for collection in text_existing_obj.users_collection:
+                collection.objects.unlink(text_existing_obj) 
+            bpy.data.objects.remove(text_existing_obj)
+            if text_curve and text_curve.users == 0:
+                bpy.data.curves.remove(text_curve)
+
+        settings = TextSettings(self.text_input or "Text", self.text_size, self.text_extrude,
+                                self.text_align_x, self.text_align_y, self.text_glyph_cache,
+                                self.text_resolution, self.text_outline, self.text_max_vertices)
+        if self.text_outline:
+            settings = settings._replace(extrude=0.0)
+        else:
+            settings = settings._replace(max_vertices=0)
+        if not can_use_glyph_cache(settings):
+            settings = settings._replace(glyph_cache=False)
+        # An unchanged rig keeps its widget object, the builder then finds its mesh cached
+        ctrl = self.bones.ctrl[0]
+        if not self.unchanged:
+            discard_old_widget(ctrl)
+        widget = create_widget(self.obj, ctrl) or self.generator.new_widget_table[ctrl]
+        # The vertex count is shown in the parameters of the metarig bone, not of its ORG copy
+        metarig_bone = self.generator.metarig.pose.bones[strip_org(self.base_bone)]
+        self.widget_builder.add_widget(widget, settings, metarig_bone.rigify_parameters)
+
+
+def over_vertex_budget(params):
+    """Whether the last outline widget went over its vertex budget."""
+    return params.text_outline and 0 < params.text_max_vertices < params.text_vertex_count
+
+
+class TextWidgetBuilder(GeneratorPlugin):
+    """Builds the meshes of all text widgets of the rig in one batch."""
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.widgets = []
+        self.profiler = get_profiler(generator)
+
+    def add_widget(self, widget, settings, params):
+        self.widgets.append((widget, text_widget_key(settings), settings, params))
+
+    @profile_stage
+    def generate_widgets(self):
+        missing = {key: settings for _, key, settings, _ in self.widgets if not get_cached_text_mesh(key)}
+        from_glyphs = {key: settings for key, settings in missing.items() if settings.glyph_cache}
+        from_text = {key: settings for key, settings in missing.items() if not settings.glyph_cache}
+        meshes = build_glyph_meshes(self.generator.context, from_glyphs)
+        meshes.update(build_text_meshes(self.generator.context, from_text))
+
+        for widget, key, settings, params in self.widgets:
+            old_mesh = widget.data
+            widget.data = meshes.get(key) or get_cached_text_mesh(key)
+            if old_mesh.users == 0:
+                bpy.data.meshes.remove(old_mesh)
+            # Shown in the rig parameters of the metarig bone
+            params.text_vertex_count = len(widget.data.vertices)
@@ -0,0 +1,113 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+from collections import namedtuple
+
+ShapeKeyTarget = namedtuple('ShapeKeyTarget', ['object_name', 'key_name', 'output', 'low', 'high'])
+
+
+def parse_shape_key_targets(spec, outputs):
+    """
+    Parses 'Object:Key[@output][=low,high]' items separated by ';'. The output
+    defaults to the first one and the range to 0,1. Raises ValueError.
+    """
+    targets = []
+    for item in spec.split(';'):
+        item = item.strip()
+        if not item:
+            continue
+        target, _, value_range = item.partition('=')
+        object_name, sep, key_name = target.partition(':')
+        if not sep:
+            raise ValueError(f"'{item}' has no ':' between the object and the shape key")
+        key_name, _, output = key_name.partition('@')
+        output = output.strip().upper() or outputs[0]
+        if output not in outputs:
+            raise ValueError(f"'{item}' has no output '{output}', use one of {', '.join(outputs)}")
+        low, high = 0.0, 1.0
+        if value_range.strip():
+            try:
+                low, high = (float(value) for value in value_range.split(','))
+            except ValueError:
+                raise ValueError(f"'{value_range}' is not a low,high range")
+        targets.append(ShapeKeyTarget(object_name.strip(), key_name.strip(), output, low, high))
+    return targets
+
+
+def find_shape_key(target):
+    """Returns the shape key datablock and key block of the target. Raises ValueError."""
+    obj = bpy.data.objects.get(target.object_name)
+    if obj is None or obj.type != 'MESH':
+        raise ValueError(f"no mesh object '{target.object_name}'")
+    key = obj.data.shape_keys
+    key_block = key.key_blocks.get(target.key_name) if key else None
+    if key_block is None:
+        raise ValueError(f"'{target.object_name}' has no shape key '{target.key_name}'")
+    return key, key_block
+
+
+def resolve_shape_key_targets(rig, spec, outputs):
+    """Parses the rig's target spec and returns (target, shape key datablock, key block) tuples."""
+    try:
+        return [(target, *find_shape_key(target)) for target in parse_shape_key_targets(spec, outputs)]
+    except ValueError as error:
+        rig.raise_error("Shape key targets: {}", error)
+
+
+def check_shape_key_targets(check, bone_name, spec, outputs):
+    """Reports what resolve_shape_key_targets() would fail on to a metarig check and counts the drivers."""
+    try:
+        targets = parse_shape_key_targets(spec, outputs)
+        for target in targets:
+            find_shape_key(target)
+    except ValueError as error:
+        check.error(bone_name, f"Shape key targets: {error}")
+        return
+    for target in targets:
+        check.add_shape_key_driver(target.object_name, target.key_name)
+
+
+def remap_expression(value, scale, low, high):
+    """Maps the value expression so that 0 gives low and scale gives high."""
+    return f"{low:.6f} + {(high - low) * scale:.6f} * {value}"
+
+
+def add_shape_key_driver(key, key_block, obj, bone_name, axis, expression):
+    """
+    Drives the shape key straight from the bone's local location on the axis,
+    so it doesn't wait for a custom property driver of the rig.
+    """
+    fcurve = key.driver_add(f'key_blocks["{key_block.name}"].value')
+    driver = fcurve.driver
+    driver.type = 'SCRIPTED'
+    # Regeneration finds the driver from the last time on the shape key
+    for var in list(driver.variables):
+        driver.variables.remove(var)
+
+    var = driver.variables.new()
+    var.name = f"b_{axis}"
+    var.type = 'TRANSFORMS'
+    target = var.targets[0]
+    target.id = obj
+    target.bone_target = bone_name
+    target.transform_type = f"LOC_{axis}"
+    target.transform_space = 'LOCAL_SPACE'
+
+    driver.expression = expression
+    return fcurve
@@ -0,0 +1,65 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import hashlib
+from rigify.base_generate import GeneratorPlugin
+
+# ID property of the generated armature with the fingerprints of the last generation
+FINGERPRINT_KEY = "sixbird_fingerprints"
+# Bump when rig code changes what gets generated from the same input
+FINGERPRINT_VERSION = 1
+
+
+def bone_rest_data(obj, bone_name):
+    bone = obj.data.bones[bone_name]
+    matrix = [value for row in bone.matrix_local for value in row]
+    return (bone.parent.name if bone.parent else "", bone.use_connect, bone.length,
+            *bone.head_local, *bone.tail_local, *matrix)
+
+
+def rig_fingerprint(rig, values):
+    """Hash of the rig type, the parameter values it uses and the rest data of its org bones."""
+    data = [FINGERPRINT_VERSION, type(rig).__module__.rpartition('.')[2].lstrip('_')]
+    data.extend(values)
+    for bone_name in rig.bones.org:
+        data.extend(bone_rest_data(rig.obj, bone_name))
+    text = repr([f"{value:.6f}" if isinstance(value, float) else value for value in data])
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class RigFingerprints(GeneratorPlugin):
+    """
+    Compares every rig with the fingerprint it had in the previous generation,
+    so rigs that did not change can keep their existing widgets.
+    """
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        old = self.obj.data.get(FINGERPRINT_KEY)
+        self.old_fingerprints = dict(old) if old else {}
+        self.fingerprints = {}
+        # Rigify's option to rebuild all widgets wins
+        self.force_update = getattr(generator.metarig.data, "rigify_force_widget_update", False)
+
+    def is_unchanged(self, rig, *values):
+        fingerprint = rig_fingerprint(rig, values)
+        self.fingerprints[rig.base_bone] = fingerprint
+        return not self.force_update and self.old_fingerprints.get(rig.base_bone) == fingerprint
+
+    def finalize(self):
+        self.obj.data[FINGERPRINT_KEY] = self.fingerprints
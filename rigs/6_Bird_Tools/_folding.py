@@ -0,0 +1,248 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import ast
+import math
+import operator
+from rigify.base_generate import GeneratorPlugin
+
+from ...profiling import get_profiler, profile_stage
+
+
+def _clamp(value, low=0.0, high=1.0):
+    return min(max(value, low), high)
+
+
+# Driver functions without side effects that can run at generation time
+FOLDABLE_FUNCTIONS = {
+    'min': min, 'max': max, 'abs': abs, 'clamp': _clamp,
+    'sqrt': math.sqrt, 'pow': math.pow, 'floor': math.floor, 'ceil': math.ceil,
+}
+
+BINARY_OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+
+
+##############################
+# Channels
+
+def animated_paths(obj):
+    """Data paths of the object that have a driver or an action F-curve."""
+    paths = set()
+    anim_data = obj.animation_data
+    if anim_data:
+        paths.update(fcurve.data_path for fcurve in anim_data.drivers)
+        if anim_data.action:
+            paths.update(fcurve.data_path for fcurve in anim_data.action.fcurves)
+    return paths
+
+
+def pinned_location(pose_bone, axis):
+    """
+    Value a limit location constraint forces on the axis, or None. Only a stack
+    of local space limit location constraints is understood, and the last one
+    has to set the same minimum and maximum.
+    """
+    constraints = [con for con in pose_bone.constraints if not con.mute]
+    if any(con.type != 'LIMIT_LOCATION' or con.owner_space != 'LOCAL' for con in constraints):
+        return None
+    last = constraints[-1]
+    letter = "xyz"[axis]
+    if last.influence != 1.0 or not (getattr(last, "use_min_" + letter) and getattr(last, "use_max_" + letter)):
+        return None
+    low, high = getattr(last, "min_" + letter), getattr(last, "max_" + letter)
+    return low if low == high else None
+
+
+def constant_variable_value(obj, var, paths):
+    """
+    Returns the value of a driver variable that reads a location channel of the
+    rig which can't change, or None. A channel can't change when it is locked and
+    the bone has no constraints, or when a limit constraint pins it.
+    """
+    if var.type != 'TRANSFORMS':
+        return None
+    target = var.targets[0]
+    if target.id != obj or target.transform_space != 'LOCAL_SPACE' or not target.transform_type.startswith('LOC_'):
+        return None
+    pose_bone = obj.pose.bones.get(target.bone_target)
+    if pose_bone is None or f'pose.bones["{pose_bone.name}"].location' in paths:
+        return None
+
+    axis = "XYZ".index(target.transform_type[-1])
+    if any(not con.mute for con in pose_bone.constraints):
+        return pinned_location(pose_bone, axis)
+    if pose_bone.lock_location[axis]:
+        return pose_bone.location[axis]
+    return None
+
+
+##############################
+# Expressions
+
+def is_constant(node, value=None):
+    return (isinstance(node, ast.Constant) and isinstance(node.value, (int, float))
+            and (value is None or node.value == value))
+
+
+class ExpressionFolder(ast.NodeTransformer):
+    """Replaces constant variables with their values and simplifies the expression bottom up."""
+
+    def __init__(self, constants):
+        self.constants = constants
+
+    def visit_Name(self, node):
+        if node.id in self.constants:
+            return ast.Constant(self.constants[node.id])
+        return node
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        operand = node.operand
+        if isinstance(node.op, ast.USub):
+            if is_constant(operand):
+                return ast.Constant(-operand.value)
+            if isinstance(operand, ast.UnaryOp) and isinstance(operand.op, ast.USub):
+                return operand.operand
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        return node
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        left, op, right = node.left, node.op, node.right
+
+        if is_constant(left) and is_constant(right) and type(op) in BINARY_OPERATORS:
+            if not (isinstance(op, ast.Div) and right.value == 0):
+                return ast.Constant(BINARY_OPERATORS[type(op)](left.value, right.value))
+
+        if isinstance(op, ast.Add):
+            if is_constant(left, 0):
+                return right
+            if is_constant(right, 0):
+                return left
+        elif isinstance(op, ast.Sub):
+            if is_constant(right, 0):
+                return left
+            if is_constant(left, 0):
+                return self.visit_UnaryOp(ast.UnaryOp(ast.USub(), right))
+        elif isinstance(op, ast.Mult):
+            if is_constant(left, 1):
+                return right
+            if is_constant(right, 1):
+                return left
+        elif isinstance(op, ast.Div):
+            if is_constant(right, 1):
+                return left
+        elif isinstance(op, ast.Pow) and is_constant(right):
+            return self.fold_power(left, right.value)
+        return node
+
+    def fold_power(self, base, exponent):
+        if is_constant(base) and (base.value >= 0 or float(exponent).is_integer()):
+            return ast.Constant(base.value ** exponent)
+        # The sign of the base doesn't matter for even powers
+        if exponent % 2 == 0 and isinstance(base, ast.UnaryOp) and isinstance(base.op, ast.USub):
+            base = base.operand
+        # Squares of variables become products, which Simple Expressions can evaluate
+        if exponent == 2 and isinstance(base, ast.Name):
+            return ast.BinOp(base, ast.Mult(), ast.Name(base.id, ast.Load()))
+        if exponent == 1:
+            return base
+        return ast.BinOp(base, ast.Pow(), ast.Constant(exponent))
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            return node
+        name = node.func.id
+        if name in FOLDABLE_FUNCTIONS and all(is_constant(arg) for arg in node.args):
+            try:
+                return ast.Constant(FOLDABLE_FUNCTIONS[name](*(arg.value for arg in node.args)))
+            except (TypeError, ValueError):
+                return node
+        # sqrt(x * x) is the distance along a single axis
+        if name == 'sqrt' and len(node.args) == 1:
+            arg = node.args[0]
+            if (isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Mult) and isinstance(arg.left, ast.Name)
+                    and isinstance(arg.right, ast.Name) and arg.left.id == arg.right.id):
+                return ast.Call(ast.Name('abs', ast.Load()), [arg.left], [])
+        return node
+
+
+class NegativeConstants(ast.NodeTransformer):
+    """Writes negative constants as negations, so unparsing keeps them in parentheses where needed."""
+
+    def visit_Constant(self, node):
+        if is_constant(node) and node.value < 0:
+            return ast.UnaryOp(ast.USub(), ast.Constant(-node.value))
+        return node
+
+
+def fold_expression(expression, constants):
+    """Returns the expression with the constants substituted and simplified, and the names it still uses."""
+    tree = ast.parse(expression, mode='eval')
+    tree = NegativeConstants().visit(ExpressionFolder(constants).visit(tree))
+    tree = ast.fix_missing_locations(tree)
+    names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    return ast.unparse(tree), names
+
+
+def fold_driver(obj, driver, paths):
+    """Folds the constant variables of a scripted driver and removes the ones no longer used."""
+    if driver.type != 'SCRIPTED' or driver.use_self:
+        return
+    constants = {}
+    for var in driver.variables:
+        value = constant_variable_value(obj, var, paths)
+        if value is not None:
+            constants[var.name] = float(value)
+
+    try:
+        expression, names = fold_expression(driver.expression, constants)
+    except SyntaxError:
+        return
+
+    for var in [var for var in driver.variables if var.name not in names]:
+        driver.variables.remove(var)
+    driver.expression = expression
+
+
+class DriverConstantFolder(GeneratorPlugin):
+    """
+    Folds driver variables that read locked or pinned location channels into
+    constants once all bones are locked and constrained.
+    """
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.drivers = []
+        self.profiler = get_profiler(generator)
+
+    def add_driver(self, data_path):
+        self.drivers.append(data_path)
+
+    @profile_stage
+    def finalize(self):
+        obj = self.obj
+        if not self.drivers or not obj.animation_data:
+            return
+        paths = animated_paths(obj)
+        for data_path in self.drivers:
+            fcurve = obj.animation_data.drivers.find(data_path)
+            if fcurve:
+                fold_driver(obj, fcurve.driver, paths)
@@ -0,0 +1,193 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import os
+import hashlib
+import tempfile
+import numpy as np
+
+from ._text_mesh import TextSettings, TEXT_RESOLUTION, font_path, tessellate_texts, new_text_mesh
+
+# Overrides the directory the glyph caches are stored in
+GLYPH_CACHE_DIR_ENV = "SIXBIRD_GLYPH_CACHE"
+
+GLYPH_CACHE_VERSION = 1
+
+# Glyph appended to each cached glyph to measure its advance
+REFERENCE_GLYPH = "I"
+
+ALIGN_Y_MODES = ('TOP', 'TOP_BASELINE', 'CENTER', 'BOTTOM_BASELINE', 'BOTTOM')
+
+# Loaded caches by (font path, resolution)
+_glyph_caches = {}
+
+
+def glyph_cache_dir():
+    directory = os.environ.get(GLYPH_CACHE_DIR_ENV)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        return directory
+    return bpy.utils.user_resource('DATAFILES', path=os.path.join("rigify_6bird", "glyphs"), create=True)
+
+
+def can_use_glyph_cache(settings):
+    """Glyphs are cached flat and for a single line of text."""
+    return settings.extrude == 0 and "\n" not in settings.body
+
+
+def get_glyph_cache(font=None, resolution=TEXT_RESOLUTION):
+    key = (font_path(font), resolution)
+    cache = _glyph_caches.get(key)
+    if cache is None:
+        cache = _glyph_caches[key] = GlyphCache(font, resolution)
+    return cache
+
+
+def build_glyph_meshes(context, settings_by_key, font=None):
+    """Assembles cached text meshes from glyph outlines, returned by key."""
+    by_resolution = {}
+    for key, settings in settings_by_key.items():
+        by_resolution.setdefault(settings.resolution, {})[key] = settings
+
+    meshes = {}
+    for resolution, group in by_resolution.items():
+        cache = get_glyph_cache(font, resolution)
+        cache.ensure_glyphs(context, "".join(settings.body for settings in group.values()))
+        for key, settings in group.items():
+            meshes[key] = new_text_mesh(key, settings, cache.assemble(settings))
+    return meshes
+
+
+def read_glyph_cache(path):
+    """Arrays of a glyph cache file, empty if it is missing, torn or of another version."""
+    try:
+        with np.load(path) as npz:
+            data = {name: npz[name] for name in npz.files}
+    except Exception:
+        # Anything np.load raises for a partial file, zipfile.BadZipFile included
+        return {}
+    if int(data.get('version', -1)) != GLYPH_CACHE_VERSION:
+        return {}
+    return data
+
+
+class GlyphCache:
+    """
+    Outline arrays of single glyphs of one font at one curve resolution, stored
+    at text size 1.0 with left / top baseline alignment in a .npz file.
+    """
+
+    def __init__(self, font=None, resolution=TEXT_RESOLUTION):
+        self.font = font
+        self.resolution = resolution
+        font_hash = hashlib.sha1(font_path(font).encode('utf-8')).hexdigest()[:12]
+        self.path = os.path.join(glyph_cache_dir(), f"{font_hash}_r{resolution}.npz")
+        self.data = {}
+        self.load()
+
+    def load(self):
+        self.data = read_glyph_cache(self.path)
+
+    def save(self):
+        """
+        Merges the glyphs with the ones other processes saved meanwhile and
+        replaces the file at once, through a temp file of this process only.
+        """
+        self.data = {**read_glyph_cache(self.path), **self.data}
+        self.data['version'] = np.array(GLYPH_CACHE_VERSION)
+        fd, temp_path = tempfile.mkstemp(prefix=".glyphs_", suffix=".npz", dir=os.path.dirname(self.path))
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.savez_compressed(file, **self.data)
+            os.replace(temp_path, self.path)
+        except OSError:
+            # The cache only saves time, the glyphs are saved again next time
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def has_glyph(self, char):
+        return f"advance_{ord(char)}" in self.data
+
+    def ensure_glyphs(self, context, text):
+        """Tessellates and stores every glyph of the text not in the cache yet."""
+        missing = sorted({char for char in text if not self.has_glyph(char)})
+        need_metrics = 'yoff_TOP' not in self.data
+        if not missing and not need_metrics:
+            return
+
+        def glyph_settings(body, align_y='TOP_BASELINE'):
+            return TextSettings(body, 1.0, 0.0, 'LEFT', align_y, resolution=self.resolution)
+
+        requests = {}
+        for char in missing:
+            requests[('glyph', char)] = glyph_settings(char)
+            requests[('advance', char)] = glyph_settings(char + REFERENCE_GLYPH)
+        for mode in ALIGN_Y_MODES:
+            requests[('align', mode)] = glyph_settings(REFERENCE_GLYPH, mode)
+
+        results = tessellate_texts(context, requests, self.font)
+
+        reference = results[('align', 'TOP_BASELINE')]
+        reference_y = reference['co'][1::3].min()
+        reference_max_x = reference['co'][0::3].max()
+        for mode in ALIGN_Y_MODES:
+            self.data[f"yoff_{mode}"] = np.array(results[('align', mode)]['co'][1::3].min() - reference_y)
+
+        for char in missing:
+            code = ord(char)
+            for name, array in results[('glyph', char)].items():
+                self.data[f"{name}_{code}"] = array
+            # The reference glyph sits one advance further right
+            advance_co = results[('advance', char)]['co']
+            self.data[f"advance_{code}"] = np.array(advance_co[0::3].max() - reference_max_x)
+
+        self.save()
+
+    def assemble(self, settings):
+        """Lays out cached glyphs into mesh arrays for the text settings."""
+        codes = [ord(char) for char in settings.body]
+        glyphs = [{name: self.data[f"{name}_{code}"] for name in ('co', 'edges', 'loops', 'loop_starts')}
+                  for code in codes]
+
+        advances = np.array([self.data[f"advance_{code}"] for code in codes], dtype=np.float32)
+        pen_x = np.concatenate(([0.0], np.cumsum(advances)[:-1]))
+        width = advances.sum()
+        pen_x += {'CENTER': -width / 2, 'RIGHT': -width}.get(settings.align_x, 0.0)
+        pen_y = self.data[f"yoff_{settings.align_y}"]
+
+        vert_counts = np.array([len(glyph['co']) // 3 for glyph in glyphs])
+        loop_counts = np.array([len(glyph['loops']) for glyph in glyphs])
+        vert_offsets = np.concatenate(([0], np.cumsum(vert_counts)[:-1]))
+        loop_offsets = np.concatenate(([0], np.cumsum(loop_counts)[:-1]))
+
+        co = np.concatenate([glyph['co'] for glyph in glyphs]).reshape(-1, 3)
+        co[:, 0] += np.repeat(pen_x, vert_counts)
+        co[:, 1] += pen_y
+        co *= settings.size
+
+        def offset_indices(name, offsets):
+            counts = [len(glyph[name]) for glyph in glyphs]
+            return np.concatenate([glyph[name] for glyph in glyphs]) + np.repeat(offsets, counts)
+
+        return {
+            'co': co.astype(np.float32).ravel(),
+            'edges': offset_indices('edges', vert_offsets).astype(np.int32),
+            'loops': offset_indices('loops', vert_offsets).astype(np.int32),
+            'loop_starts': offset_indices('loop_starts', loop_offsets).astype(np.int32),
+        }
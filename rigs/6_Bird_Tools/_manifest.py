@@ -0,0 +1,81 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import importlib
+from rigify.base_rig import BaseRig
+
+from ... import rigify_info
+
+PROPERTY_TYPES = {
+    'BOOL': bpy.props.BoolProperty,
+    'INT': bpy.props.IntProperty,
+    'FLOAT': bpy.props.FloatProperty,
+    'STRING': bpy.props.StringProperty,
+    'ENUM': bpy.props.EnumProperty,
+}
+
+# Parameter options for the feature set itself, not passed on to the property.
+# "derived" marks a parameter generation writes back, which specs leave out.
+FEATURE_SET_OPTIONS = ('derived',)
+
+
+class LazyRig(BaseRig):
+    """
+    The Rig class Rigify finds when it scans the rig modules. Parameters are
+    registered from the manifest in rigify_info, and the module with the full
+    implementation is only imported to generate the rig, draw its parameters
+    or check the metarig.
+    """
+
+    rig_type = ""
+
+    def __new__(cls, generator, pose_bone):
+        return cls.implementation()(generator, pose_bone)
+
+    @classmethod
+    def manifest(cls):
+        return rigify_info["rig_types"][cls.rig_type]
+
+    @classmethod
+    def implementation(cls):
+        return importlib.import_module("." + cls.manifest()["module"], __package__).Rig
+
+    @classmethod
+    def add_parameters(cls, params):
+        for name in cls.manifest()["parameters"]:
+            prop_type, options = rigify_info["rig_parameters"][name]
+            options = {key: value for key, value in options.items() if key not in FEATURE_SET_OPTIONS}
+            setattr(params, name, PROPERTY_TYPES[prop_type](**options))
+
+    @classmethod
+    def parameters_ui(cls, layout, params):
+        cls.implementation().parameters_ui(layout, params)
+
+    @classmethod
+    def check_metarig(cls, check, bone_name, params):
+        cls.implementation().check_metarig(check, bone_name, params)
+
+
+def lazy_rig(rig_type):
+    """Makes the Rig class of a rig module from its entry in the manifest."""
+    return type("Rig", (LazyRig,), {
+        'rig_type': rig_type,
+        '__doc__': rigify_info["rig_types"][rig_type]["description"],
+        '__module__': f"{__package__}.{rig_type}",
+    })
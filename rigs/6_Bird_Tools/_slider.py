@@ -0,0 +1,226 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import math
+from itertools import count
+from mathutils import Matrix, Vector
+from rigify.base_rig import stage, BaseRig
+from rigify.utils.rig import connected_children_names
+from rigify.utils.misc import map_list
+from rigify.utils.bones import put_bone, copy_bone_properties, align_bone_orientation, set_bone_widget_transform
+from rigify.utils.naming import make_derived_name
+from rigify.utils.widgets_basic import create_circle_widget, create_cube_widget
+from rigify.utils.widgets import adjust_widget_transform_mesh
+
+from ._widgets import set_shared_widget, discard_old_widget, check_widgets
+from ._fingerprint import RigFingerprints
+from ._drivers import resolve_shape_key_targets, remap_expression, add_shape_key_driver, check_shape_key_targets
+from ...profiling import get_profiler, profile_stage, add_live_profiler
+from ...bake import OutputRegistry
+from ...ownership import OwnershipRegistry
+
+class Rig(BaseRig):
+    """A rig that generates a slider from a target bone."""
+
+    def find_org_bones(self, bone):
+        return [bone.name] + connected_children_names(self.obj, bone.name)
+
+        value_scale: float
+        shared_widgets: bool
+        slider_bank: bool
+        shape_key_targets: list
+
+    def initialize(self):
+        self.value_scale = self.params.value_scale
+        self.shared_widgets = self.params.shared_widgets
+        self.slider_bank = self.params.slider_bank
+        slider_count = len(self.bones.org) if self.slider_bank else 1
+        self.shape_key_targets = resolve_shape_key_targets(
+            self, self.params.shape_key_targets, [str(i) for i in range(slider_count)])
+        self.outputs = OutputRegistry(self.generator)
+        self.profiler = get_profiler(self.generator)
+        add_live_profiler(self.generator)
+        self.ownership = OwnershipRegistry(self.generator)
+        self.ownership.add_rig(self)
+        self.unchanged = RigFingerprints(self.generator).is_unchanged(self, self.value_scale, self.shared_widgets, self.slider_bank, self.params.shape_key_targets)
+
+
+    @stage.generate_bones
+    @profile_stage
+    def make_control_bones(self):
+        # In a bank every bone of the chain is a slider, otherwise only the first one.
+        # Both lists hold pairs: [box 0, slider 0, box 1, slider 1, ...]
+        boxes = self.bones.org if self.slider_bank else self.bones.org[:1]
+        org = []
+        for box in boxes:
+            slide_name = make_derived_name(box, 'org', '_slide')
+            org += [box, self.copy_bone(box, slide_name)]
+        self.bones.org = org
+        self.bones.ctrl = map_list(self.make_control_bone, count(0), org)
+
+    def make_control_bone(self, i, org):
+        return self.copy_bone(org, make_derived_name(org, 'ctrl'), parent=True)
+
+    @stage.parent_bones
+    @profile_stage
+    def parent_controls(self):
+        # Boxes of a bank don't follow each other along the chain
+        box_parent = self.get_bone(self.bones.ctrl[0]).parent
+        for box, slider in self.slider_pairs(self.bones.org):
+            self.set_bone_parent(slider, box)
+        for i, (box, slider) in enumerate(self.slider_pairs(self.bones.ctrl)):
+            self.set_bone_parent(slider, box)
+            if i > 0:
+                self.set_bone_parent(box, box_parent.name if box_parent else None)
+
+    def slider_pairs(self, bones):
+        return list(zip(bones[0::2], bones[1::2]))
+
+    @stage.configure_bones
+    @profile_stage
+    def configure_controls(self):
+        arm = self.obj
+        for args in zip(count(0), self.bones.ctrl, self.bones.org):
+            self.configure_control_bone(*args)
+        for box, slider in self.slider_pairs(self.bones.ctrl):
+            bone1_length = arm.pose.bones[box].bone.length
+            self.make_constraint(slider, 'LIMIT_LOCATION', space_object= self.obj, \
+                space_subtarget= box, owner_space ='LOCAL', use_transform_limit=True, \
+                    max_y=bone1_length, use_max_x=True, use_max_y=True, \
+                        use_max_z=True, use_min_x=True, use_min_y=True, use_min_z=True)
+
+    def configure_control_bone(self, i, ctrl, org):
+        self.copy_bone_properties(org, ctrl)
+
+    ##############################
+    # UI
+
+    @classmethod
+    def parameters_ui(cls, layout, params):
+        layout.row().prop(params, "value_scale", text="Scale Output")
+        layout.row().prop(params, "shared_widgets", text="Shared Widgets")
+        layout.row().prop(params, "shape_key_targets", text="Shape Keys")
+        layout.row().prop(params, "slider_bank", text="Slider Bank")
+
+    @classmethod
+    def check_metarig(cls, check, bone_name, params):
+        chain = check.check_chain(bone_name)
+        count = len(chain) if params.slider_bank else 1
+        if len(chain) > 1 and not params.slider_bank:
+            check.warning(bone_name, f"Connected children ({', '.join(chain[1:])}) get no sliders, "
+                                     f"enable Slider Bank to use them")
+        if params.value_scale == 0:
+            check.warning(bone_name, "Value Scale is 0, so the output is always 0")
+        check_shape_key_targets(check, bone_name, params.shape_key_targets, [str(i) for i in range(count)])
+        # A knob ORG bone and a box and knob control per slider, one folded variable per driver
+        check.add(bones=3 * count, drivers=count, variables=count)
+        check_widgets(check, params.shared_widgets, count, count)
+
+
+    @stage.rig_bones
+    @profile_stage
+    def setup_bones(self):
+        for box, slider in self.slider_pairs(self.bones.ctrl):
+            self.add_slider_value(box, slider)
+            self.lock_bones(box, slider)
+        self.add_shape_key_drivers()
+
+    def add_slider_value(self, bone1_name, bone2_name):
+        #Not gonna lie I got AI to figure this out, idk how it works
+        custom_prop_name = "bone_distance"
+
+        # Get objects and pose bones
+        arm = self.obj
+        pb1 = arm.pose.bones[bone1_name]
+        pb2 = arm.pose.bones[bone2_name]
+        bone1_length = pb1.bone.length
+
+        # Add the custom property to slider
+        pb2[custom_prop_name] = 0.0
+
+        # Create driver for the custom property
+        prop_path = f'pose.bones["{bone2_name}"]["{custom_prop_name}"]'
+        fcurve = arm.driver_add(prop_path)
+        self.ownership.add_driver(self, arm, prop_path)
+        self.ownership.add_property(self, bone2_name, custom_prop_name)
+        self.outputs.add_value(prop_path, bone2_name, 1, bone1_length, self.value_scale, 0.0, 1.0)
+        driver = fcurve.driver
+        driver.type = 'SCRIPTED'
+
+        # The box bone is locked at rest and the limit constraint keeps the slider
+        # on the box's Y axis between 0 and the box length, so the distance is just
+        # the slider's raw Y location. clamp() keeps this a Simple Expression.
+        var = driver.variables.new()
+        var.name = "b_Y"
+        var.type = 'TRANSFORMS'
+        target = var.targets[0]
+        target.id = arm
+        target.bone_target = bone2_name
+        target.transform_type = 'LOC_Y'
+        target.transform_space = 'LOCAL_SPACE'
+
+        driver.expression = f"{self.value_scale:.6f} * clamp(b_Y / {bone1_length:.6f})"
+    
+    def add_shape_key_drivers(self):
+        # Same value as the slider driver, remapped to the target range
+        pairs = self.slider_pairs(self.bones.ctrl)
+        for target, key, key_block in self.shape_key_targets:
+            box, slider = pairs[int(target.output)]
+            bone1_length = self.obj.pose.bones[box].bone.length
+            value = f"clamp(b_Y / {bone1_length:.6f})"
+            expression = remap_expression(value, self.value_scale, target.low, target.high)
+            fcurve = add_shape_key_driver(key, key_block, self.obj, slider, 'Y', expression)
+            self.ownership.add_driver(self, key, fcurve.data_path)
+
+    def lock_bones(self, bone1_name, bone2_name):
+        arm = self.obj
+        pb1 = arm.pose.bones[bone1_name]
+        pb2 = arm.pose.bones[bone2_name]
+        pb1.lock_rotations_4d = True
+        pb2.lock_rotations_4d = True
+        pb1.lock_rotation_w = True
+        pb2.lock_rotation_w = True
+        pb1.lock_rotation = [True, True, True]
+        pb2.lock_rotation = [True, True, True]
+        pb1.lock_scale = [True, True, True]
+        pb2.lock_scale = [True, True, True]
+        pb1.lock_location = [True, True, True]
+        arm.data.bones[bone1_name].hide_select = True
+
+    @stage.generate_widgets
+    @profile_stage
+    def make_control_widgets(self):
+        ctrl = self.bones.ctrl
+        if not self.unchanged:
+            for bone_name in ctrl:
+                discard_old_widget(bone_name)
+        for box, slider in self.slider_pairs(ctrl):
+            self.make_slider_widgets(box, slider)
+
+    def make_slider_widgets(self, box_name, slider_name):
+        bone1_length = self.obj.pose.bones[box_name].length
+        if self.shared_widgets:
+            set_shared_widget(self.obj, box_name, 'box', scale=(0.2, 1.2, 0.001), translation=(0.0, bone1_length/2, 0.0))
+            set_shared_widget(self.obj, slider_name, 'knob')
+            return
+        box = create_cube_widget(self.obj, box_name)
+        slider = create_circle_widget(self.obj, slider_name)
+        transform_box = Matrix.Translation((0.0, bone1_length/2, 0.0)) @ Matrix.Scale(0.001, 4, Vector((0, 0, 1))) @ Matrix.Scale(1.2, 4, Vector((0, 1, 0))) @ Matrix.Scale(0.2, 4, Vector((1, 0, 0)))
+        transform_slider =  Matrix.Rotation(math.radians(90), 4, 'X') @ Matrix.Scale(0.1, 4, Vector((1, 0, 0))) @ Matrix.Scale(0.1, 4, Vector((0, 0, 1)))
+        adjust_widget_transform_mesh(box, transform_box, local=self.obj.pose.bones[box_name])
+        adjust_widget_transform_mesh(slider, transform_slider, local=True)
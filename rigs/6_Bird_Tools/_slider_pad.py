@@ -0,0 +1,287 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import math
+from itertools import count
+from mathutils import Matrix, Vector
+from rigify.base_rig import stage, BaseRig
+from rigify.utils.rig import connected_children_names
+from rigify.utils.misc import map_list
+from rigify.utils.bones import put_bone, copy_bone_properties, align_bone_orientation, set_bone_widget_transform
+from rigify.utils.naming import make_derived_name
+from rigify.utils.widgets_basic import create_circle_widget, create_cube_widget
+from rigify.utils.widgets import adjust_widget_transform_mesh
+
+from ._widgets import set_shared_widget, discard_old_widget, check_widgets
+from ._fingerprint import RigFingerprints
+from ._drivers import resolve_shape_key_targets, remap_expression, add_shape_key_driver, check_shape_key_targets
+from ._folding import DriverConstantFolder
+from ...profiling import get_profiler, profile_stage, add_live_profiler
+from ...bake import OutputRegistry
+from ...ownership import OwnershipRegistry
+
+# Corner weight properties by the signs of the x and y offsets they grow with
+CORNER_OUTPUTS = {
+    'corner_up_left': (-1, 1),
+    'corner_up_right': (1, 1),
+    'corner_down_left': (-1, -1),
+    'corner_down_right': (1, -1),
+}
+
+class Rig(BaseRig):
+    """A rig that generates a slider from a target bone."""
+
+    def find_org_bones(self, bone):
+        return [bone.name] + connected_children_names(self.obj, bone.name)
+
+        value_scale: float
+        shared_widgets: bool
+        shape_key_targets: list
+        corner_weights: bool
+        polar_outputs: bool
+
+    def initialize(self):
+        self.value_scale = self.params.value_scale
+        self.shared_widgets = self.params.shared_widgets
+        self.corner_weights = self.params.pad_corner_weights
+        self.polar_outputs = self.params.pad_polar_outputs
+        self.shape_key_targets = resolve_shape_key_targets(self, self.params.shape_key_targets, ['X', 'Y'])
+        self.outputs = OutputRegistry(self.generator)
+        self.folder = DriverConstantFolder(self.generator)
+        self.profiler = get_profiler(self.generator)
+        add_live_profiler(self.generator)
+        self.ownership = OwnershipRegistry(self.generator)
+        self.ownership.add_rig(self)
+        self.unchanged = RigFingerprints(self.generator).is_unchanged(self, self.value_scale, self.shared_widgets, self.params.shape_key_targets, self.corner_weights, self.polar_outputs)
+
+    @stage.generate_bones
+    @profile_stage
+    def make_control_bones(self):
+        org = self.bones.org
+        slide_name = make_derived_name(org[0], 'org', '_slide')
+        slide_bone = self.copy_bone(org[0], slide_name)
+        org.append(slide_bone)
+        self.bones.ctrl = map_list(self.make_control_bone, count(0), org)
+
+    def make_control_bone(self, i, org):
+        return self.copy_bone(org, make_derived_name(org, 'ctrl'), parent=True)
+
+    @stage.parent_bones
+    @profile_stage
+    def parent_controls(self):
+        self.set_bone_parent(self.bones.org[1], self.bones.org[0])
+        self.set_bone_parent(self.bones.ctrl[1], self.bones.ctrl[0])
+
+    @stage.configure_bones
+    @profile_stage
+    def configure_controls(self):
+        arm = self.obj
+        pb1 = arm.pose.bones[self.bones.ctrl[0]]
+        bone1_length = pb1.bone.length
+        for args in zip(count(0), self.bones.ctrl, self.bones.org):
+            self.configure_control_bone(*args)
+        self.make_constraint(self.bones.ctrl[1], 'LIMIT_LOCATION', space_object= self.obj, \
+            space_subtarget= self.bones.ctrl[0], owner_space ='LOCAL', use_transform_limit=True, \
+                max_x=(bone1_length), max_y=(bone1_length), min_x=(-1 * bone1_length), min_y=(-1 * bone1_length),\
+                    use_max_x=True, use_max_y=True, use_max_z=True, use_min_x=True, use_min_y=True, use_min_z=True)
+
+    def configure_control_bone(self, i, ctrl, org):
+        self.copy_bone_properties(org, ctrl)
+
+    ##############################
+    # UI
+
+    @classmethod
+    def parameters_ui(cls, layout, params):
+        layout.row().prop(params, "value_scale", text="Scale Output")
+        layout.row().prop(params, "shared_widgets", text="Shared Widgets")
+        layout.row().prop(params, "shape_key_targets", text="Shape Keys")
+        layout.row().prop(params, "pad_corner_weights", text="Corner Weights")
+        layout.row().prop(params, "pad_polar_outputs", text="Radial and Angle")
+
+    @classmethod
+    def check_metarig(cls, check, bone_name, params):
+        check.check_chain(bone_name, allow_children=False)
+        if params.value_scale == 0:
+            check.warning(bone_name, "Value Scale is 0, so the outputs are always 0")
+        check_shape_key_targets(check, bone_name, params.shape_key_targets, ['X', 'Y'])
+        # A knob ORG bone and the box and knob controls, one folded variable per driver
+        check.add(bones=3, drivers=2, variables=2)
+        # Derived outputs read both axes of the knob
+        if params.pad_corner_weights:
+            check.add(drivers=4, variables=8)
+        if params.pad_polar_outputs:
+            check.add(drivers=2, variables=4)
+        check_widgets(check, params.shared_widgets, 1, 1)
+
+
+    @stage.rig_bones
+    @profile_stage
+    def setup_bones(self):
+        self.add_slider_value()
+        self.add_derived_outputs()
+        self.add_shape_key_drivers()
+        self.lock_bones()
+
+    def add_slider_value(self):
+        #Not gonna lie I got AI to figure this out, idk how it works
+        bone1_name = self.bones.ctrl[0]
+        bone2_name = self.bones.ctrl[1]
+        custom_prop_name_x = "bone_distance_x"
+        custom_prop_name_y = "bone_distance_y"
+
+        # Get objects and pose bones
+        arm = self.obj
+        pb1 = arm.pose.bones[bone1_name]
+        pb2 = arm.pose.bones[bone2_name]
+        bone1_length = pb1.bone.length
+
+        # Add the custom property to slider
+        pb2[custom_prop_name_x] = 0.0
+        pb2[custom_prop_name_y] = 0.0
+
+        # Create driver for the custom property
+        prop_path_x = f'pose.bones["{bone2_name}"]["{custom_prop_name_x}"]'
+        prop_path_y = f'pose.bones["{bone2_name}"]["{custom_prop_name_y}"]'
+        fcurve_x = arm.driver_add(prop_path_x)
+        fcurve_y = arm.driver_add(prop_path_y)
+        self.folder.add_driver(prop_path_x)
+        self.folder.add_driver(prop_path_y)
+        for prop_path, custom_prop_name in [(prop_path_x, custom_prop_name_x), (prop_path_y, custom_prop_name_y)]:
+            self.ownership.add_driver(self, arm, prop_path)
+            self.ownership.add_property(self, bone2_name, custom_prop_name)
+        self.outputs.add_value(prop_path_x, bone2_name, 0, bone1_length, self.value_scale, -1.0, 1.0)
+        self.outputs.add_value(prop_path_y, bone2_name, 1, bone1_length, self.value_scale, -1.0, 1.0)
+        driver_x = fcurve_x.driver
+        driver_y = fcurve_y.driver
+        driver_x.type = 'SCRIPTED'
+        driver_y.type = 'SCRIPTED'
+
+        # Add variables for bone_1 and bone_2 world locations
+        for bone, prefix in [(bone1_name, "a"), (bone2_name, "b")]:
+            for axis, driver in zip("XY", [driver_x, driver_y]):
+                var = driver.variables.new()
+                var.name = f"{prefix}_{axis}"
+                var.type = 'TRANSFORMS'
+                target = var.targets[0]
+                target.id = arm
+                target.bone_target = bone
+                target.transform_type = f"LOC_{axis}"
+                target.transform_space = 'LOCAL_SPACE'
+
+        driver_x.expression = (
+            f"{self.value_scale:.6f} * min((b_X - a_X) / {bone1_length:.6f}, 1.0)"
+        )
+        driver_y.expression = (
+            f"{self.value_scale:.6f} * min((b_Y - a_Y) / {bone1_length:.6f}, 1.0)"
+        )
+
+    def add_knob_variable(self, driver, bone2_name, axis):
+        var = driver.variables.new()
+        var.name = f"b_{axis}"
+        var.type = 'TRANSFORMS'
+        target = var.targets[0]
+        target.id = self.obj
+        target.bone_target = bone2_name
+        target.transform_type = f"LOC_{axis}"
+        target.transform_space = 'LOCAL_SPACE'
+
+    def add_derived_outputs(self):
+        # The pad bone is locked at rest and the limit constraint keeps the knob within
+        # one box length of it, so the knob's raw location is the offset
+        bone2_name = self.bones.ctrl[1]
+        bone1_length = self.obj.pose.bones[self.bones.ctrl[0]].bone.length
+        x = f"b_X / {bone1_length:.6f}"
+        y = f"b_Y / {bone1_length:.6f}"
+
+        if self.corner_weights:
+            for prop_name, (sign_x, sign_y) in CORNER_OUTPUTS.items():
+                weight_x = f"clamp({x})" if sign_x > 0 else f"clamp(-{x})"
+                weight_y = f"clamp({y})" if sign_y > 0 else f"clamp(-{y})"
+                prop_path = self.add_knob_output(prop_name, f"{self.value_scale:.6f} * {weight_x} * {weight_y}")
+                self.outputs.add_corner(prop_path, bone2_name, bone1_length, self.value_scale, sign_x, sign_y)
+
+        if self.polar_outputs:
+            prop_path = self.add_knob_output(
+                "radius", f"{self.value_scale:.6f} * min(sqrt(b_X * b_X + b_Y * b_Y) / {bone1_length:.6f}, 1.0)")
+            self.outputs.add_radius(prop_path, bone2_name, bone1_length, self.value_scale)
+            prop_path = self.add_knob_output("angle", "atan2(b_Y, b_X)")
+            self.outputs.add_angle(prop_path, bone2_name, bone1_length)
+
+    def add_knob_output(self, prop_name, expression):
+        """Adds a property to the knob driven by an expression of b_X and b_Y, returns its data path."""
+        arm = self.obj
+        bone2_name = self.bones.ctrl[1]
+        arm.pose.bones[bone2_name][prop_name] = 0.0
+        prop_path = f'pose.bones["{bone2_name}"]["{prop_name}"]'
+        fcurve = arm.driver_add(prop_path)
+        self.folder.add_driver(prop_path)
+        self.ownership.add_driver(self, arm, prop_path)
+        self.ownership.add_property(self, bone2_name, prop_name)
+
+        driver = fcurve.driver
+        driver.type = 'SCRIPTED'
+        for axis in "XY":
+            self.add_knob_variable(driver, bone2_name, axis)
+        driver.expression = expression
+        return prop_path
+
+    def add_shape_key_drivers(self):
+        # Same value as the pad drivers, clamped to the box and remapped to the target range
+        bone2_name = self.bones.ctrl[1]
+        bone1_length = self.obj.pose.bones[self.bones.ctrl[0]].bone.length
+        for target, key, key_block in self.shape_key_targets:
+            axis = target.output
+            value = f"clamp(b_{axis} / {bone1_length:.6f}, -1.0, 1.0)"
+            expression = remap_expression(value, self.value_scale, target.low, target.high)
+            fcurve = add_shape_key_driver(key, key_block, self.obj, bone2_name, axis, expression)
+            self.ownership.add_driver(self, key, fcurve.data_path)
+
+    def lock_bones(self):
+        arm = self.obj
+        pb1 = arm.pose.bones[self.bones.ctrl[0]]
+        pb2 = arm.pose.bones[self.bones.ctrl[1]]
+        pb1.lock_rotations_4d = True
+        pb2.lock_rotations_4d = True
+        pb1.lock_rotation_w = True
+        pb2.lock_rotation_w = True
+        pb1.lock_rotation = [True, True, True]
+        pb2.lock_rotation = [True, True, True]
+        pb1.lock_scale = [True, True, True]
+        pb2.lock_scale = [True, True, True]
+        pb1.lock_location = [True, True, True]
+        arm.data.bones[self.bones.ctrl[0]].hide_select = True
+
+    @stage.generate_widgets
+    @profile_stage
+    def make_control_widgets(self):
+        ctrl = self.bones.ctrl
+        if not self.unchanged:
+            for bone_name in ctrl:
+                discard_old_widget(bone_name)
+        if self.shared_widgets:
+            set_shared_widget(self.obj, ctrl[0], 'box', scale=(2.2, 2.2, 0.001))
+            set_shared_widget(self.obj, ctrl[1], 'knob')
+            return
+        box = create_cube_widget(self.obj, ctrl[0])
+        slider = create_circle_widget(self.obj, ctrl[1])
+        transform_box = Matrix.Scale(0.001, 4, Vector((0, 0, 1))) @ Matrix.Scale(2.2, 4, Vector((0, 1, 0))) @ Matrix.Scale(2.2, 4, Vector((1, 0, 0)))
+        transform_slider =  Matrix.Rotation(math.radians(90), 4, 'X') @ Matrix.Scale(0.1, 4, Vector((1, 0, 0))) @ Matrix.Scale(0.1, 4, Vector((0, 0, 1)))
+        adjust_widget_transform_mesh(box, transform_box, local=True)
+        adjust_widget_transform_mesh(slider, transform_slider, local=True)
+        
\ No newline at end of file
@@ -0,0 +1,355 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import math
+from itertools import count
+from mathutils import Matrix, Vector
+from rigify.base_rig import stage, BaseRig
+from rigify.utils.rig import connected_children_names
+from rigify.utils.misc import map_list
+from rigify.utils.bones import copy_bone_properties
+from rigify.utils.naming import make_derived_name
+from rigify.utils.widgets_basic import create_circle_widget, create_cube_widget
+from rigify.utils.widgets import adjust_widget_transform_mesh
+from rigify.rig_ui_template import PanelLayout
+from rigify.base_generate import GeneratorPlugin
+
+from ._widgets import set_shared_widget, discard_old_widget, check_widgets
+from ._fingerprint import RigFingerprints
+from ...profiling import get_profiler, profile_stage, add_live_profiler
+from ...bake import OutputRegistry
+from ...ownership import OwnershipRegistry
+
+class Rig(BaseRig):
+    """A rig that generates a switch from a target bone."""
+
+    def find_org_bones(self, bone):
+        return [bone.name] + connected_children_names(self.obj, bone.name)
+
+        switch_mode: str
+        shared_widgets: bool
+        switch_playback_guard: bool
+
+    def initialize(self):
+        self.switch_mode = self.params.switch_mode
+        self.shared_widgets = self.params.shared_widgets
+        self.switch_playback_guard = self.params.switch_playback_guard
+        self.dispatcher = SwitchDispatcher(self.generator)
+        self.outputs = OutputRegistry(self.generator)
+        self.profiler = get_profiler(self.generator)
+        add_live_profiler(self.generator)
+        self.ownership = OwnershipRegistry(self.generator)
+        self.ownership.add_rig(self)
+        self.unchanged = RigFingerprints(self.generator).is_unchanged(self, self.switch_mode, self.shared_widgets)
+
+    @stage.generate_bones
+    @profile_stage
+    def make_control_bones(self):
+        org = self.bones.org
+        switch_on_name = make_derived_name(org[0], 'org', '_on')
+        on_bone = self.copy_bone(org[0], switch_on_name)
+        org.append(on_bone)
+        if self.switch_mode == 'SELECT':
+            switch_off_name = make_derived_name(org[0], 'org', '_off')
+            off_bone = self.copy_bone(org[0], switch_off_name)
+            org.append(off_bone)
+        self.bones.ctrl = map_list(self.make_control_bone, count(0), org)
+        # This creates the following in self.bones.ctrl: [container bone, on bone, off bone]
+        # In BONE mode there is no off bone and the on bone slides inside the container.
+
+
+    def make_control_bone(self, i, org):
+        return self.copy_bone(org, make_derived_name(org, 'ctrl'), parent=True)
+
+    @stage.parent_bones
+    @profile_stage
+    def parent_controls(self):
+        if self.switch_mode == 'BONE':
+            self.set_bone_parent(self.bones.org[1], self.bones.org[0])
+            self.set_bone_parent(self.bones.ctrl[1], self.bones.ctrl[0])
+            return
+        self.set_bone_parent(self.bones.org[1], self.bones.org[0])
+        self.set_bone_parent(self.bones.org[1], self.bones.org[0])
+        self.set_bone_parent(self.bones.ctrl[2], self.bones.ctrl[0])
+        self.set_bone_parent(self.bones.ctrl[2], self.bones.ctrl[0])
+
+
+    @stage.configure_bones
+    @profile_stage
+    def configure_controls(self):
+        arm = self.obj
+        pb1 = arm.pose.bones[self.bones.ctrl[0]]
+        bone1_length = pb1.bone.length
+        for args in zip(count(0), self.bones.ctrl, self.bones.org):
+            self.configure_control_bone(*args)
+        if self.switch_mode == 'BONE':
+            self.make_constraint(self.bones.ctrl[1], 'LIMIT_LOCATION', space_object= self.obj, \
+                space_subtarget= self.bones.ctrl[0], owner_space ='LOCAL', use_transform_limit=True, \
+                    max_y=bone1_length, use_max_x=True, use_max_y=True, \
+                        use_max_z=True, use_min_x=True, use_min_y=True, use_min_z=True)
+
+    def configure_control_bone(self, i, ctrl, org):
+        self.copy_bone_properties(org, ctrl)
+
+    ##############################
+    # UI
+
+    @classmethod
+    def parameters_ui(cls, layout, params):
+        layout.row().prop(params, "switch_mode", text="Mode")
+        layout.row().prop(params, "shared_widgets", text="Shared Widgets")
+        row = layout.row()
+        row.enabled = params.switch_mode == 'SELECT'
+        row.prop(params, "switch_playback_guard", text="Pause During Playback")
+
+    @classmethod
+    def check_metarig(cls, check, bone_name, params):
+        check.check_chain(bone_name, allow_children=False)
+        if params.switch_mode == 'BONE':
+            if params.switch_playback_guard:
+                check.warning(bone_name, "Pause During Playback only applies to Select mode")
+            # The on ORG bone, the container and on controls and one driver
+            check.add(bones=3, drivers=1, variables=1)
+            check_widgets(check, params.shared_widgets, 1, 1)
+            return
+        # The on and off ORG bones and controls and the container control
+        check.add(bones=5)
+        check_widgets(check, params.shared_widgets, 1, 2)
+        check.add_handlers('switch_dispatcher', 1)
+        if params.switch_playback_guard:
+            check.add_handlers('switch_playback_guard', 5)
+
+
+    @stage.rig_bones
+    @profile_stage
+    def setup_bones(self):
+        if self.switch_mode == 'BONE':
+            self.add_switch_driver()
+            self.lock_bones()
+            return
+        self.add_switch_value()
+
+    def add_switch_value(self):
+        bone1_name = self.bones.ctrl[0]
+        bone2_name = self.bones.ctrl[1]
+        custom_prop_name = "switch_value"
+
+        # Get objects and pose bones
+        arm = self.obj
+        container = arm.pose.bones[bone1_name]
+        on_bone = arm.pose.bones[bone2_name]
+
+        # Add the custom property to switch
+        if custom_prop_name not in container.keys():
+            bpy.types.PoseBone.__annotations__[custom_prop_name] = bpy.props.BoolProperty(
+                name="Active",
+                description="True if the slider is closer to the ON position",
+                default=False
+            )
+            container[custom_prop_name] = False
+        self.ownership.add_property(self, bone1_name, custom_prop_name)
+
+        on_bone.bone.hide = True
+        self.obj["last_selected"] = ""
+        self.ownership.add_property(self, None, "last_selected")
+
+    def add_switch_driver(self):
+        bone1_name = self.bones.ctrl[0]
+        bone2_name = self.bones.ctrl[1]
+        custom_prop_name = "flipped"
+
+        arm = self.obj
+        container = arm.pose.bones[bone1_name]
+        container_length = container.bone.length
+
+        # The state is whether the switch bone is past the middle of the container.
+        container[custom_prop_name] = False
+        prop_path = f'pose.bones["{bone1_name}"]["{custom_prop_name}"]'
+        fcurve = arm.driver_add(prop_path)
+        self.outputs.add_switch(prop_path, bone2_name, 1, container_length)
+        self.ownership.add_driver(self, arm, prop_path)
+        self.ownership.add_property(self, bone1_name, custom_prop_name)
+        driver = fcurve.driver
+        driver.type = 'SCRIPTED'
+
+        var = driver.variables.new()
+        var.name = "b_Y"
+        var.type = 'TRANSFORMS'
+        target = var.targets[0]
+        target.id = arm
+        target.bone_target = bone2_name
+        target.transform_type = 'LOC_Y'
+        target.transform_space = 'LOCAL_SPACE'
+
+        driver.expression = f"b_Y > {container_length / 2:.6f}"
+
+    def lock_bones(self):
+        arm = self.obj
+        pb1 = arm.pose.bones[self.bones.ctrl[0]]
+        pb2 = arm.pose.bones[self.bones.ctrl[1]]
+        pb1.lock_rotations_4d = True
+        pb2.lock_rotations_4d = True
+        pb1.lock_rotation_w = True
+        pb2.lock_rotation_w = True
+        pb1.lock_rotation = [True, True, True]
+        pb2.lock_rotation = [True, True, True]
+        pb1.lock_scale = [True, True, True]
+        pb2.lock_scale = [True, True, True]
+        pb1.lock_location = [True, True, True]
+        arm.data.bones[self.bones.ctrl[0]].hide_select = True
+
+
+    @stage.generate_widgets
+    @profile_stage
+    def make_control_widgets(self):
+        ctrl = self.bones.ctrl
+        if not self.unchanged:
+            for bone_name in ctrl:
+                discard_old_widget(bone_name)
+        bone1_length = self.obj.pose.bones[ctrl[0]].length
+        if self.shared_widgets:
+            set_shared_widget(self.obj, ctrl[0], 'box', scale=(0.2, 1.2, 0.001), translation=(0.0, bone1_length/2, 0.0))
+            for knob in ctrl[1:]:
+                set_shared_widget(self.obj, knob, 'knob')
+            return
+        box = create_cube_widget(self.obj, ctrl[0])
+        switch = create_circle_widget(self.obj, ctrl[1])
+        if self.switch_mode == 'SELECT':
+            switch = create_circle_widget(self.obj, ctrl[2])
+
+
+        transform_box = Matrix.Translation((0.0, bone1_length/2, 0.0)) @ Matrix.Scale(0.001, 4, Vector((0, 0, 1))) @ Matrix.Scale(1.2, 4, Vector((0, 1, 0))) @ Matrix.Scale(0.2, 4, Vector((1, 0, 0)))
+        transform_switch =  Matrix.Rotation(math.radians(90), 4, 'X') @ Matrix.Scale(0.1, 4, Vector((1, 0, 0))) @ Matrix.Scale(0.1, 4, Vector((0, 0, 1)))
+        adjust_widget_transform_mesh(box, transform_box, local=self.obj.pose.bones[ctrl[0]])
+        adjust_widget_transform_mesh(switch, transform_switch, local=True)
+
+    @stage.finalize
+    @profile_stage
+    def add_toggle_handler_logic(self):
+        if self.switch_mode == 'SELECT':
+            self.dispatcher.add_switch(*self.bones.ctrl[:3])
+            if self.switch_playback_guard:
+                self.dispatcher.use_playback_guard = True
+
+
+SCRIPT_UTILITIES_SWITCH_DISPATCHER = '''
+# Switch bone name -> (container bone, on bone, off bone)
+SWITCH_TABLE = {
+%s}
+
+def toggle_bones_on_select(scene, depsgraph=None):
+    # Bone selection tags the armature datablock, so skip every other update.
+    if depsgraph is not None and not depsgraph.id_type_updated('ARMATURE'):
+        return
+
+    obj = bpy.context.object
+
+    if not obj or obj.type != 'ARMATURE' or obj.mode != 'POSE' or obj.data.get("rig_id") != rig_id:
+        return
+
+    active = obj.data.bones.active
+    if active is None:
+        return
+
+    sel_bone = active.name
+    switch = SWITCH_TABLE.get(sel_bone)
+    if switch is None:
+        return
+
+    if obj.get("last_selected", "") == sel_bone:
+        return  # already handled
+
+    bone_c_name, bone_a_name, bone_b_name = switch
+    bones = obj.data.bones
+
+    bone_c = obj.pose.bones[bone_c_name]
+    bone_c["flipped"] = not bool(bone_c.get("flipped", False))
+
+    # Insert keyframe
+    bone_c.keyframe_insert(data_path='["flipped"]', frame=scene.frame_current)
+
+    # Toggle visibility
+    bones[bone_a_name].hide = sel_bone == bone_a_name
+    bones[bone_b_name].hide = sel_bone == bone_b_name
+
+    obj["last_selected"] = sel_bone
+
+def register_switch_dispatcher():
+    handlers = bpy.app.handlers.depsgraph_update_post
+    for handler in [h for h in handlers if getattr(h, "switch_rig_id", None) == rig_id]:
+        handlers.remove(handler)
+    toggle_bones_on_select.switch_rig_id = rig_id
+    handlers.append(toggle_bones_on_select)
+
+register_switch_dispatcher()
+'''
+
+SCRIPT_UTILITIES_SWITCH_PLAYBACK_GUARD = '''
+# Nothing can be selected during playback or rendering, so the dispatcher
+# leaves depsgraph_update_post until they are over.
+def pause_switch_dispatcher(*args):
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if toggle_bones_on_select in handlers:
+        handlers.remove(toggle_bones_on_select)
+
+def resume_switch_dispatcher(*args):
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if toggle_bones_on_select not in handlers:
+        handlers.append(toggle_bones_on_select)
+
+def register_switch_playback_guard():
+    pause_switch_dispatcher.switch_rig_id = rig_id
+    resume_switch_dispatcher.switch_rig_id = rig_id
+    guards = [
+        (bpy.app.handlers.animation_playback_pre, pause_switch_dispatcher),
+        (bpy.app.handlers.animation_playback_post, resume_switch_dispatcher),
+        (bpy.app.handlers.render_init, pause_switch_dispatcher),
+        (bpy.app.handlers.render_complete, resume_switch_dispatcher),
+        (bpy.app.handlers.render_cancel, resume_switch_dispatcher),
+    ]
+    for handlers, guard in guards:
+        for handler in [h for h in handlers if getattr(h, "switch_rig_id", None) == rig_id]:
+            handlers.remove(handler)
+        handlers.append(guard)
+
+register_switch_playback_guard()
+'''
+
+
+class SwitchDispatcher(GeneratorPlugin):
+    """Collects every switch of the rig into one selection dispatcher."""
+
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.switch_table = {}
+        self.use_playback_guard = False
+
+    def add_switch(self, container, on_bone, off_bone):
+        entry = (container, on_bone, off_bone)
+        self.switch_table[on_bone] = entry
+        self.switch_table[off_bone] = entry
+
+    def finalize(self):
+        if not self.switch_table:
+            return
+        table = "".join(f"    {name!r}: {entry!r},\n" for name, entry in sorted(self.switch_table.items()))
+        utilities = [SCRIPT_UTILITIES_SWITCH_DISPATCHER % table]
+        if self.use_playback_guard:
+            utilities.append(SCRIPT_UTILITIES_SWITCH_PLAYBACK_GUARD)
+        self.generator.script.add_utilities(utilities)
@@ -0,0 +1,315 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import hashlib
+import numpy as np
+from collections import namedtuple, defaultdict
+
+from ...ownership import OWNER_KEY, SHARED_OWNER
+
+# ID property storing the cache key on text widget meshes
+TEXT_WIDGET_KEY = "sixbird_text_key"
+
+# Blender's default curve resolution for text
+TEXT_RESOLUTION = 12
+
+TextSettings = namedtuple('TextSettings', ['body', 'size', 'extrude', 'align_x', 'align_y', 'glyph_cache',
+                                           'resolution', 'outline', 'max_vertices'],
+                          defaults=(False, TEXT_RESOLUTION, False, 0))
+
+
+def font_path(font=None):
+    return font.filepath if font else '<builtin>'
+
+
+def text_widget_key(settings, font=None):
+    """Returns a hash of everything that affects the tessellated text mesh."""
+    settings = settings._replace(size=round(settings.size, 6), extrude=round(settings.extrude, 6))
+    data = repr((tuple(settings), font_path(font)))
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def text_widget_mesh_name(key):
+    return "WGT-text-" + key[:12]
+
+
+def get_cached_text_mesh(key):
+    """Returns the text widget mesh built for this key, if it still exists."""
+    mesh = bpy.data.meshes.get(text_widget_mesh_name(key))
+    if mesh and not mesh.library and mesh.get(TEXT_WIDGET_KEY) == key:
+        return mesh
+    return None
+
+
+def estimate_text_vertices(settings, last_count=0):
+    """
+    Rough vertex count of the text widget, for checks before generation. Uses
+    the count of the last generation when there is one, as an outline can go
+    over its vertex budget.
+    """
+    if last_count:
+        return last_count
+    if settings.outline and settings.max_vertices:
+        return settings.max_vertices
+    # About two outlines of four curve segments per letter
+    vertices = sum(1 for char in settings.body if not char.isspace()) * 8 * settings.resolution
+    return vertices * 2 if settings.extrude and not settings.outline else vertices
+
+
+##############################
+# Mesh arrays
+
+def read_mesh_arrays(mesh):
+    """Reads the vertices, edges and faces of a mesh into flat numpy arrays."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.vertices.foreach_get("co", co)
+    mesh.edges.foreach_get("vertices", edges)
+    mesh.loops.foreach_get("vertex_index", loops)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    return {'co': co, 'edges': edges, 'loops': loops, 'loop_starts': loop_starts}
+
+
+def new_mesh_from_arrays(name, arrays):
+    """Creates a mesh from arrays in the layout returned by read_mesh_arrays()."""
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(arrays['co']) // 3)
+    mesh.vertices.foreach_set("co", arrays['co'])
+    mesh.edges.add(len(arrays['edges']) // 2)
+    mesh.edges.foreach_set("vertices", arrays['edges'])
+    mesh.loops.add(len(arrays['loops']))
+    mesh.loops.foreach_set("vertex_index", arrays['loops'])
+    mesh.polygons.add(len(arrays['loop_starts']))
+    mesh.polygons.foreach_set("loop_start", arrays['loop_starts'])
+    # Fills in the face edges while keeping the loose outline edges
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+##############################
+# Tessellation
+
+def new_text_mesh(key, settings, arrays):
+    """Creates the cached mesh for the text settings from tessellated arrays."""
+    if settings.outline:
+        arrays = outline_arrays(arrays, settings.max_vertices)
+    mesh = new_mesh_from_arrays(text_widget_mesh_name(key), arrays)
+    mesh[TEXT_WIDGET_KEY] = key
+    mesh[OWNER_KEY] = SHARED_OWNER
+    return mesh
+
+
+def build_text_meshes(context, settings_by_key):
+    """Tessellates text settings into new cached meshes, returned by key."""
+    arrays_by_key = tessellate_texts(context, settings_by_key)
+    return {key: new_text_mesh(key, settings_by_key[key], arrays) for key, arrays in arrays_by_key.items()}
+
+
+def tessellate_texts(context, settings_by_key, font=None):
+    """
+    Tessellates text settings into mesh arrays, evaluating all of them with
+    a single depsgraph update. Returns a dictionary of arrays by key.
+    """
+    if not settings_by_key:
+        return {}
+
+    collection = bpy.data.collections.new("sixbird_text_build")
+    context.scene.collection.children.link(collection)
+    text_objects = {}
+
+    try:
+        for key, settings in settings_by_key.items():
+            text_curve = bpy.data.curves.new("sixbird_text_build", 'FONT')
+            text_curve.body = settings.body
+            text_curve.size = settings.size
+            text_curve.extrude = settings.extrude
+            text_curve.align_x = settings.align_x
+            text_curve.align_y = settings.align_y
+            text_curve.resolution_u = settings.resolution
+            if font:
+                text_curve.font = font
+            text_obj = bpy.data.objects.new(text_curve.name, text_curve)
+            collection.objects.link(text_obj)
+            text_objects[key] = text_obj
+
+        depsgraph = context.evaluated_depsgraph_get()
+        results = {}
+
+        for key, text_obj in text_objects.items():
+            eval_obj = text_obj.evaluated_get(depsgraph)
+            results[key] = read_mesh_arrays(eval_obj.to_mesh())
+            eval_obj.to_mesh_clear()
+
+    finally:
+        for text_obj in text_objects.values():
+            text_curve = text_obj.data
+            bpy.data.objects.remove(text_obj)
+            bpy.data.curves.remove(text_curve)
+        bpy.data.collections.remove(collection)
+
+    return results
+
+
+##############################
+# Outlines
+
+def outline_arrays(arrays, max_vertices=0):
+    """
+    Reduces mesh arrays to the closed outline loops of their faces. With a vertex
+    budget, the loops are simplified until the whole outline fits in it.
+    """
+    co = arrays['co'].reshape(-1, 3)
+    loops = chain_loops(boundary_edges(arrays))
+    if max_vertices:
+        loops = simplify_loops(co, loops, max_vertices)
+
+    if not loops:
+        return {'co': np.empty(0, dtype=np.float32), 'edges': np.empty(0, dtype=np.int32),
+                'loops': np.empty(0, dtype=np.int32), 'loop_starts': np.empty(0, dtype=np.int32)}
+
+    edges = []
+    start = 0
+    for loop in loops:
+        indices = np.arange(start, start + len(loop))
+        edges.append(np.stack([indices, np.roll(indices, -1)], axis=1))
+        start += len(loop)
+
+    return {
+        'co': co[np.concatenate(loops)].astype(np.float32).ravel(),
+        'edges': np.concatenate(edges).astype(np.int32).ravel(),
+        'loops': np.empty(0, dtype=np.int32),
+        'loop_starts': np.empty(0, dtype=np.int32),
+    }
+
+
+def boundary_edges(arrays):
+    """Returns the (N, 2) array of edges used by exactly one face."""
+    loops = arrays['loops']
+    loop_starts = arrays['loop_starts']
+    if not len(loop_starts):
+        return arrays['edges'].reshape(-1, 2)
+
+    loop_ends = np.append(loop_starts[1:], len(loops))
+    next_loop = np.arange(1, len(loops) + 1)
+    next_loop[loop_ends - 1] = loop_starts
+    pairs = np.sort(np.stack([loops, loops[next_loop]], axis=1), axis=1)
+    edges, counts = np.unique(pairs, axis=0, return_counts=True)
+    return edges[counts == 1]
+
+
+def chain_loops(edges):
+    """Walks edges into lists of vertex indices, one per outline loop."""
+    neighbors = defaultdict(list)
+    for a, b in edges.tolist():
+        neighbors[a].append(b)
+        neighbors[b].append(a)
+
+    visited = set()
+    loops = []
+    for start in neighbors:
+        if start in visited:
+            continue
+        loop = [start]
+        visited.add(start)
+        current = start
+        while True:
+            current = next((v for v in neighbors[current] if v not in visited), None)
+            if current is None:
+                break
+            loop.append(current)
+            visited.add(current)
+        if len(loop) >= 3:
+            loops.append(loop)
+    return loops
+
+
+def simplify_loops(co, loops, max_vertices):
+    """
+    Drops the least significant outline vertices until at most max_vertices are
+    left. Significance is the Douglas-Peucker split distance, capped by the parent
+    split so that keeping the N most significant vertices is a valid simplification.
+    Every loop keeps at least three vertices, so with many loops the result can
+    be over max_vertices.
+    """
+    if sum(len(loop) for loop in loops) <= max_vertices:
+        return loops
+
+    significance = [loop_significance(co[loop]) for loop in loops]
+    ranked = np.concatenate(significance)
+    keep_count = max(max_vertices, sum(np.isinf(sig).sum() for sig in significance))
+    threshold = np.sort(ranked)[::-1][keep_count - 1]
+
+    result = []
+    budget = keep_count
+    for loop, sig in zip(loops, significance):
+        keep = sig > threshold
+        budget -= keep.sum()
+        result.append((loop, sig, keep))
+
+    # Fill the remaining budget with vertices exactly at the threshold
+    simplified = []
+    for loop, sig, keep in result:
+        ties = np.flatnonzero(sig == threshold)[:max(budget, 0)]
+        keep[ties] = True
+        budget -= len(ties)
+        simplified.append([vertex for vertex, kept in zip(loop, keep) if kept])
+    return simplified
+
+
+def loop_significance(points):
+    """Douglas-Peucker significance of each point of a closed loop."""
+    count = len(points)
+    closed = np.concatenate([points, points[:1]])
+    significance = np.zeros(count + 1)
+
+    far = int(np.argmax(np.linalg.norm(points - points[0], axis=1)))
+    significance[0] = significance[far] = significance[count] = np.inf
+
+    stack = [(0, far, np.inf), (far, count, np.inf)]
+    while stack:
+        first, last, cap = stack.pop()
+        if last - first < 2:
+            continue
+        inner = closed[first + 1:last]
+        distance = segment_distance(inner, closed[first], closed[last])
+        split = first + 1 + int(np.argmax(distance))
+        value = min(distance.max(), cap)
+        significance[split] = value
+        stack.append((first, split, value))
+        stack.append((split, last, value))
+
+    significance = significance[:count]
+
+    # Keep the loop a polygon: the best vertex besides the two anchors is pinned
+    finite = np.flatnonzero(np.isfinite(significance))
+    if len(finite):
+        significance[finite[np.argmax(significance[finite])]] = np.inf
+    return significance
+
+
+def segment_distance(points, start, end):
+    """Distance of each point from the segment between start and end."""
+    direction = end - start
+    length_sq = direction.dot(direction)
+    if length_sq == 0:
+        return np.linalg.norm(points - start, axis=1)
+    t = np.clip((points - start).dot(direction) / length_sq, 0.0, 1.0)
+    return np.linalg.norm(points - (start + t[:, None] * direction), axis=1)
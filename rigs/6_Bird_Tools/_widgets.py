@@ -0,0 +1,119 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import math
+from rigify.base_generate import BaseGenerator
+
+from ...ownership import OWNER_KEY, SHARED_OWNER
+
+# ID property marking the canonical meshes shared by all controls
+SHARED_WIDGET_KEY = "sixbird_shared_widget"
+
+
+def box_geometry():
+    """Unit cube centered on the bone head, like create_cube_widget()."""
+    verts = [(x * 0.5, y * 0.5, z * 0.5) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+    edges = [(0, 1), (2, 3), (4, 5), (6, 7), (0, 2), (1, 3), (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7)]
+    return verts, edges
+
+
+def knob_geometry(steps=32):
+    """Circle of radius 0.1 in the bone's XY plane."""
+    verts = [(0.1 * math.cos(i * 2 * math.pi / steps), 0.1 * math.sin(i * 2 * math.pi / steps), 0.0)
+             for i in range(steps)]
+    edges = [(i, (i + 1) % steps) for i in range(steps)]
+    return verts, edges
+
+
+SHARED_WIDGET_SHAPES = {
+    'box': box_geometry,
+    'knob': knob_geometry,
+}
+
+
+def check_widgets(check, shared_widgets, boxes, knobs):
+    """Adds the widget meshes of box and knob controls to a metarig check."""
+    # Rigify's cube and circle widgets have as many vertices as the shared ones
+    box_vertices = len(box_geometry()[0])
+    knob_vertices = len(knob_geometry()[0])
+    if shared_widgets:
+        check.add_widget(box_vertices, 'box')
+        check.add_widget(knob_vertices, 'knob')
+    else:
+        check.add_widget(boxes * box_vertices + knobs * knob_vertices)
+
+
+def get_shared_widget_mesh(kind):
+    """Returns the canonical mesh for the widget kind, creating it if needed."""
+    name = "WGT-6bird-" + kind
+    mesh = bpy.data.meshes.get(name)
+    if mesh and not mesh.library and mesh.get(SHARED_WIDGET_KEY) == kind:
+        return mesh
+
+    verts, edges = SHARED_WIDGET_SHAPES[kind]()
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, edges, [])
+    mesh.update()
+    mesh[SHARED_WIDGET_KEY] = kind
+    mesh[OWNER_KEY] = SHARED_OWNER
+    return mesh
+
+
+def discard_old_widget(bone_name):
+    """
+    Deletes the widget the bone had in the previous generation, so the next
+    create_widget() builds it again instead of reusing it as-is.
+    """
+    generator = BaseGenerator.instance
+    obj = generator.old_widget_table.pop(bone_name, None)
+    if obj is None or obj.library:
+        return
+    # Widgets used by other bones are only dropped from this bone
+    if obj.data.get(SHARED_WIDGET_KEY) or obj in generator.old_widget_table.values():
+        return
+    mesh = obj.data
+    bpy.data.objects.remove(obj)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+
+
+def set_shared_widget(rig, bone_name, kind, scale=(1.0, 1.0, 1.0), translation=(0.0, 0.0, 0.0)):
+    """
+    Uses the rig's single widget object of the given kind as the custom shape of
+    the bone. Everything that differs per bone goes into the custom shape transform.
+    """
+    generator = BaseGenerator.instance
+    collection = generator.widget_collection
+    mesh = get_shared_widget_mesh(kind)
+
+    obj_name = f"WGT-{rig.name}_shared_{kind}"
+    obj = bpy.data.objects.get(obj_name)
+    if not obj or obj.library:
+        obj = bpy.data.objects.new(obj_name, mesh)
+    obj.data = mesh
+    if obj.name not in collection.objects:
+        collection.objects.link(obj)
+
+    generator.new_widget_table[bone_name] = obj
+
+    pose_bone = rig.pose.bones[bone_name]
+    pose_bone.custom_shape_scale_xyz = scale
+    pose_bone.custom_shape_translation = translation
+    pose_bone.custom_shape_rotation_euler = (0.0, 0.0, 0.0)
+    return obj
@@ -0,0 +1,362 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+import bpy
+import os
+
+from .keys import PROFILE_PROP, PROFILE_SUMMARY_KEY, LIVE_PROFILE_PROP, CHECK_KEY, OUTPUTS_KEY, RIG_UID_KEY, GC_REPORT_KEY
+
+# The operators import their modules when they run, so that enabling the add-on
+# doesn't import NumPy and the generator modules.
+
+
+class DATA_PT_sixbird_profile(bpy.types.Panel):
+    bl_label = "6 Bird Generation Profile"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "data"
+    bl_parent_id = "DATA_PT_rigify"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        # Only metarigs, generated rigs have a rig_id
+        return obj and obj.type == 'ARMATURE' and "rig_id" not in obj.data
+
+    def draw(self, context):
+        layout = self.layout
+        arm = context.object.data
+        layout.prop(arm, PROFILE_PROP, text="Profile Generation")
+        layout.prop(arm, LIVE_PROFILE_PROP, text="Live Profiler in Rig UI")
+
+        summary = arm.get(PROFILE_SUMMARY_KEY)
+        if not summary:
+            layout.label(text="Generate the rig to get a report.")
+            return
+
+        col = layout.column(align=True)
+        col.label(text=f"Total: {summary['time'] * 1000:.1f} ms")
+        for rig_type, stats in sorted(summary['rig_types'].items()):
+            col.label(text=f"{rig_type}: {stats['instances']} rigs, {stats['time'] * 1000:.1f} ms, "
+                           f"{stats['datablocks']} datablocks, "
+                           f"{stats['drivers']} drivers / {stats['variables']} variables")
+        layout.label(text=bpy.path.basename(summary['path']), icon='FILE')
+
+
+class OBJECT_OT_sixbird_check_metarig(bpy.types.Operator):
+    """Check the 6 Bird rigs of the metarig and estimate the size of the generated rig, without generating it"""
+    bl_idname = "object.sixbird_check_metarig"
+    bl_label = "Check 6 Bird Rigs"
+    bl_options = {'REGISTER'}
+
+    max_bones: bpy.props.IntProperty(name="Max Bones", default=5000, min=0,
+                                     description="Warn above this many bones, 0 for no limit")
+    max_drivers: bpy.props.IntProperty(name="Max Drivers", default=2000, min=0,
+                                       description="Warn above this many drivers, 0 for no limit")
+    max_widget_vertices: bpy.props.IntProperty(name="Max Widget Vertices", default=200000, min=0,
+                                               description="Warn above this many widget vertices, 0 for no limit")
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'ARMATURE' and "rig_id" not in obj.data
+
+    def execute(self, context):
+        from .validation import check_metarig, store_check
+
+        obj = context.object
+        check = check_metarig(obj)
+        limits = {'bones': self.max_bones, 'drivers': self.max_drivers,
+                  'widget_vertices': self.max_widget_vertices}
+        totals = store_check(obj, check, limits)
+        errors = sum(1 for severity, _, _ in check.issues if severity == 'ERROR')
+        warnings = len(check.issues) - errors
+        self.report({'ERROR'} if errors else {'WARNING'} if warnings else {'INFO'},
+                    f"{check.rigs} rigs: {errors} errors, {warnings} warnings, about {totals['bones']} bones "
+                    f"and {totals['drivers']} drivers")
+        return {'FINISHED'}
+
+
+class DATA_PT_sixbird_check(bpy.types.Panel):
+    bl_label = "6 Bird Check"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "data"
+    bl_parent_id = "DATA_PT_rigify"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'ARMATURE' and "rig_id" not in obj.data
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator(OBJECT_OT_sixbird_check_metarig.bl_idname, icon='CHECKMARK')
+
+        result = context.object.data.get(CHECK_KEY)
+        if not result:
+            return
+        counts = result['counts']
+        col = layout.column(align=True)
+        col.label(text=f"{result['rigs']} rigs, about {counts['bones']} bones, {counts['handlers']} handlers")
+        col.label(text=f"{counts['drivers']} drivers / {counts['variables']} variables, "
+                       f"{counts['widget_vertices']} widget vertices")
+        col = layout.column(align=True)
+        for severity, bone_name, message in result['issues']:
+            text = f"{bone_name}: {message}" if bone_name else message
+            col.label(text=text, icon='ERROR' if severity == 'ERROR' else 'INFO')
+
+
+class OBJECT_OT_sixbird_import_controls(bpy.types.Operator):
+    """Create or update the metarig bones, rig types and parameters of every control in a JSON or CSV spec"""
+    bl_idname = "object.sixbird_import_controls"
+    bl_label = "Import 6 Bird Controls"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json;*.csv", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'ARMATURE' and "rig_id" not in obj.data
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        from .authoring import read_spec, import_controls
+
+        try:
+            controls = read_spec(self.filepath)
+            count = import_controls(context.object, controls)
+        except (OSError, ValueError, KeyError) as error:
+            self.report({'ERROR'}, f"Could not import {bpy.path.basename(self.filepath)}: {error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Imported {count} controls")
+        return {'FINISHED'}
+
+
+class OBJECT_OT_sixbird_export_controls(bpy.types.Operator):
+    """Write every bone of the metarig with its rig type and 6 Bird parameters to a JSON or CSV spec"""
+    bl_idname = "object.sixbird_export_controls"
+    bl_label = "Export 6 Bird Controls"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json;*.csv", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'ARMATURE' and "rig_id" not in obj.data
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.ensure_ext(bpy.path.clean_name(context.object.name) + "_controls", ".json")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        from .authoring import write_spec, export_controls
+
+        controls = export_controls(context.object)
+        try:
+            write_spec(self.filepath, controls)
+        except OSError as error:
+            self.report({'ERROR'}, f"Could not write {self.filepath}: {error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported {len(controls)} controls")
+        return {'FINISHED'}
+
+
+class DATA_PT_sixbird_controls(bpy.types.Panel):
+    bl_label = "6 Bird Controls"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "data"
+    bl_parent_id = "DATA_PT_rigify"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'ARMATURE' and "rig_id" not in obj.data
+
+    def draw(self, context):
+        row = self.layout.row(align=True)
+        row.operator(OBJECT_OT_sixbird_import_controls.bl_idname, text="Import", icon='IMPORT')
+        row.operator(OBJECT_OT_sixbird_export_controls.bl_idname, text="Export", icon='EXPORT')
+
+
+class POSE_OT_sixbird_bake_outputs(bpy.types.Operator):
+    """Bake the slider, slider pad and switch outputs of the rig to keyframes"""
+    bl_idname = "pose.sixbird_bake_outputs"
+    bl_label = "Bake 6 Bird Outputs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frame_start: bpy.props.IntProperty(name="Start Frame", default=1)
+    frame_end: bpy.props.IntProperty(name="End Frame", default=250)
+    strip_drivers: bpy.props.BoolProperty(
+        name="Remove Drivers",
+        default=False,
+        description="Remove the output drivers after baking, so playback only reads the keyframes"
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'ARMATURE' and OUTPUTS_KEY in obj.data
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        from .bake import bake_outputs
+
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "The end frame is before the start frame")
+            return {'CANCELLED'}
+        count = bake_outputs(context.object, self.frame_start, self.frame_end, self.strip_drivers)
+        self.report({'INFO'}, f"Baked {count} outputs over {self.frame_end - self.frame_start + 1} frames")
+        return {'FINISHED'}
+
+
+class DATA_PT_sixbird_outputs(bpy.types.Panel):
+    bl_label = "6 Bird Outputs"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "data"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'ARMATURE' and OUTPUTS_KEY in obj.data
+
+    def draw(self, context):
+        layout = self.layout
+        outputs = context.object.data[OUTPUTS_KEY]
+        layout.label(text=f"Driven Outputs: {len(outputs)}")
+        layout.operator(POSE_OT_sixbird_bake_outputs.bl_idname, text="Bake to Keyframes", icon='REC')
+
+
+def saved_copy_size(name):
+    """Saves a copy of the file to the temp directory and returns its size in bytes."""
+    path = os.path.join(bpy.app.tempdir, name)
+    bpy.ops.wm.save_as_mainfile(filepath=path, copy=True, check_existing=False)
+    try:
+        return os.path.getsize(path)
+    finally:
+        os.remove(path)
+
+
+def format_report(report):
+    return (f"{report['datablocks']} datablocks, {report['drivers']} drivers, "
+            f"{report['properties']} properties, ~{report['bytes'] / 1024:.1f} KiB")
+
+
+class WM_OT_sixbird_purge_unowned(bpy.types.Operator):
+    """Remove the datablocks, drivers and properties of 6 Bird rigs that no longer exist or no longer use them"""
+    bl_idname = "wm.sixbird_purge_unowned"
+    bl_label = "Purge Unowned 6 Bird Data"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    measure_file_size: bpy.props.BoolProperty(
+        name="Measure File Size",
+        default=False,
+        description="Save a copy of the file before and after the purge to report how much smaller it gets"
+    )
+
+    def execute(self, context):
+        from .ownership import collect_garbage
+
+        measure = self.measure_file_size
+        if measure:
+            size_before = saved_copy_size("sixbird_purge_before.blend")
+        report = collect_garbage()
+        message = "Purged " + format_report(report)
+        if measure:
+            delta = size_before - saved_copy_size("sixbird_purge_after.blend")
+            message += f", file {delta / 1024:.1f} KiB smaller"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
+class DATA_PT_sixbird_ownership(bpy.types.Panel):
+    bl_label = "6 Bird Data"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "data"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'ARMATURE' and RIG_UID_KEY in obj.data
+
+    def draw(self, context):
+        layout = self.layout
+        report = context.object.data.get(GC_REPORT_KEY)
+        if report:
+            layout.label(text="Last generation purged:")
+            layout.label(text=format_report(report))
+        layout.operator(WM_OT_sixbird_purge_unowned.bl_idname, icon='TRASH')
+
+
+classes = (
+    DATA_PT_sixbird_profile,
+    OBJECT_OT_sixbird_check_metarig,
+    DATA_PT_sixbird_check,
+    OBJECT_OT_sixbird_import_controls,
+    OBJECT_OT_sixbird_export_controls,
+    DATA_PT_sixbird_controls,
+    POSE_OT_sixbird_bake_outputs,
+    DATA_PT_sixbird_outputs,
+    WM_OT_sixbird_purge_unowned,
+    DATA_PT_sixbird_ownership,
+)
+
+
+def register():
+    setattr(bpy.types.Armature, PROFILE_PROP, bpy.props.BoolProperty(
+        name="Profile Generation",
+        default=False,
+        description="Record the time, datablocks and drivers of every 6 Bird rig during generation "
+                    "and write them as JSON next to the .blend."
+    ))
+    setattr(bpy.types.Armature, LIVE_PROFILE_PROP, bpy.props.BoolProperty(
+        name="Live Profiler in Rig UI",
+        default=False,
+        description="Add a profiler to the rig UI that times the Python drivers and the switch handler "
+                    "of every 6 Bird control during playback and interaction."
+    ))
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    delattr(bpy.types.Armature, LIVE_PROFILE_PROP)
+    delattr(bpy.types.Armature, PROFILE_PROP)
@@ -0,0 +1,132 @@
+# ====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ======================= END GPL LICENSE BLOCK ========================
+
+from rigify import rig_lists
+from rigify.utils.rig import connected_children_names
+
+from .keys import CHECK_KEY
+
+
+# Rig type prefix of this feature set in Rigify's rig list
+RIG_TYPE_PREFIX = "6_Bird_Tools."
+
+COUNTS = ('bones', 'drivers', 'variables', 'widget_vertices', 'handlers')
+
+
+class MetarigCheck:
+    """
+    Collects the problems and the estimated cost of the 6 Bird rigs of a metarig.
+    Rig types add to it from their check_metarig() class method, which may only
+    read the metarig.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.issues = []
+        self.counts = dict.fromkeys(COUNTS, 0)
+        # Meshes, drivers and handlers shared between rigs are only counted once
+        self.shared = {}
+        self.rigs = 0
+
+    def error(self, bone_name, message):
+        self.issues.append(('ERROR', bone_name, message))
+
+    def warning(self, bone_name, message):
+        self.issues.append(('WARNING', bone_name, message))
+
+    def add(self, bones=0, drivers=0, variables=0):
+        self.counts['bones'] += bones
+        self.counts['drivers'] += drivers
+        self.counts['variables'] += variables
+
+    def add_widget(self, vertices, shared_key=None):
+        """Counts a widget mesh, once per shared_key if it is shared."""
+        if shared_key is None:
+            self.counts['widget_vertices'] += vertices
+        else:
+            self.shared[('widget', shared_key)] = {'widget_vertices': vertices}
+
+    def add_shape_key_driver(self, object_name, key_name):
+        """Counts the driver of a shape key, which every rig targeting it replaces."""
+        self.shared[('shape_key', object_name, key_name)] = {'drivers': 1, 'variables': 1}
+
+    def add_handlers(self, shared_key, count):
+        self.shared[('handlers', shared_key)] = {'handlers': count}
+
+    def chain(self, bone_name):
+        """The bone and its connected children, which the rig takes as its org bones."""
+        return [bone_name] + connected_children_names(self.obj, bone_name)
+
+    def check_chain(self, bone_name, allow_children=True):
+        """Reports connected children that have a rig of their own, or that the rig can't use."""
+        chain = self.chain(bone_name)
+        for child in chain[1:]:
+            if self.obj.pose.bones[child].rigify_type:
+                self.error(bone_name, f"Connected child '{child}' has its own rig type, "
+                                      f"but is taken as an org bone of this rig")
+        if not allow_children and len(chain) > 1:
+            self.error(bone_name, f"Has connected children ({', '.join(chain[1:])}), "
+                                  f"which would take the place of the rig's own controls")
+        return chain
+
+    def totals(self):
+        counts = dict(self.counts)
+        for shared_counts in self.shared.values():
+            for name, value in shared_counts.items():
+                counts[name] += value
+        return counts
+
+
+def get_rig_class(rig_type):
+    info = rig_lists.rigs.get(rig_type)
+    return info['module'].Rig if info else None
+
+
+def check_metarig(obj):
+    """Checks every 6 Bird rig of the metarig without generating anything."""
+    check = MetarigCheck(obj)
+    # The ORG copy of every metarig bone
+    check.add(bones=len(obj.data.bones))
+
+    for pose_bone in obj.pose.bones:
+        rig_type = pose_bone.rigify_type
+        if not rig_type.startswith(RIG_TYPE_PREFIX):
+            continue
+        rig_class = get_rig_class(rig_type)
+        if rig_class is None:
+            check.error(pose_bone.name, f"Rig type '{rig_type}' is not available")
+            continue
+        check_function = getattr(rig_class, 'check_metarig', None)
+        if check_function:
+            check.rigs += 1
+            check_function(check, pose_bone.name, pose_bone.rigify_parameters)
+    return check
+
+
+def store_check(obj, check, limits):
+    """Stores the result on the metarig and adds warnings for counts over their limits."""
+    totals = check.totals()
+    for name, limit in limits.items():
+        if limit and totals[name] > limit:
+            check.warning("", f"About {totals[name]} {name.replace('_', ' ')}, more than the limit of {limit}")
+    obj.data[CHECK_KEY] = {
+        'rigs': check.rigs,
+        'counts': totals,
+        'issues': [list(issue) for issue in check.issues],
+    }
+    return totals